@@ -0,0 +1,66 @@
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from src.utils.html_generator.create_briefing_html import create_briefing_html
+from src.utils.pdf_generator.create_briefing_pdf import create_briefing_pdf
+from src.utils.pdf_generator.create_briefing_pdf_weasyprint import render_html_to_pdf, weasyprint_available
+
+
+def _measure(function, repetitions: int) -> list:
+    """Executa a função `repetitions` vezes e retorna os tempos (em segundos)."""
+    timings = []
+    for _ in range(repetitions):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def _report(label: str, timings: list, output_path: str):
+    """Imprime mediana, mínimo e tamanho do arquivo gerado."""
+    size_kb = os.path.getsize(output_path) / 1024 if os.path.exists(output_path) else 0
+    print(f"{label:<38} mediana {statistics.median(timings):7.3f}s | mín {min(timings):7.3f}s | {size_kb:8.1f} KB")
+
+
+def main():
+    """
+    Compara o tempo de geração do PDF do briefing nos backends reportlab e weasyprint.
+
+    Uso: python benchmark_pdf_backends.py <caminho_para_json_de_conteudo> [repetições]
+    """
+    if len(sys.argv) < 2:
+        print("Uso: python benchmark_pdf_backends.py <caminho_para_json_de_conteudo> [repetições]")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        content_json = json.load(f)
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    client_name = content_json.get('client_name', 'Cliente Benchmark')
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        html_path = os.path.join(output_dir, "briefing.html")
+        reportlab_pdf = os.path.join(output_dir, "briefing_reportlab.pdf")
+        weasyprint_pdf = os.path.join(output_dir, "briefing_weasyprint.pdf")
+
+        print(f"--- Benchmark de PDF ({repetitions} repetições) ---")
+        _report("reportlab (flowables)", _measure(
+            lambda: create_briefing_pdf(content_json, client_name, reportlab_pdf, backend="reportlab"), repetitions), reportlab_pdf)
+        _report("HTML (templates Jinja2)", _measure(
+            lambda: create_briefing_html(content_json, client_name, html_path), repetitions), html_path)
+
+        if not weasyprint_available():
+            print("weasyprint indisponível: apenas o backend reportlab foi medido.")
+            return
+
+        _report("weasyprint (HTML já gerado)", _measure(
+            lambda: render_html_to_pdf(html_path, weasyprint_pdf), repetitions), weasyprint_pdf)
+        _report("weasyprint (HTML + PDF)", _measure(
+            lambda: create_briefing_pdf(content_json, client_name, weasyprint_pdf, backend="weasyprint"), repetitions), weasyprint_pdf)
+
+
+if __name__ == "__main__":
+    main()
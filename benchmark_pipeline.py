@@ -0,0 +1,45 @@
+import argparse
+import sys
+
+from src.utils.benchmarks import run_pipeline_benchmark, save_benchmark_run
+from src.utils.benchmarks.run_pipeline_benchmark import DEFAULT_BENCHMARK_BRIEFINGS, PIPELINE_BENCHMARK_RESULTS_FILE
+
+
+def main():
+    """
+    Benchmark do pipeline de ponta a ponta com o provedor local (sem rede e sem custo).
+
+    Mede a geração (montagem do prompt, chamada simulada, parse e validação do JSON) e a
+    renderização de PDF/HTML, com latência, variação, taxa de erro e tamanho de saída
+    configuráveis, e salva o resultado em output_files/benchmarks/pipeline_benchmarks.jsonl.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline com o provedor local de IA.")
+    parser.add_argument("--briefings", default=DEFAULT_BENCHMARK_BRIEFINGS, help="Arquivo ou diretório de briefings (padrão: briefing_docs/Exemplos).")
+    parser.add_argument("--runs", type=int, default=20, help="Execuções do pipeline (padrão: 20).")
+    parser.add_argument("--concurrency", type=int, default=1, help="Execuções simultâneas (padrão: 1).")
+    parser.add_argument("--mode", choices=("synthetic", "replay"), default=None, help="Campanhas sintéticas ou respostas gravadas em output_files/respostas_IA.")
+    parser.add_argument("--latency", type=float, default=None, help="Latência média simulada, em segundos.")
+    parser.add_argument("--jitter", type=float, default=None, help="Variação máxima (+/-) da latência, em segundos.")
+    parser.add_argument("--error-rate", type=float, default=None, help="Fração das chamadas que falham (0 a 1).")
+    parser.add_argument("--posts", type=int, default=None, help="Posts por campanha sintética.")
+    parser.add_argument("--seed", type=int, default=None, help="Semente do gerador de campanhas.")
+    parser.add_argument("--no-render", action="store_true", help="Mede só a geração, sem PDF/HTML.")
+    parser.add_argument("--no-save", action="store_true", help="Não grava o resultado no histórico.")
+    args = parser.parse_args()
+
+    try:
+        run = run_pipeline_benchmark(
+            args.briefings, runs=args.runs, concurrency=args.concurrency, render=not args.no_render,
+            mode=args.mode, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+            posts=args.posts, seed=args.seed
+        )
+    except ValueError as e:
+        print(f"Erro: {e}")
+        sys.exit(1)
+
+    if not args.no_save:
+        print(f"Resultados salvos em: {save_benchmark_run(run, PIPELINE_BENCHMARK_RESULTS_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
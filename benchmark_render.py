@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from src.utils.benchmarks import run_render_benchmarks, load_benchmark_history, save_benchmark_run, find_regressions
+from src.utils.benchmarks.run_render_benchmarks import DEFAULT_SIZES, REGRESSION_THRESHOLD
+
+
+def main():
+    """
+    Benchmark do caminho de renderização (PDF, HTML, Markdown e Quick View).
+
+    Mede tempo, pico de memória e tamanho da saída com campanhas sintéticas, salva o resultado
+    em output_files/benchmarks/render_benchmarks.jsonl e aponta regressões em relação à execução anterior.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark da geração de PDF/HTML do briefing.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Quantidades de posts (padrão: 5 20 100).")
+    parser.add_argument("--repetitions", type=int, default=3, help="Execuções por medição (padrão: 3).")
+    parser.add_argument("--warm", action="store_true", help="Mantém os caches de renderização entre as execuções.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Aumento de tempo considerado regressão (padrão: 0.2).")
+    parser.add_argument("--no-save", action="store_true", help="Não grava o resultado no histórico.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Termina com código 1 se houver regressão.")
+    args = parser.parse_args()
+
+    history = load_benchmark_history()
+    run = run_render_benchmarks(sizes=args.sizes, repetitions=args.repetitions, clear_caches=not args.warm)
+
+    regressions = find_regressions(run, history, threshold=args.threshold)
+    for message in regressions:
+        print(f"REGRESSÃO: {message}")
+    if not regressions:
+        print("Nenhuma regressão em relação à execução anterior.")
+
+    if not args.no_save:
+        print(f"Resultados salvos em: {save_benchmark_run(run)}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import statistics
+import sys
+from collections import defaultdict
+
+from src.llm_client.cassettes import configure_cassettes, get_cassette_dir, iter_cassettes
+from src.utils.benchmarks import replay_cassettes
+
+
+def print_summary(provider=None):
+    """Resume as interações gravadas por provedor e operação: quantidade, latência e tokens."""
+    groups = defaultdict(list)
+    for entry in iter_cassettes(provider):
+        groups[(entry["provider"], entry["operation"])].append(entry)
+
+    if not groups:
+        print(f"Nenhum cassete em {get_cassette_dir()}.")
+        return
+
+    print(f"Cassetes em {get_cassette_dir()}:")
+    for (name, operation), entries in sorted(groups.items()):
+        latencies = [entry["latency_seconds"] for entry in entries]
+        input_tokens = sum(entry["token_usage"]["estimated_input_tokens"] for entry in entries)
+        output_tokens = sum(entry["token_usage"]["estimated_output_tokens"] for entry in entries)
+        print(f"{name:<10} {operation:<28} {len(entries):>5} gravações | latência mediana {statistics.median(latencies):7.2f}s | "
+              f"tokens {input_tokens} entrada / {output_tokens} saída")
+
+
+def main():
+    """
+    Ferramentas dos cassetes (gravações das chamadas às IAs).
+
+    Para gravar, rode o pipeline com LLM_CASSETTE_MODE=record (ou auto); para reproduzir sem
+    acessar as IAs, use LLM_CASSETTE_MODE=replay. Este script resume as gravações (summary) ou
+    roda o parse/validação e a renderização HTML sobre as campanhas gravadas (check).
+    """
+    parser = argparse.ArgumentParser(description="Resumo e verificação dos cassetes de chamadas às IAs.")
+    parser.add_argument("command", choices=("summary", "check"), help="summary: resumo das gravações; check: parse e renderização das campanhas gravadas.")
+    parser.add_argument("--provider", default=None, help="Só as gravações deste provedor (ex: gemini).")
+    parser.add_argument("--dir", default=None, help="Diretório dos cassetes (padrão: output_files/cassettes).")
+    parser.add_argument("--no-render", action="store_true", help="No check, não renderiza o HTML.")
+    args = parser.parse_args()
+
+    configure_cassettes(directory=args.dir)
+
+    if args.command == "summary":
+        print_summary(args.provider)
+        return
+
+    result = replay_cassettes(args.provider, render=not args.no_render)
+    print(f"{result['total']} campanhas gravadas verificadas ({result['raw_text']} a partir do texto bruto do modelo, "
+          f"{result['repaired']} com reparo), {result['failed']} com falha.")
+    timings = [("latência gravada", result["recorded_latency_seconds"]), ("parse", result["parse_seconds"]),
+               ("renderização", result["render_seconds"])]
+    print("Mediana: " + " | ".join(f"{label} {value}s" for label, value in timings if value is not None))
+    for failure in result["failures"]:
+        print(f"FALHA ({failure['stage']}) {failure['provider']} {failure['key']}: {failure['message']}")
+    if result["status"] == "error":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,19 @@ import json
 import sys
 import os
 from datetime import datetime
-from weasyprint import HTML # Importa a classe HTML do Weasyprint
 
-# Adiciona o diretório 'src' ao sys.path para que as importações funcionem
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-
-from utils.html_generator.create_briefing_html import create_briefing_html
+from src.utils.html_generator.create_briefing_html import create_briefing_html
+from src.utils.pdf_generator.create_briefing_pdf_weasyprint import render_html_to_pdf, weasyprint_available
 
 
 def generate_pdf_from_html(html_filename: str, pdf_filename: str):
     """
     Converte um arquivo HTML em PDF usando Weasyprint.
     """
+    if not weasyprint_available():
+        print("Erro: weasyprint não está disponível; o PDF não foi gerado.")
+        return None
+    return render_html_to_pdf(html_filename, pdf_filename)
 
 
 def main():
@@ -22,7 +23,7 @@ def main():
     Aceita o caminho do JSON como argumento e extrai parâmetros necessários do conteúdo JSON e do caminho do arquivo.
     """
     if len(sys.argv) < 2:
-        print("Uso: python generate_html_from_json.py <caminho_para_json_de_conteudo>")
+        print("Uso: python generate_html_from_json.py <caminho_para_json_de_conteudo> [--pdf]")
         sys.exit(1)
 
     json_file_path = sys.argv[1]
@@ -85,6 +86,12 @@ def main():
         )
         print(f"HTML gerado com sucesso em: {html_output_path}")
 
+        # Opcional: converte o mesmo HTML em PDF (folha de estilo de impressão)
+        if "--pdf" in sys.argv[2:]:
+            pdf_output_path = os.path.splitext(html_output_path)[0] + ".pdf"
+            if generate_pdf_from_html(html_output_path, pdf_output_path):
+                print(f"PDF gerado com sucesso em: {pdf_output_path}")
+
 
 
     except Exception as e:
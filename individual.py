@@ -1,13 +1,36 @@
 import subprocess
 import sys
 
+from src.llm_client.provider_health import rank_providers
+
+PROVIDER_SCRIPTS = {
+    'gemini': 'src.main_gemini',
+    'mistral': 'src.main_mistral',
+    'cohere': 'src.main_cohere',
+}
+
+def choose_healthiest_script():
+    """
+    Escolhe automaticamente o script do provedor mais saudável e rápido,
+    com base no histórico recente de chamadas (latência, erros e falhas de JSON).
+    """
+    best = rank_providers(list(PROVIDER_SCRIPTS))[0]
+    if best['p50_latency'] is not None:
+        print(f"Modo automático: {best['provider']} (p50 {best['p50_latency']:.1f}s, erros {best['error_rate']:.0%}).")
+    else:
+        print(f"Modo automático: {best['provider']} (sem histórico recente).")
+    return PROVIDER_SCRIPTS[best['provider']]
+
 def main():
     """
-    Permite ao usuário escolher qual IA (Gemini, Mistral ou Cohere) executar
+    Permite ao usuário escolher qual IA (Gemini, Mistral ou Cohere) executar,
+    disputar as três em corrida (vence a primeira resposta válida), deixar que o
+    provedor mais saudável seja escolhido automaticamente ou usar o provedor local
+    (sem rede e sem custo, para testes),
     e aciona o script principal correspondente no diretório 'src'.
     """
     while True:
-        choice = input("Qual IA você quer utilizar? Use G [Gemini], M [Mistral] ou C [Cohere]: ").upper()
+        choice = input("Qual IA você quer utilizar? Use G [Gemini], M [Mistral], C [Cohere], R [Corrida entre as três], A [Automático] ou L [Local, sem custo]: ").upper()
 
         if choice == 'G':
             script_to_run = 'src.main_gemini'
@@ -18,8 +41,17 @@ def main():
         elif choice == 'C':
             script_to_run = 'src.main_cohere'
             break
+        elif choice == 'R':
+            script_to_run = 'src.main_race'
+            break
+        elif choice == 'A':
+            script_to_run = choose_healthiest_script()
+            break
+        elif choice == 'L':
+            script_to_run = 'src.main_mock'
+            break
         else:
-            print("Escolha inválida. Por favor, digite G, M ou C.")
+            print("Escolha inválida. Por favor, digite G, M, C, R, A ou L.")
 
     print(f"Iniciando {script_to_run.split('.')[-1].replace('main_', '')}...")
     try:
@@ -1,10 +1,44 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import subprocess
 import sys
 
-def run_script(module_name):
+from src.llm_client.provider_health import rank_providers, SKIPPED_PROVIDERS_ENV
+from src.utils.briefing_ingestion import preflight_briefings
+from src.utils.main_functions.collect_and_validate_briefing import DEFAULT_BRIEFING_PATH
+from src.utils.tracing import trace_span, inject_trace_context
+
+# Etapas de geração que podem ser puladas quando o provedor correspondente está degradado.
+GENERATION_STAGES = {
+    "gemini": "src.main_gemini",
+    "cohere": "src.main_cohere",
+}
+
+def select_generation_stages():
+    """
+    Escolhe as etapas de geração a executar com base na saúde recente dos provedores.
+
+    Provedores degradados são pulados, desde que ao menos um provedor continue ativo
+    (se todos estiverem degradados, mantém o melhor colocado).
+
+    Returns:
+        tuple: (lista de módulos a executar, conjunto de provedores pulados)
+    """
+    ranking = rank_providers(list(GENERATION_STAGES))
+    healthy = [item["provider"] for item in ranking if not item["degraded"]] or [ranking[0]["provider"]]
+    skipped = set(GENERATION_STAGES) - set(healthy)
+
+    for item in ranking:
+        if item["provider"] in skipped:
+            print(f"Pulando {item['provider']}: provedor degradado ({item['reason']}).")
+
+    # Mantém a ordem original das etapas.
+    modules = [module for provider, module in GENERATION_STAGES.items() if provider in healthy]
+    return modules, skipped
+
+def run_script(module_name, env=None):
     """
     Executa um módulo Python usando subprocess.
     """
@@ -12,7 +46,7 @@ def run_script(module_name):
     try:
         # Usa sys.executable para garantir que o mesmo interpretador Python seja usado
         # Captura a saída para exibir no console
-        result = subprocess.run([sys.executable, "-m", module_name], check=True, capture_output=True, text=True)
+        result = subprocess.run([sys.executable, "-m", module_name], check=True, capture_output=True, text=True, env=env)
         print(f"Saída de {module_name}:\n{result.stdout}")
         if result.stderr:
             print(f"Erros de {module_name}:\n{result.stderr}")
@@ -26,17 +60,34 @@ def run_script(module_name):
 
 if __name__ == "__main__":
     print("Iniciando a execução sequencial dos scripts...")
-    
-    # Lista de módulos a serem executados em sequência
-    modules_to_run = [
-        "src.main_gemini",
-        "src.main_cohere",
-        "src.extract_posts",
-        "src.main_resumo",
-        "src.main_consolidar"
-    ]
-
-    for module in modules_to_run:
-        run_script(module)
-    
+
+    # Mede a execução inteira como um trace; cada etapa registra os próprios spans como filhos.
+    with trace_span("pipeline"):
+        # Valida o briefing antes de qualquer chamada às IAs, listando todos os erros de uma vez.
+        with trace_span("briefing.preflight"):
+            preflight = preflight_briefings(os.getenv("BRIEFING_FILE") or DEFAULT_BRIEFING_PATH)
+        if preflight["status"] != "success":
+            for result in preflight["results"]:
+                for error in result["errors"]:
+                    print(f"Erro no briefing ({result['source']}): {error}")
+            print("Briefing inválido. Nenhum script foi executado.")
+            sys.exit(1)
+
+        generation_modules, skipped_providers = select_generation_stages()
+
+        # Lista de módulos a serem executados em sequência
+        modules_to_run = generation_modules + [
+            "src.extract_posts",
+            "src.main_resumo",
+            "src.main_consolidar"
+        ]
+
+        # As etapas seguintes são informadas dos provedores pulados para não usarem saídas antigas deles.
+        env = dict(os.environ, **{SKIPPED_PROVIDERS_ENV: ",".join(sorted(skipped_providers))})
+
+        for module in modules_to_run:
+            # Cada etapa é um span; os spans do subprocesso entram no mesmo trace (ver src/utils/tracing).
+            with trace_span("pipeline.script", module=module):
+                run_script(module, env=inject_trace_context(env))
+
     print("\nExecução de todos os scripts concluída.")
\ No newline at end of file
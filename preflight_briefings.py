@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from src.utils.briefing_ingestion import preflight_briefings
+
+
+def main():
+    """
+    Valida um ou vários briefings antes de qualquer chamada às IAs.
+
+    Aceita arquivos .json (um briefing ou uma lista), arquivos .ndjson/.jsonl, diretórios
+    (ex: briefing_docs/Exemplos) ou "-" para ler NDJSON da entrada padrão. Todos os erros
+    de cada briefing são listados de uma vez.
+    """
+    parser = argparse.ArgumentParser(description="Pré-validação de briefings de clientes.")
+    parser.add_argument("sources", nargs="*", default=["client_briefing.json"], help="Arquivos, diretórios ou - (padrão: client_briefing.json).")
+    args = parser.parse_args()
+
+    total = valid = 0
+    elapsed = 0.0
+    for source in args.sources:
+        report = preflight_briefings(sys.stdin if source == "-" else source)
+        total += report["total"]
+        valid += report["valid"]
+        elapsed += report["elapsed_seconds"]
+        for result in report["results"]:
+            label = result["client_name"] or "?"
+            if result["valid"]:
+                print(f"OK    {result['source']} ({label})")
+                continue
+            print(f"ERRO  {result['source']} ({label})")
+            for error in result["errors"]:
+                print(f"      - {error}")
+
+    print(f"\n{valid}/{total} briefing(s) válido(s) em {elapsed * 1000:.1f} ms.")
+    if total == 0 or valid < total:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +0,0 @@
-from .prompt_manager import PromptManager
-from .utils.cache_manager import get_cache_key, get_from_cache, set_to_cache
-from .utils.content_generator.generate_content_for_client_mistral import generate_content_for_client
-from .utils.content_generator.generate_image_prompts_mistral import generate_image_prompts
@@ -0,0 +1,3 @@
+from .prompt_manager import PromptManager
+from .utils.cache_manager import get_cache_key, get_from_cache, set_to_cache
+from .utils.content_generator.generate_content_for_client_race import generate_content_for_client_race, RACE_PROVIDER
@@ -10,12 +10,15 @@ from src.utils.data_storage import (
     init_db,
     insert_brief,
     get_briefs_by_client,
+    get_latest_brief_by_fingerprint,
     insert_client_profile,
     get_client_profile,
     get_all_briefs,
     update_brief_feedback,
     export_all_briefs_to_json,
-    update_client_profile
+    update_client_profile,
+    save_client_strategy,
+    upsert_client_profile
 )
 
 if __name__ == '__main__':
@@ -3,6 +3,8 @@ import os
 import sys
 from datetime import datetime
 
+from src.llm_client.provider_health import get_skipped_providers
+
 def extract_posts_from_json(input_file_path, output_dir):
     """
     Extrai apenas o array de posts de um arquivo JSON e salva em um novo arquivo.
@@ -81,9 +83,13 @@ def main():
     cohere_input_dir = os.path.join(output_files_dir, "Cohere")
     cohere_output_dir = os.path.join(cohere_input_dir, "Resumo")
     
+    skipped_providers = get_skipped_providers()
+
     # Processar arquivos da Gemini
     gemini_files = [f for f in os.listdir(gemini_input_dir) if f.endswith('.json') and os.path.isfile(os.path.join(gemini_input_dir, f))]
-    if gemini_files:
+    if "gemini" in skipped_providers:
+        print("Gemini pulada nesta execução (provedor degradado).")
+    elif gemini_files:
         # Pegar o arquivo mais recente (ou você pode especificar um arquivo específico)
         gemini_file = gemini_files[-1]  # Assumindo que o último é o mais recente
         gemini_file_path = os.path.join(gemini_input_dir, gemini_file)
@@ -94,7 +100,9 @@ def main():
     
     # Processar arquivos da Cohere
     cohere_files = [f for f in os.listdir(cohere_input_dir) if f.endswith('.json') and os.path.isfile(os.path.join(cohere_input_dir, f))]
-    if cohere_files:
+    if "cohere" in skipped_providers:
+        print("Cohere pulada nesta execução (provedor degradado).")
+    elif cohere_files:
         # Pegar o arquivo mais recente (ou você pode especificar um arquivo específico)
         cohere_file = cohere_files[-1]  # Assumindo que o último é o mais recente
         cohere_file_path = os.path.join(cohere_input_dir, cohere_file)
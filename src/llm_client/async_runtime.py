@@ -0,0 +1,191 @@
+"""
+Event loop compartilhado para as chamadas assíncronas às IAs.
+
+As variantes `*_async` dos clientes em `src/llm_client/` usam os clientes assíncronos dos
+SDKs, então centenas de requisições podem ficar em andamento em uma única thread. Código
+síncrono (as etapas do pipeline) envia as corrotinas para um único event loop por processo,
+que roda em uma thread daemon, em vez de criar um loop (ou uma thread bloqueada) por chamada.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import inspect
+import threading
+
+# Tempo máximo padrão de uma chamada assíncrona, em segundos (None = sem limite)
+DEFAULT_TIMEOUT_SECONDS = 600
+
+# Tempo máximo para fechar os clientes assíncronos ao fim do processo, em segundos
+CLOSE_CLIENTS_TIMEOUT_SECONDS = 5
+
+_loop = None
+_loop_lock = threading.Lock()
+_async_clients = {}
+_async_clients_lock = threading.Lock()
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Retorna o event loop compartilhado do processo, iniciando-o na primeira chamada.
+
+    Returns:
+        asyncio.AbstractEventLoop: Loop rodando em uma thread daemon.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-async-loop", daemon=True).start()
+        return _loop
+
+
+def submit_async(coro):
+    """
+    Agenda uma corrotina no loop compartilhado sem esperar o resultado.
+
+    A corrotina roda com as variáveis de contexto de quem a enviou (ex: o span atual do
+    tracing), como se tivesse sido chamada na mesma thread.
+
+    Args:
+        coro: A corrotina (ex: `generate_text_content_async(prompt)`).
+
+    Returns:
+        concurrent.futures.Future: Use `.result(timeout)` para esperar e `.cancel()` para
+                                   cancelar a chamada em andamento.
+    """
+    context = contextvars.copy_context()
+
+    async def run_in_caller_context():
+        for variable, value in context.items():
+            variable.set(value)
+        return await coro
+
+    return asyncio.run_coroutine_threadsafe(run_in_caller_context(), get_shared_loop())
+
+
+def run_async(coro, timeout: float = None):
+    """
+    Executa uma corrotina no loop compartilhado e espera o resultado (uso em código síncrono).
+
+    Args:
+        coro: A corrotina a executar.
+        timeout (float): Tempo máximo de espera, em segundos. Ao estourar, a chamada é cancelada.
+
+    Returns:
+        O resultado da corrotina.
+
+    Raises:
+        TimeoutError: Se o tempo limite for excedido.
+    """
+    future = submit_async(coro)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+async def with_timeout(awaitable, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+    """
+    Aguarda uma chamada com tempo limite; ao estourar, a chamada é cancelada.
+
+    Args:
+        awaitable: A chamada assíncrona do SDK.
+        timeout (float): Tempo máximo, em segundos (None = sem limite).
+
+    Raises:
+        TimeoutError: Se o tempo limite for excedido.
+    """
+    if timeout is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, timeout)
+
+
+async def gather_limited(coros, limit: int = None) -> list:
+    """
+    Executa várias corrotinas ao mesmo tempo, com no máximo `limit` em andamento.
+
+    Se a chamada for cancelada, todas as corrotinas pendentes também são canceladas.
+
+    Args:
+        coros: Corrotinas a executar (ex: uma por briefing do lote).
+        limit (int): Máximo de chamadas simultâneas (None = todas de uma vez).
+
+    Returns:
+        list: Os resultados, na mesma ordem das corrotinas.
+    """
+    if not limit:
+        return await asyncio.gather(*coros)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+def get_async_client(provider: str, factory):
+    """
+    Retorna o cliente assíncrono do SDK do provedor, criando-o na primeira chamada.
+
+    Há um cliente por provedor e por event loop (na prática, o loop compartilhado), então as
+    chamadas simultâneas reaproveitam as mesmas conexões HTTP. Deve ser chamado dentro de
+    uma corrotina, no loop em que o cliente será usado.
+
+    Args:
+        provider (str): Nome do provedor (ex: "cohere").
+        factory: Função sem argumentos que cria o cliente (ex: `lambda: cohere.AsyncClient(...)`).
+
+    Returns:
+        O cliente assíncrono do provedor.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        # Clientes de loops já fechados não podem mais ser usados (nem fechados)
+        for key in [key for key in _async_clients if key[1].is_closed()]:
+            del _async_clients[key]
+        client = _async_clients.get((provider, loop))
+        if client is None:
+            client = _async_clients[(provider, loop)] = factory()
+        return client
+
+
+async def _close_client(client):
+    if hasattr(client, "__aexit__"):
+        await client.__aexit__(None, None, None)
+        return
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def close_async_clients():
+    """Fecha os clientes assíncronos criados no loop atual, liberando as conexões HTTP."""
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        keys = [key for key in _async_clients if key[1] is loop]
+        clients = [(key[0], _async_clients.pop(key)) for key in keys]
+    for provider, client in clients:
+        try:
+            await _close_client(client)
+        except Exception as e:
+            print(f"Aviso: não foi possível fechar o cliente assíncrono de {provider}: {e}")
+
+
+@atexit.register
+def _close_shared_loop_clients():
+    """Ao fim do processo, fecha os clientes criados no loop compartilhado."""
+    loop = _loop
+    if loop is None or loop.is_closed() or not loop.is_running():
+        return
+    if not any(key[1] is loop for key in list(_async_clients)):
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_async_clients(), loop).result(CLOSE_CLIENTS_TIMEOUT_SECONDS)
+    except Exception as e:
+        print(f"Aviso: não foi possível fechar os clientes assíncronos: {e}")
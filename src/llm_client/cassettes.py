@@ -0,0 +1,296 @@
+"""
+Gravação e reprodução ("cassetes") das chamadas às IAs.
+
+Toda chamada feita por um `LLMProvider` (ver `src/llm_client/providers.py`) passa por aqui.
+No modo de gravação, cada interação é salva com o pedido (prompt), a resposta, a latência
+e a estimativa de tokens; no modo de reprodução, a mesma chamada devolve a resposta gravada,
+sem rede, sem custo e sem importar o SDK do provedor. Assim, testes de regressão e de
+desempenho dos prompts, parsers e renderizadores rodam com tráfego real na velocidade local.
+
+Cada interação fica em um arquivo JSON compactado (gzip) em
+`<diretório>/<provedor>/<chave>.json.gz`, em que a chave é o hash de provedor, modelo,
+operação e prompt: a busca é direta e gravações simultâneas (etapas do pipeline em
+subprocessos) não disputam o mesmo arquivo. Variantes síncronas e assíncronas de uma
+operação compartilham as gravações.
+
+Nas campanhas (`generate_text_content`), a gravação guarda o texto bruto devolvido pelo
+modelo ("raw_text", informado pelos clientes) e a reprodução o passa de novo por
+`parse_llm_json` (reparo e validação): os parsers são testados contra as respostas reais,
+não contra um JSON já decodificado.
+
+Modos (variável LLM_CASSETTE_MODE ou `configure_cassettes`):
+
+    off      (padrão) chamadas normais, nada é gravado
+    record   sempre chama a IA e grava (sobrescrevendo) a interação
+    replay   só reproduz; chamadas sem gravação retornam erro, sem acessar a IA
+    auto     reproduz as respostas de sucesso gravadas e chama/grava as demais
+
+O diretório padrão é output_files/cassettes (variável LLM_CASSETTE_DIR).
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from src.config import BASE_DIR
+from src.utils.llm_output import parse_llm_json
+
+CASSETTE_MODES = ("off", "record", "replay", "auto")
+DEFAULT_CASSETTE_DIR = os.path.join(BASE_DIR, "output_files", "cassettes")
+
+_overrides = {}
+
+
+def configure_cassettes(mode: str = None, directory: str = None):
+    """
+    Ajusta o modo e o diretório dos cassetes no processo atual (prioridade sobre as variáveis de ambiente).
+
+    Args:
+        mode (str): "off", "record", "replay" ou "auto" (None mantém o atual).
+        directory (str): Diretório dos cassetes (None mantém o atual).
+
+    Raises:
+        ValueError: Se o modo não for um dos modos suportados.
+    """
+    if mode is not None and mode.lower() not in CASSETTE_MODES:
+        raise ValueError(f"Modo de cassete inválido: '{mode}'. Use {', '.join(CASSETTE_MODES)}.")
+    for key, value in (("mode", mode), ("directory", directory)):
+        if value is not None:
+            _overrides[key] = value
+
+
+def reset_cassettes():
+    """Descarta os ajustes de `configure_cassettes` (volta a usar LLM_CASSETTE_MODE e LLM_CASSETTE_DIR)."""
+    _overrides.clear()
+
+
+def get_cassette_mode() -> str:
+    """Modo efetivo dos cassetes (um modo desconhecido na variável de ambiente equivale a "off")."""
+    mode = str(_overrides.get("mode", os.getenv("LLM_CASSETTE_MODE", "off"))).lower()
+    return mode if mode in CASSETTE_MODES else "off"
+
+
+def get_cassette_dir() -> str:
+    """Diretório efetivo dos cassetes."""
+    return _overrides.get("directory", os.getenv("LLM_CASSETTE_DIR", DEFAULT_CASSETTE_DIR))
+
+
+def cassette_key(provider: str, model: str, operation: str, prompt: str) -> str:
+    """Chave da interação: hash de provedor, modelo, operação (sem o sufixo `_async`) e prompt."""
+    operation = operation.removesuffix("_async")
+    data = json.dumps([provider, model, operation, prompt], ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+def _cassette_path(provider: str, key: str) -> str:
+    return os.path.join(get_cassette_dir(), provider, f"{key}.json.gz")
+
+
+def load_cassette(provider: str, key: str) -> dict:
+    """
+    Lê uma interação gravada.
+
+    Returns:
+        dict: A interação ou None se não houver gravação (ou se o arquivo estiver corrompido).
+    """
+    path = _cassette_path(provider, key)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Aviso: cassete ignorado ({path}): {e}")
+        return None
+
+
+def save_cassette(entry: dict) -> str:
+    """
+    Grava uma interação (escrita atômica: arquivo temporário + rename).
+
+    Args:
+        entry (dict): A interação, com ao menos "provider" e "key".
+
+    Returns:
+        str: O caminho do arquivo gravado.
+    """
+    path = _cassette_path(entry["provider"], entry["key"])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
+
+
+def iter_cassettes(provider: str = None, directory: str = None):
+    """
+    Percorre as interações gravadas (ex: para rodar parsers e renderizadores com tráfego real).
+
+    Args:
+        provider (str): Só as interações deste provedor (None = todos).
+        directory (str): Diretório dos cassetes (padrão: o diretório efetivo).
+
+    Yields:
+        dict: Cada interação, em ordem estável (provedor e chave).
+    """
+    directory = directory or get_cassette_dir()
+    if not os.path.isdir(directory):
+        return
+    providers = [provider] if provider else sorted(os.listdir(directory))
+    for name in providers:
+        provider_dir = os.path.join(directory, name)
+        if not os.path.isdir(provider_dir):
+            continue
+        for filename in sorted(os.listdir(provider_dir)):
+            if not filename.endswith(".json.gz"):
+                continue
+            try:
+                with gzip.open(os.path.join(provider_dir, filename), "rt", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Aviso: cassete ignorado ({filename}): {e}")
+
+
+def _is_success(response) -> bool:
+    if isinstance(response, dict):
+        return response.get("status") == "success"
+    return isinstance(response, str) and not response.startswith("ERRO")
+
+
+def _response_text(response) -> str:
+    if isinstance(response, dict) and response.get("raw_text") is not None:
+        return response["raw_text"]
+    if isinstance(response, dict):
+        return json.dumps(response.get("generated_content", response.get("visual_prompt", "")), ensure_ascii=False)
+    return str(response)
+
+
+def _build_entry(llm_provider, operation: str, key: str, prompt: str, response, latency: float) -> dict:
+    input_tokens = len(prompt.split())
+    output_tokens = len(_response_text(response).split())
+    raw_text = response.get("raw_text") if isinstance(response, dict) else None
+    if raw_text is not None:
+        response = {field: value for field, value in response.items() if field != "raw_text"}
+    return {
+        "key": key,
+        "provider": llm_provider.name,
+        "model": llm_provider.model,
+        "operation": operation.removesuffix("_async"),
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "request": {"prompt": prompt},
+        "response": response,
+        "raw_text": raw_text,
+        "latency_seconds": round(latency, 4),
+        "token_usage": {
+            "estimated_input_tokens": input_tokens,
+            "estimated_output_tokens": output_tokens,
+            "estimated_cost_usd": llm_provider.estimate_cost(input_tokens, output_tokens),
+        },
+    }
+
+
+def _replay_miss(operation: str, provider: str):
+    message = f"Nenhuma gravação de {provider} para esta chamada ({operation}) no modo replay."
+    if operation.startswith("generate_content"):
+        return f"ERRO: {message}"
+    return {"status": "error", "error_type": "cassette_miss", "message": message}
+
+
+def parse_recorded_text(raw_text: str) -> dict:
+    """
+    Decodifica o texto bruto gravado de uma campanha como os clientes fazem com a resposta ao vivo.
+
+    Returns:
+        dict: {"status": "success", "generated_content", "raw_text"} ou
+              {"status": "error", "error_type": "json", "message", "raw_text"}.
+    """
+    parsed = parse_llm_json(raw_text)
+    if parsed["status"] == "error":
+        return {"status": "error", "error_type": "json", "message": parsed["message"], "raw_text": raw_text}
+    return {"status": "success", "generated_content": parsed["generated_content"], "raw_text": raw_text}
+
+
+def _replayed_response(entry: dict):
+    """Resposta reproduzida: o texto bruto da campanha passa de novo pelo parser; as demais voltam como gravadas."""
+    if entry.get("raw_text") is not None:
+        return parse_recorded_text(entry["raw_text"])
+    return entry["response"]
+
+
+def _lookup(llm_provider, operation: str, prompt: str):
+    """Retorna (modo, chave, interação gravada a reproduzir ou None)."""
+    mode = get_cassette_mode()
+    if mode == "off":
+        return mode, None, None
+    key = cassette_key(llm_provider.name, llm_provider.model, operation, prompt)
+    if mode == "record":
+        return mode, key, None
+    entry = load_cassette(llm_provider.name, key)
+    if entry is not None and (mode == "replay" or _is_success(entry["response"])):
+        return mode, key, entry
+    return mode, key, None
+
+
+def _record(llm_provider, operation: str, key: str, prompt: str, response, latency: float):
+    try:
+        save_cassette(_build_entry(llm_provider, operation, key, prompt, response, latency))
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o cassete de {llm_provider.name}: {e}")
+
+
+def call_with_cassette(llm_provider, operation: str, prompt: str, call):
+    """
+    Executa uma chamada síncrona ao provedor passando pelos cassetes.
+
+    Args:
+        llm_provider (LLMProvider): O provedor chamado.
+        operation (str): Nome da função do cliente (ex: "generate_text_content").
+        prompt (str): O prompt enviado.
+        call: Função sem argumentos que faz a chamada real.
+
+    Returns:
+        A resposta real ou a gravada.
+    """
+    mode, key, entry = _lookup(llm_provider, operation, prompt)
+    if entry is not None:
+        return _replayed_response(entry)
+    if mode == "replay":
+        return _replay_miss(operation, llm_provider.name)
+
+    started_at = time.perf_counter()
+    response = call()
+    if mode != "off":
+        _record(llm_provider, operation, key, prompt, response, time.perf_counter() - started_at)
+    return response
+
+
+async def call_with_cassette_async(llm_provider, operation: str, prompt: str, call):
+    """
+    Variante assíncrona de `call_with_cassette` (`call` retorna a corrotina da chamada real).
+
+    A leitura e a gravação dos arquivos (gzip) e o parse da resposta reproduzida rodam em
+    uma thread, sem bloquear o event loop compartilhado.
+    """
+    mode, key, entry = await asyncio.to_thread(_lookup, llm_provider, operation, prompt)
+    if entry is not None:
+        return await asyncio.to_thread(_replayed_response, entry)
+    if mode == "replay":
+        return _replay_miss(operation, llm_provider.name)
+
+    started_at = time.perf_counter()
+    response = await call()
+    if mode != "off":
+        latency = time.perf_counter() - started_at
+        await asyncio.to_thread(_record, llm_provider, operation, key, prompt, response, latency)
+    return response
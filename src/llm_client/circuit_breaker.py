@@ -0,0 +1,222 @@
+"""
+Circuit breaker por provedor de IA (estados closed/open/half_open).
+
+O estado fica na tabela `provider_circuits`, compartilhado entre todos os processos
+do pipeline. Depois de FAILURE_THRESHOLD falhas consecutivas da API, o circuito abre
+e as chamadas falham imediatamente, sem esperar o timeout do SDK. Passado OPEN_SECONDS,
+uma única chamada de teste (real ou feita por uma thread em segundo plano) decide se o
+circuito fecha novamente. Respostas com JSON inválido não contam como falha: nesses
+casos o provedor está no ar.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from functools import wraps
+
+from src.llm_client.provider_health import classify_result
+from src.utils.data_storage import claim_provider_circuit_probe, get_provider_circuit, save_provider_circuit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = 3
+OPEN_SECONDS = 120
+
+_probes = {}
+_probe_threads = {}
+_probe_lock = threading.Lock()
+
+
+def register_probe(provider: str, probe):
+    """
+    Registra a chamada leve usada para testar a recuperação do provedor em segundo plano.
+
+    Args:
+        provider (str): Nome do provedor.
+        probe (callable): Função sem argumentos que lança exceção se a API estiver fora do ar.
+    """
+    _probes[provider] = probe
+
+
+def get_circuit_state(provider: str) -> dict:
+    """Retorna o estado atual do circuito (fechado se o provedor nunca falhou)."""
+    try:
+        circuit = get_provider_circuit(provider)
+    except Exception as e:
+        print(f"Aviso: não foi possível ler o circuit breaker de {provider}: {e}")
+        circuit = None
+    return circuit or {"provider": provider, "state": CLOSED, "consecutive_failures": 0, "opened_at": None, "updated_at": None}
+
+
+def _save(provider: str, state: str, failures: int, opened_at: float = None):
+    """Persiste o estado sem nunca interromper a geração em caso de falha no banco."""
+    try:
+        save_provider_circuit(provider, state, failures, opened_at)
+    except Exception as e:
+        print(f"Aviso: não foi possível salvar o circuit breaker de {provider}: {e}")
+
+
+def record_success(provider: str):
+    """Fecha o circuito após uma chamada bem-sucedida."""
+    circuit = get_circuit_state(provider)
+    if circuit["state"] != CLOSED or circuit["consecutive_failures"]:
+        if circuit["state"] != CLOSED:
+            print(f"Circuit breaker de {provider}: provedor recuperado, circuito fechado.")
+        _save(provider, CLOSED, 0)
+
+
+def record_failure(provider: str):
+    """Conta uma falha da API e abre o circuito ao atingir o limite (ou se o teste falhar)."""
+    circuit = get_circuit_state(provider)
+    failures = circuit["consecutive_failures"] + 1
+
+    if circuit["state"] == HALF_OPEN or failures >= FAILURE_THRESHOLD:
+        if circuit["state"] == CLOSED:
+            print(f"Circuit breaker de {provider}: {failures} falhas consecutivas, circuito aberto por {OPEN_SECONDS}s.")
+        _save(provider, OPEN, failures, time.time())
+        _ensure_background_probe(provider)
+    else:
+        _save(provider, CLOSED, failures)
+
+
+def _admit_request(provider: str):
+    """
+    Decide se uma chamada ao provedor pode ser feita agora.
+
+    Returns:
+        tuple: (liberada, circuito lido antes da decisão). Se o circuito lido não estava
+               fechado e a chamada foi liberada, ela é a chamada de teste (half_open).
+    """
+    circuit = get_circuit_state(provider)
+    if circuit["state"] == CLOSED:
+        return True, circuit
+    if claim_provider_circuit_probe(provider, OPEN_SECONDS):
+        print(f"Circuit breaker de {provider}: enviando chamada de teste (half-open).")
+        return True, circuit
+    _ensure_background_probe(provider)
+    return False, circuit
+
+
+def allow_request(provider: str) -> bool:
+    """
+    Indica se uma chamada ao provedor pode ser feita agora.
+
+    Com o circuito aberto, a chamada é liberada apenas depois de OPEN_SECONDS e apenas
+    para o processo que conseguir reservar o teste (estado half_open).
+    """
+    return _admit_request(provider)[0]
+
+
+def release_probe(provider: str, circuit: dict):
+    """
+    Devolve o circuito ao estado aberto quando a chamada de teste não chegou a um resultado
+    (ex: cancelada pela corrida entre provedores), sem esperar a reserva expirar.
+
+    Args:
+        provider (str): Nome do provedor.
+        circuit (dict): Estado lido antes de reservar o teste (falhas e `opened_at` são mantidos).
+    """
+    if get_circuit_state(provider)["state"] != HALF_OPEN:
+        return
+    print(f"Circuit breaker de {provider}: chamada de teste cancelada, circuito aberto novamente.")
+    _save(provider, OPEN, circuit["consecutive_failures"], circuit["opened_at"] or time.time())
+    _ensure_background_probe(provider)
+
+
+def _run_background_probe(provider: str):
+    """Testa periodicamente o provedor até o circuito voltar a fechar."""
+    probe = _probes[provider]
+    while True:
+        circuit = get_circuit_state(provider)
+        if circuit["state"] == CLOSED:
+            return
+        opened_at = circuit["opened_at"] or time.time()
+        time.sleep(max(1.0, opened_at + OPEN_SECONDS - time.time()))
+        if not claim_provider_circuit_probe(provider, OPEN_SECONDS):
+            continue
+        try:
+            probe()
+        except Exception as e:
+            print(f"Circuit breaker de {provider}: teste em segundo plano falhou ({e}).")
+            record_failure(provider)
+        else:
+            record_success(provider)
+            return
+
+
+def _ensure_background_probe(provider: str):
+    """Inicia (uma única vez por processo) a thread daemon de teste do provedor."""
+    if provider not in _probes:
+        return
+    with _probe_lock:
+        thread = _probe_threads.get(provider)
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(target=_run_background_probe, args=(provider,), daemon=True)
+            _probe_threads[provider] = thread
+            thread.start()
+
+
+def circuit_breaker(provider: str, text_result: bool = False):
+    """
+    Decorador que aplica o circuit breaker do provedor a uma função de cliente de IA
+    (síncrona ou assíncrona; chamadas canceladas não contam como falha).
+
+    Args:
+        provider (str): Nome do provedor (ex: "mistral").
+        text_result (bool): True se a função retorna texto bruto (falha rápida vira "ERRO: ...");
+                            caso contrário, a falha rápida é um dicionário de erro.
+    """
+    def decorator(func):
+        def rejected():
+            message = f"Circuit breaker aberto para {provider}: chamada não enviada (falha rápida)."
+            print(message)
+            if text_result:
+                return f"ERRO: {message}"
+            return {"status": "error", "error_type": "circuit_open", "message": message}
+
+        def record(result):
+            status, error_type = classify_result(result)
+            if status == "error" and error_type == "api":
+                record_failure(provider)
+            else:
+                record_success(provider)
+
+        if inspect.iscoroutinefunction(func):
+            # As leituras e gravações no banco rodam em uma thread, sem bloquear o event loop compartilhado
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                allowed, circuit = await asyncio.to_thread(_admit_request, provider)
+                if not allowed:
+                    return rejected()
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    # Cancelada não é falha, mas um teste cancelado não pode deixar o circuito em half_open
+                    if circuit["state"] != CLOSED:
+                        await asyncio.to_thread(release_probe, provider, circuit)
+                    raise
+                except Exception:
+                    await asyncio.to_thread(record_failure, provider)
+                    raise
+                await asyncio.to_thread(record, result)
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not allow_request(provider):
+                return rejected()
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                record_failure(provider)
+                raise
+
+            record(result)
+            return result
+        return wrapper
+    return decorator
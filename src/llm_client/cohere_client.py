@@ -1,46 +1,83 @@
+import asyncio
 import os
-import json
-import re
 from datetime import datetime
 from dotenv import load_dotenv
 import cohere
+from src.llm_client.async_runtime import DEFAULT_TIMEOUT_SECONDS, get_async_client, with_timeout
+from src.llm_client.circuit_breaker import circuit_breaker, register_probe
+from src.llm_client.provider_health import track_provider_call
+from src.llm_client.streaming import collect_stream, collect_stream_async
+from src.utils.llm_output import build_response_schema, parse_llm_json
 
 load_dotenv()
 
+# Erros que indicam que o modo JSON não é suportado pela versão do SDK/modelo.
+STRUCTURED_OUTPUT_ERRORS = (TypeError, getattr(cohere, "BadRequestError", TypeError))
+
+
+def check_availability():
+    """
+    Chamada leve (lista de modelos) usada pelo circuit breaker para testar se a API voltou.
+    """
+    cohere.Client(os.getenv("COHERE_API_KEY"), timeout=30).models.list()
+
+register_probe("cohere", check_availability)
+
+
+def _async_client():
+    """Cliente assíncrono da Cohere, único no event loop (reaproveita as conexões entre chamadas)."""
+    return get_async_client("cohere", lambda: cohere.AsyncClient(os.getenv("COHERE_API_KEY"), timeout=600))
+
+
+def _event_text(event) -> str:
+    """Texto de um evento do chat em streaming (só os eventos "text-generation" trazem texto)."""
+    return event.text if getattr(event, "event_type", None) == "text-generation" else ""
+
+
+def _parse_text_response(content: str) -> dict:
+    """Decodifica (reparando, se preciso) o JSON da campanha; se falhar, salva a resposta bruta (sempre devolvida em "raw_text")."""
+    parsed = parse_llm_json(content)
+    if parsed["status"] == "success":
+        if parsed["repairs"]:
+            print(f"JSON da resposta da Cohere reparado: {'; '.join(parsed['repairs'])}")
+        return {"status": "success", "generated_content": parsed["generated_content"], "raw_text": content}
+
+    # Se ainda falhar, salvar para depuração
+    raw_responses_dir = os.path.join(os.path.dirname(__file__), 'raw_cohere_responses')
+    os.makedirs(raw_responses_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = os.path.join(raw_responses_dir, f"cohere_raw_response_{timestamp}.txt")
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return {"status": "error", "error_type": "json", "message": f"JSON inválido após reparo. Resposta salva em: {filename}. Erro: {parsed['message']}", "raw_text": content}
+
+@circuit_breaker("cohere")
+@track_provider_call("cohere", "command-r-plus-08-2024")
 def generate_text_content(prompt: str) -> dict:
     co = cohere.Client(os.getenv("COHERE_API_KEY"), timeout=600)
     try:
-        response = co.chat(
-            model="command-r-plus-08-2024",
-            message=prompt,
-            temperature=0.9  # Menor temperatura para respostas mais consistentes
-        )
-        # A Cohere retorna a resposta diretamente em response.text
-        content = response.text.strip()
-
-        # Extrair apenas o primeiro bloco JSON completo (incluindo chaves aninhadas)
-        json_match = re.search(r'\{.*\}', content, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(0).strip()
-
-            try:
-                generated_content = json.loads(json_string)
-                return {"status": "success", "generated_content": generated_content}
-            except json.JSONDecodeError as e:
-                # Se ainda falhar, salvar para depuração
-                raw_responses_dir = os.path.join(os.path.dirname(__file__), 'raw_cohere_responses')
-                os.makedirs(raw_responses_dir, exist_ok=True)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = os.path.join(raw_responses_dir, f"mistral_raw_response_{timestamp}.txt")
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return {"status": "error", "message": f"JSON inválido após extração. Resposta salva em: {filename}. Erro: {e}"}
-        else:
-            return {"status": "error", "message": "Nenhum bloco JSON encontrado na resposta."}
+        try:
+            # Modo JSON nativo com o esquema da campanha, em streaming (primeiro trecho = primeiro token).
+            text = collect_stream(co.chat_stream(
+                model="command-r-plus-08-2024",
+                message=prompt,
+                temperature=0.9,  # Menor temperatura para respostas mais consistentes
+                response_format={"type": "json_object", "schema": build_response_schema("json_schema")}
+            ), _event_text)
+        except STRUCTURED_OUTPUT_ERRORS as e:
+            print(f"Saída estruturada indisponível na Cohere ({e}). Usando geração em texto.")
+            text = collect_stream(co.chat_stream(
+                model="command-r-plus-08-2024",
+                message=prompt,
+                temperature=0.9
+            ), _event_text)
+        return _parse_text_response(text.strip())
 
     except Exception as e:
         return {"status": "error", "message": f"Erro ao gerar conteúdo: {e}"}
 
+@circuit_breaker("cohere", text_result=True)
+@track_provider_call("cohere", "command-r-plus-08-2024")
 def generate_content(prompt: str) -> str:
     """
     Gera conteúdo de texto usando o modelo Cohere e retorna a resposta bruta.
@@ -64,6 +101,8 @@ def generate_content(prompt: str) -> str:
         print(f"Erro ao gerar conteúdo com Cohere: {e}")
         return f"ERRO: {e}"
 
+@circuit_breaker("cohere")
+@track_provider_call("cohere", "command-r-plus-08-2024")
 def generate_image_description(prompt: str) -> dict:
     co = cohere.Client(os.getenv("COHERE_API_KEY"), timeout=600)
     try:
@@ -76,3 +115,83 @@ def generate_image_description(prompt: str) -> dict:
         return {"status": "success", "visual_prompt": response.text}
     except Exception as e:
         return {"status": "error", "message": f"Erro ao gerar descrição de imagem: {e}"}
+
+@circuit_breaker("cohere")
+@track_provider_call("cohere", "command-r-plus-08-2024")
+async def generate_text_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_text_content` (cliente assíncrono do SDK da Cohere, em streaming).
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        dict: Um dicionário contendo o conteúdo gerado ou uma mensagem de erro.
+    """
+    co = _async_client()
+    try:
+        try:
+            # Modo JSON nativo com o esquema da campanha, em streaming.
+            text = await with_timeout(collect_stream_async(co.chat_stream(
+                model="command-r-plus-08-2024",
+                message=prompt,
+                temperature=0.9,
+                response_format={"type": "json_object", "schema": build_response_schema("json_schema")}
+            ), _event_text), timeout)
+        except STRUCTURED_OUTPUT_ERRORS as e:
+            print(f"Saída estruturada indisponível na Cohere ({e}). Usando geração em texto.")
+            text = await with_timeout(collect_stream_async(
+                co.chat_stream(model="command-r-plus-08-2024", message=prompt, temperature=0.9), _event_text
+            ), timeout)
+        return _parse_text_response(text.strip())
+    except asyncio.TimeoutError:
+        return {"status": "error", "message": f"Erro ao gerar conteúdo: tempo limite de {timeout}s excedido."}
+    except Exception as e:
+        return {"status": "error", "message": f"Erro ao gerar conteúdo: {e}"}
+
+@circuit_breaker("cohere", text_result=True)
+@track_provider_call("cohere", "command-r-plus-08-2024")
+async def generate_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> str:
+    """
+    Versão assíncrona de `generate_content` (resposta bruta, usada no resumo de posts).
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        str: A resposta bruta do modelo.
+    """
+    co = _async_client()
+    try:
+        response = await with_timeout(co.chat(model="command-r-plus-08-2024", message=prompt, temperature=0.9), timeout)
+        return response.text.strip()
+    except asyncio.TimeoutError:
+        print(f"Erro ao gerar conteúdo com Cohere: tempo limite de {timeout}s excedido.")
+        return f"ERRO: tempo limite de {timeout}s excedido."
+    except Exception as e:
+        print(f"Erro ao gerar conteúdo com Cohere: {e}")
+        return f"ERRO: {e}"
+
+@circuit_breaker("cohere")
+@track_provider_call("cohere", "command-r-plus-08-2024")
+async def generate_image_description_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_image_description`.
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        dict: Um dicionário contendo a descrição gerada ou uma mensagem de erro.
+    """
+    co = _async_client()
+    try:
+        response = await with_timeout(co.chat(model="command-r-plus-08-2024", message=prompt, temperature=0.9), timeout)
+        return {"status": "success", "visual_prompt": response.text}
+    except asyncio.TimeoutError:
+        return {"status": "error", "message": f"Erro ao gerar descrição de imagem: tempo limite de {timeout}s excedido."}
+    except Exception as e:
+        return {"status": "error", "message": f"Erro ao gerar descrição de imagem: {e}"}
@@ -1,18 +1,63 @@
+import asyncio
 import os
-import json
-import re
 import time
 import google.generativeai as genai
 import google.api_core.exceptions
 from dotenv import load_dotenv
+from src.llm_client.async_runtime import DEFAULT_TIMEOUT_SECONDS, with_timeout
+from src.llm_client.circuit_breaker import circuit_breaker, register_probe
+from src.llm_client.provider_health import track_provider_call
+from src.llm_client.streaming import collect_stream, collect_stream_async
+from src.utils.llm_output import build_response_schema, parse_llm_json
 
 load_dotenv()
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
+
+def check_availability():
+    """
+    Chamada leve (metadados do modelo) usada pelo circuit breaker para testar se a API voltou.
+    """
+    genai.get_model('models/gemini-2.5-pro')
+
+register_probe("gemini", check_availability)
+
+
+def _json_generation_config():
+    """Configuração do modo JSON nativo: a resposta já vem no formato do esquema da campanha."""
+    return genai.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=build_response_schema("gemini"),
+    )
+
+
+def _chunk_text(chunk) -> str:
+    """Texto de um trecho da resposta em streaming (trechos sem partes de texto são ignorados)."""
+    try:
+        return chunk.text
+    except ValueError:
+        return ""
+
+
+def _parse_text_response(text: str) -> dict:
+    """Decodifica (reparando, se preciso) o JSON da campanha retornado pelo Gemini (o texto bruto vai em "raw_text")."""
+    parsed = parse_llm_json(text)
+    if parsed["status"] == "error":
+        return {"status": "error", "error_type": "json", "message": f"{parsed['message']}. Resposta bruta: {text}", "raw_text": text}
+    if parsed["repairs"]:
+        print(f"JSON da resposta do Gemini reparado: {'; '.join(parsed['repairs'])}")
+    return {"status": "success", "generated_content": parsed["generated_content"], "raw_text": text}
+
+@circuit_breaker("gemini")
+@track_provider_call("gemini", "gemini-2.5-pro")
 def generate_text_content(prompt: str) -> dict:
     """
     Gera conteúdo de texto usando o modelo Gemini-Pro.
 
+    Usa o modo JSON nativo do Gemini com o esquema da campanha e, se o SDK ou a API
+    não o aceitarem, recorre à geração em texto com reparo do JSON. A resposta chega em
+    streaming (o primeiro trecho marca o tempo até o primeiro token no span da chamada).
+
     Args:
         prompt (str): O prompt a ser enviado para o modelo.
 
@@ -22,18 +67,51 @@ def generate_text_content(prompt: str) -> dict:
     model = genai.GenerativeModel('gemini-2.5-pro')
 
     try:
-        response = model.generate_content(str(prompt))
         try:
-            json_string = re.sub(r"```json\n|```", "", response.text.strip())
-            generated_content = json.loads(json_string)
-            return {"status": "success", "generated_content": generated_content}
-        except json.JSONDecodeError as e:
-            return {"status": "error", "message": f"Erro de decodificação JSON na resposta da IA: {e}. Resposta bruta: {response.text}"}
+            # Modo JSON nativo: a resposta já vem no formato do esquema da campanha.
+            text = collect_stream(model.generate_content(str(prompt), generation_config=_json_generation_config(), stream=True), _chunk_text)
+        except (TypeError, ValueError, google.api_core.exceptions.InvalidArgument) as e:
+            print(f"Saída estruturada indisponível no Gemini ({e}). Usando geração em texto.")
+            text = collect_stream(model.generate_content(str(prompt), stream=True), _chunk_text)
+        return _parse_text_response(text)
     except google.api_core.exceptions.GoogleAPIError as e:
         return {"status": "error", "message": f"Falha na API Google Gemini: {e}"}
     except Exception as e:
         return {"status": "error", "message": f"Erro inesperado ao gerar conteúdo de texto: {e}"}
 
+@circuit_breaker("gemini")
+@track_provider_call("gemini", "gemini-2.5-pro")
+async def generate_text_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_text_content` (cliente assíncrono do SDK do Gemini, em streaming).
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        dict: Um dicionário contendo o conteúdo gerado ou uma mensagem de erro.
+    """
+    model = genai.GenerativeModel('gemini-2.5-pro')
+
+    try:
+        try:
+            text = await with_timeout(collect_stream_async(
+                model.generate_content_async(str(prompt), generation_config=_json_generation_config(), stream=True), _chunk_text
+            ), timeout)
+        except (TypeError, ValueError, google.api_core.exceptions.InvalidArgument) as e:
+            print(f"Saída estruturada indisponível no Gemini ({e}). Usando geração em texto.")
+            text = await with_timeout(collect_stream_async(model.generate_content_async(str(prompt), stream=True), _chunk_text), timeout)
+        return _parse_text_response(text)
+    except asyncio.TimeoutError:
+        return {"status": "error", "message": f"Falha na API Google Gemini: tempo limite de {timeout}s excedido."}
+    except google.api_core.exceptions.GoogleAPIError as e:
+        return {"status": "error", "message": f"Falha na API Google Gemini: {e}"}
+    except Exception as e:
+        return {"status": "error", "message": f"Erro inesperado ao gerar conteúdo de texto: {e}"}
+
+@circuit_breaker("gemini", text_result=True)
+@track_provider_call("gemini", "gemini-2.5-pro")
 def generate_content(prompt: str) -> str:
     """
     Gera conteúdo de texto usando o modelo Gemini-Pro e retorna a resposta bruta.
@@ -57,6 +135,36 @@ def generate_content(prompt: str) -> str:
         print(f"Erro inesperado ao gerar conteúdo: {e}")
         return f"ERRO: {e}"
 
+@circuit_breaker("gemini", text_result=True)
+@track_provider_call("gemini", "gemini-2.5-pro")
+async def generate_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> str:
+    """
+    Versão assíncrona de `generate_content` (resposta bruta, usada no resumo de posts).
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        str: A resposta bruta do modelo.
+    """
+    model = genai.GenerativeModel('gemini-2.5-pro')
+
+    try:
+        response = await with_timeout(model.generate_content_async(str(prompt)), timeout)
+        return response.text.strip()
+    except asyncio.TimeoutError:
+        print(f"Falha na API Google Gemini: tempo limite de {timeout}s excedido.")
+        return f"ERRO: tempo limite de {timeout}s excedido."
+    except google.api_core.exceptions.GoogleAPIError as e:
+        print(f"Falha na API Google Gemini: {e}")
+        return f"ERRO: {e}"
+    except Exception as e:
+        print(f"Erro inesperado ao gerar conteúdo: {e}")
+        return f"ERRO: {e}"
+
+@circuit_breaker("gemini")
+@track_provider_call("gemini", "gemini-pro")
 def generate_image_description(prompt: str) -> dict:
     """
     Gera uma descrição de imagem/vídeo usando o modelo Gemini-Pro.
@@ -75,4 +183,29 @@ def generate_image_description(prompt: str) -> dict:
     except google.api_core.exceptions.GoogleAPIError as e:
         return {"status": "error", "message": f"Falha na API Google Gemini ao gerar descrição de imagem: {e}"}
     except Exception as e:
-        return {"status": "error", "message": f"Erro inesperado ao gerar descrição de imagem: {e}"}
\ No newline at end of file
+        return {"status": "error", "message": f"Erro inesperado ao gerar descrição de imagem: {e}"}
+
+@circuit_breaker("gemini")
+@track_provider_call("gemini", "gemini-pro")
+async def generate_image_description_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_image_description`.
+
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+
+    Returns:
+        dict: Um dicionário contendo a descrição gerada ou uma mensagem de erro.
+    """
+    model = genai.GenerativeModel('gemini-pro')
+
+    try:
+        response = await with_timeout(model.generate_content_async(prompt), timeout)
+        return {"status": "success", "visual_prompt": response.text}
+    except asyncio.TimeoutError:
+        return {"status": "error", "message": f"Falha na API Google Gemini ao gerar descrição de imagem: tempo limite de {timeout}s excedido."}
+    except google.api_core.exceptions.GoogleAPIError as e:
+        return {"status": "error", "message": f"Falha na API Google Gemini ao gerar descrição de imagem: {e}"}
+    except Exception as e:
+        return {"status": "error", "message": f"Erro inesperado ao gerar descrição de imagem: {e}"}
@@ -1,53 +1,103 @@
+import asyncio
 import os
-import json
-import re
 from datetime import datetime
 from dotenv import load_dotenv
 from mistralai import Mistral
+from mistralai.models import SDKError
+from src.llm_client.async_runtime import DEFAULT_TIMEOUT_SECONDS, get_async_client, with_timeout
+from src.llm_client.circuit_breaker import circuit_breaker, register_probe
+from src.llm_client.provider_health import track_provider_call
+from src.llm_client.streaming import collect_stream, collect_stream_async
+from src.utils.llm_output import build_response_schema, parse_llm_json
 import time
 
 load_dotenv()
 
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "campanha", "schema": build_response_schema("json_schema"), "strict": False},
+}
+
+
+def check_availability():
+    """
+    Chamada leve (lista de modelos) usada pelo circuit breaker para testar se a API voltou.
+    """
+    Mistral(api_key=os.getenv("MISTRAL_API_KEY"), timeout=30).models.list()
+
+register_probe("mistral", check_availability)
+
+
+def _async_client():
+    """Cliente da Mistral usado nas chamadas assíncronas, único no event loop (reaproveita as conexões)."""
+    return get_async_client("mistral", lambda: Mistral(api_key=os.getenv("MISTRAL_API_KEY"), timeout=300))
+
+
+def _is_structured_output_error(e: Exception) -> bool:
+    """Indica se o erro significa que o modo JSON não é aceito (e a geração em texto deve ser usada)."""
+    return not isinstance(e, SDKError) or e.status_code in (400, 422)
+
+
+def _event_text(event) -> str:
+    """Texto de um evento do chat em streaming (o trecho novo fica em `choices[0].delta.content`)."""
+    choices = event.data.choices
+    content = choices[0].delta.content if choices else None
+    return content if isinstance(content, str) else ""
+
+
+def _parse_text_response(content: str) -> dict:
+    """Decodifica (reparando, se preciso) o JSON da campanha; se falhar, salva a resposta bruta (sempre devolvida em "raw_text")."""
+    print(f"[{datetime.now()}] Tentando extrair e parsear JSON da resposta...")
+    parsed = parse_llm_json(content)
+    if parsed["status"] == "success":
+        if parsed["repairs"]:
+            print(f"[{datetime.now()}] JSON reparado: {'; '.join(parsed['repairs'])}")
+        print(f"[{datetime.now()}] JSON parseado com sucesso.")
+        return {"status": "success", "generated_content": parsed["generated_content"], "raw_text": content}
+
+    print(f"[{datetime.now()}] Erro ao parsear JSON: {parsed['message']}")
+    # Se ainda falhar, salvar para depuração
+    raw_responses_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'raw_mistral_responses')
+    os.makedirs(raw_responses_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = os.path.join(raw_responses_dir, f"mistral_raw_response_{timestamp}.txt")
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return {"status": "error", "error_type": "json", "message": f"JSON inválido após reparo. Resposta salva em: {filename}. Erro: {parsed['message']}", "raw_text": content}
+
+@circuit_breaker("mistral")
+@track_provider_call("mistral", "mistral-medium-latest")
 def generate_text_content(prompt: str) -> dict:
     client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"), timeout=300) # Aumentado timeout para 300 segundos (5 minutos)
     try:
         print(f"[{datetime.now()}] Chamando a API da Mistral para gerar conteúdo...")
-        response = client.chat.complete(
-            model="mistral-medium-latest",
-            messages=[{"role": "user", "content": prompt}]
-        )
+        try:
+            # Modo JSON nativo com o esquema da campanha, em streaming (primeiro trecho = primeiro token).
+            content = collect_stream(client.chat.stream(
+                model="mistral-medium-latest",
+                messages=[{"role": "user", "content": prompt}],
+                response_format=RESPONSE_FORMAT
+            ), _event_text)
+        except (TypeError, ValueError, SDKError) as e:
+            if not _is_structured_output_error(e):
+                raise
+            print(f"[{datetime.now()}] Saída estruturada indisponível na Mistral ({e}). Usando geração em texto.")
+            content = collect_stream(client.chat.stream(
+                model="mistral-medium-latest",
+                messages=[{"role": "user", "content": prompt}]
+            ), _event_text)
         print(f"[{datetime.now()}] Resposta da API da Mistral recebida. Iniciando processamento do conteúdo.")
-        content = response.choices[0].message.content.strip()
+        content = content.strip()
         print(f"[{datetime.now()}] Conteúdo bruto da resposta da API (primeiros 500 caracteres): {content[:500]}...")
 
-        # Tentar extrair o bloco JSON dentro de ```json ... ```
-        print(f"[{datetime.now()}] Tentando extrair e parsear JSON da resposta...")
-        json_match = re.search(r'```json\n([\s\S]*?)\n```', content, re.DOTALL)
-        if json_match:
-            json_string = json_match.group(1).strip()
-            print(f"[{datetime.now()}] String JSON extraída (primeiros 500 caracteres): {json_string[:500]}...")
-            try:
-                generated_content = json.loads(json_string)
-                print(f"[{datetime.now()}] JSON parseado com sucesso.")
-                return {"status": "success", "generated_content": generated_content}
-            except json.JSONDecodeError as e:
-                print(f"[{datetime.now()}] Erro ao parsear JSON: {e}")
-                # Se ainda falhar, salvar para depuração
-                raw_responses_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'raw_mistral_responses')
-                os.makedirs(raw_responses_dir, exist_ok=True)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = os.path.join(raw_responses_dir, f"mistral_raw_response_{timestamp}.txt")
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return {"status": "error", "message": f"JSON inválido após extração. Resposta salva em: {filename}. Erro: {e}"}
-        else:
-            print(f"[{datetime.now()}] Nenhum bloco JSON encontrado na resposta.")
-            return {"status": "error", "message": "Nenhum bloco JSON encontrado na resposta."}
+        return _parse_text_response(content)
 
     except Exception as e:
         print(f"[{datetime.now()}] Erro ao gerar conteúdo: {e}")
         return {"status": "error", "message": f"Erro ao gerar conteúdo: {e}"}
 
+@circuit_breaker("mistral")
+@track_provider_call("mistral", "mistral-medium-latest")
 def generate_image_description(prompt: str) -> dict:
     """
     Gera uma descrição de imagem/vídeo usando o modelo da Mistral AI.
@@ -68,3 +118,110 @@ def generate_image_description(prompt: str) -> dict:
     except Exception as e:
         print(f"[{datetime.now()}] Erro ao gerar descrição de imagem: {e}")
         return {"status": "error", "message": f"Erro ao gerar descrição de imagem: {e}"}
+
+@circuit_breaker("mistral", text_result=True)
+@track_provider_call("mistral", "mistral-medium-latest")
+def generate_content(prompt: str) -> str:
+    """
+    Gera conteúdo de texto usando o modelo da Mistral AI e retorna a resposta bruta.
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+    Returns:
+        str: A resposta bruta do modelo.
+    """
+    client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"), timeout=300)
+    try:
+        response = client.chat.complete(
+            model="mistral-medium-latest",
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print(f"[{datetime.now()}] Erro ao gerar conteúdo: {e}")
+        return f"ERRO: {e}"
+
+@circuit_breaker("mistral")
+@track_provider_call("mistral", "mistral-medium-latest")
+async def generate_text_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_text_content` (cliente assíncrono do SDK da Mistral, em streaming).
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+    Returns:
+        dict: Um dicionário contendo o conteúdo gerado ou uma mensagem de erro.
+    """
+    client = _async_client()
+    try:
+        try:
+            # Modo JSON nativo com o esquema da campanha, em streaming.
+            content = await with_timeout(collect_stream_async(client.chat.stream_async(
+                model="mistral-medium-latest",
+                messages=[{"role": "user", "content": prompt}],
+                response_format=RESPONSE_FORMAT
+            ), _event_text), timeout)
+        except (TypeError, ValueError, SDKError) as e:
+            if not _is_structured_output_error(e):
+                raise
+            print(f"[{datetime.now()}] Saída estruturada indisponível na Mistral ({e}). Usando geração em texto.")
+            content = await with_timeout(collect_stream_async(client.chat.stream_async(
+                model="mistral-medium-latest",
+                messages=[{"role": "user", "content": prompt}]
+            ), _event_text), timeout)
+        return _parse_text_response(content.strip())
+    except asyncio.TimeoutError:
+        print(f"[{datetime.now()}] Erro ao gerar conteúdo: tempo limite de {timeout}s excedido.")
+        return {"status": "error", "message": f"Erro ao gerar conteúdo: tempo limite de {timeout}s excedido."}
+    except Exception as e:
+        print(f"[{datetime.now()}] Erro ao gerar conteúdo: {e}")
+        return {"status": "error", "message": f"Erro ao gerar conteúdo: {e}"}
+
+@circuit_breaker("mistral", text_result=True)
+@track_provider_call("mistral", "mistral-medium-latest")
+async def generate_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> str:
+    """
+    Versão assíncrona de `generate_content` (resposta bruta).
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+    Returns:
+        str: A resposta bruta do modelo.
+    """
+    client = _async_client()
+    try:
+        response = await with_timeout(client.chat.complete_async(
+            model="mistral-medium-latest",
+            messages=[{"role": "user", "content": prompt}]
+        ), timeout)
+        return response.choices[0].message.content.strip()
+    except asyncio.TimeoutError:
+        print(f"[{datetime.now()}] Erro ao gerar conteúdo: tempo limite de {timeout}s excedido.")
+        return f"ERRO: tempo limite de {timeout}s excedido."
+    except Exception as e:
+        print(f"[{datetime.now()}] Erro ao gerar conteúdo: {e}")
+        return f"ERRO: {e}"
+
+@circuit_breaker("mistral")
+@track_provider_call("mistral", "mistral-medium-latest")
+async def generate_image_description_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """
+    Versão assíncrona de `generate_image_description`.
+    Args:
+        prompt (str): O prompt a ser enviado para o modelo.
+        timeout (float): Tempo máximo da chamada, em segundos (None = sem limite).
+    Returns:
+        dict: Um dicionário contendo a descrição gerada ou uma mensagem de erro.
+    """
+    client = _async_client()
+    try:
+        response = await with_timeout(client.chat.complete_async(
+            model="mistral-medium-latest",
+            messages=[{"role": "user", "content": prompt}]
+        ), timeout)
+        return {"status": "success", "visual_prompt": response.choices[0].message.content}
+    except asyncio.TimeoutError:
+        print(f"[{datetime.now()}] Erro ao gerar descrição de imagem: tempo limite de {timeout}s excedido.")
+        return {"status": "error", "message": f"Erro ao gerar descrição de imagem: tempo limite de {timeout}s excedido."}
+    except Exception as e:
+        print(f"[{datetime.now()}] Erro ao gerar descrição de imagem: {e}")
+        return {"status": "error", "message": f"Erro ao gerar descrição de imagem: {e}"}
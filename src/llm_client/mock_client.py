@@ -0,0 +1,244 @@
+"""
+Provedor de IA local, sem rede e sem custo, para testes de carga do pipeline.
+
+Implementa a mesma interface dos clientes em `src/llm_client/` e está registrado como o
+provedor "mock" em `src/llm_client/providers.py`. Dois modos:
+
+* "synthetic" (padrão): gera campanhas válidas no esquema com `build_synthetic_campaign`.
+* "replay": reproduz as respostas gravadas em `output_files/respostas_IA` (mesmo prompt,
+  mesma resposta).
+
+A resposta passa pelo mesmo parse/validação de JSON dos provedores reais. O provedor local
+não passa pelo circuit breaker nem pelo registro de saúde (tabelas `provider_circuits` e
+`provider_calls`): as falhas simuladas de um teste de carga não podem abrir o circuito das
+execuções seguintes nem misturar-se ao histórico dos provedores reais. O comportamento
+é configurado por variáveis de ambiente (herdadas pelas etapas do pipeline, que rodam como
+subprocessos) ou por `configure_mock` no próprio processo:
+
+    MOCK_LLM_MODE         "synthetic" ou "replay"
+    MOCK_LLM_REPLAY_DIR   diretório das respostas gravadas (padrão: output_files/respostas_IA)
+    MOCK_LLM_LATENCY      latência média de cada chamada, em segundos (padrão: 0)
+    MOCK_LLM_JITTER       variação máxima (+/-) da latência, em segundos (padrão: 0)
+    MOCK_LLM_ERROR_RATE   fração das chamadas que falham com erro de API, de 0 a 1 (padrão: 0)
+    MOCK_LLM_POSTS        quantidade de posts das campanhas sintéticas (padrão: 5)
+    MOCK_LLM_SEED         semente do gerador; com ela, latências, erros e campanhas se repetem
+                          a cada execução (na mesma ordem de chamadas); sem ela, o conteúdo
+                          depende só do prompt e latências/erros variam a cada chamada
+"""
+
+import asyncio
+import glob
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from functools import lru_cache
+
+from src.config import BASE_DIR
+from src.llm_client.async_runtime import DEFAULT_TIMEOUT_SECONDS, with_timeout
+from src.utils.benchmarks.synthetic_campaign import build_synthetic_campaign
+from src.utils.llm_output import parse_llm_json
+
+MOCK_MODEL = "mock-campaign"
+DEFAULT_REPLAY_DIR = os.path.join(BASE_DIR, "output_files", "respostas_IA")
+
+_overrides = {}
+_call_counter = itertools.count()
+
+
+def configure_mock(**settings):
+    """
+    Ajusta o provedor local no processo atual (tem prioridade sobre as variáveis de ambiente).
+
+    Args:
+        **settings: mode, replay_dir, latency, jitter, error_rate, posts, seed.
+                    Um valor None volta a usar a variável de ambiente.
+    """
+    global _call_counter
+    # Recomeça a sequência de sorteios: com semente, cada execução repete latências e erros
+    _call_counter = itertools.count()
+    for key, value in settings.items():
+        if value is None:
+            _overrides.pop(key, None)
+        else:
+            _overrides[key] = value
+
+
+def get_mock_config() -> dict:
+    """Configuração efetiva do provedor local (ajustes de `configure_mock` ou variáveis de ambiente)."""
+    seed = _overrides.get("seed", os.getenv("MOCK_LLM_SEED"))
+    return {
+        "mode": _overrides.get("mode", os.getenv("MOCK_LLM_MODE", "synthetic")).lower(),
+        "replay_dir": _overrides.get("replay_dir", os.getenv("MOCK_LLM_REPLAY_DIR", DEFAULT_REPLAY_DIR)),
+        "latency": float(_overrides.get("latency", os.getenv("MOCK_LLM_LATENCY", 0))),
+        "jitter": float(_overrides.get("jitter", os.getenv("MOCK_LLM_JITTER", 0))),
+        "error_rate": float(_overrides.get("error_rate", os.getenv("MOCK_LLM_ERROR_RATE", 0))),
+        "posts": int(_overrides.get("posts", os.getenv("MOCK_LLM_POSTS", 5))),
+        "seed": None if seed in (None, "") else int(seed),
+    }
+
+
+@lru_cache(maxsize=4)
+def _load_recorded_responses(replay_dir: str) -> tuple:
+    """Lê (uma vez por diretório) as respostas gravadas, em ordem estável de arquivo."""
+    responses = []
+    for filepath in sorted(glob.glob(os.path.join(replay_dir, "**", "*.json"), recursive=True)):
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                responses.append(f.read())
+        except OSError as e:
+            print(f"Aviso: resposta gravada ignorada ({filepath}): {e}")
+    return tuple(responses)
+
+
+def _prompt_seed(prompt: str, config: dict) -> int:
+    """Semente da chamada: a configurada ou uma derivada do prompt (mesmo prompt, mesma resposta)."""
+    if config["seed"] is not None:
+        return config["seed"]
+    return int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12], 16)
+
+
+def _plan_call(prompt: str) -> tuple:
+    """
+    Sorteia a latência e a falha da chamada antes de esperar.
+
+    Returns:
+        tuple: (configuração, latência em segundos, mensagem de erro ou None)
+    """
+    config = get_mock_config()
+    call_number = next(_call_counter)
+    if config["seed"] is not None:
+        rng = random.Random(config["seed"] * 1_000_003 + call_number)
+    else:
+        rng = random.Random(_prompt_seed(prompt, config) ^ time.perf_counter_ns())
+    delay = max(0.0, config["latency"] + rng.uniform(-config["jitter"], config["jitter"]))
+    error = None
+    if config["error_rate"] and rng.random() < config["error_rate"]:
+        error = f"Erro simulado pelo provedor local (taxa de erro {config['error_rate']:.0%})"
+    return config, delay, error
+
+
+def _campaign_text(prompt: str, config: dict) -> str:
+    """Texto JSON da campanha: uma resposta gravada (modo replay) ou uma campanha sintética."""
+    if config["mode"] == "replay":
+        responses = _load_recorded_responses(config["replay_dir"])
+        if not responses:
+            raise FileNotFoundError(f"Nenhuma resposta gravada em {config['replay_dir']}.")
+        return responses[_prompt_seed(prompt, config) % len(responses)]
+    campaign = build_synthetic_campaign(config["posts"], seed=_prompt_seed(prompt, config))
+    return json.dumps(campaign, ensure_ascii=False)
+
+
+def _text_response(prompt: str, config: dict) -> dict:
+    text = _campaign_text(prompt, config)
+    parsed = parse_llm_json(text)
+    if parsed["status"] == "error":
+        return {"status": "error", "error_type": "json", "message": parsed["message"], "raw_text": text}
+    return {"status": "success", "generated_content": parsed["generated_content"], "raw_text": text}
+
+
+def _visual_prompt(prompt: str, config: dict) -> str:
+    rng = random.Random(_prompt_seed(prompt, config))
+    words = prompt.split()
+    return "Imagem de estúdio, luz natural, cores da marca: " + " ".join(rng.sample(words, min(len(words), 20)))
+
+
+def generate_text_content(prompt: str) -> dict:
+    """
+    Gera uma campanha localmente, simulando a latência e a taxa de erro configuradas.
+
+    Args:
+        prompt (str): O prompt (define a campanha gerada ou a resposta gravada reproduzida).
+
+    Returns:
+        dict: Um dicionário contendo o conteúdo gerado ou uma mensagem de erro.
+    """
+    config, delay, error = _plan_call(prompt)
+    time.sleep(delay)
+    if error:
+        return {"status": "error", "error_type": "api", "message": error}
+    try:
+        return _text_response(prompt, config)
+    except Exception as e:
+        return {"status": "error", "error_type": "api", "message": f"Erro no provedor local: {e}"}
+
+
+def generate_content(prompt: str) -> str:
+    """
+    Gera o texto bruto (JSON) de uma campanha localmente.
+
+    Args:
+        prompt (str): O prompt a ser "enviado".
+
+    Returns:
+        str: O texto gerado, ou uma mensagem iniciada por "ERRO:".
+    """
+    config, delay, error = _plan_call(prompt)
+    time.sleep(delay)
+    if error:
+        return f"ERRO: {error}"
+    try:
+        return _campaign_text(prompt, config)
+    except Exception as e:
+        return f"ERRO: Erro no provedor local: {e}"
+
+
+def generate_image_description(prompt: str) -> dict:
+    """
+    Gera localmente uma descrição visual a partir do prompt.
+
+    Args:
+        prompt (str): O prompt de imagem.
+
+    Returns:
+        dict: Um dicionário contendo o prompt visual gerado ou uma mensagem de erro.
+    """
+    config, delay, error = _plan_call(prompt)
+    time.sleep(delay)
+    if error:
+        return {"status": "error", "error_type": "api", "message": error}
+    return {"status": "success", "visual_prompt": _visual_prompt(prompt, config)}
+
+
+async def generate_text_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """Variante assíncrona de `generate_text_content` (a latência não bloqueia o event loop)."""
+    config, delay, error = _plan_call(prompt)
+    try:
+        await with_timeout(asyncio.sleep(delay), timeout)
+    except asyncio.TimeoutError:
+        return {"status": "error", "error_type": "api", "message": f"Tempo limite de {timeout}s excedido no provedor local."}
+    if error:
+        return {"status": "error", "error_type": "api", "message": error}
+    try:
+        return _text_response(prompt, config)
+    except Exception as e:
+        return {"status": "error", "error_type": "api", "message": f"Erro no provedor local: {e}"}
+
+
+async def generate_content_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> str:
+    """Variante assíncrona de `generate_content`."""
+    config, delay, error = _plan_call(prompt)
+    try:
+        await with_timeout(asyncio.sleep(delay), timeout)
+    except asyncio.TimeoutError:
+        return f"ERRO: Tempo limite de {timeout}s excedido no provedor local."
+    if error:
+        return f"ERRO: {error}"
+    try:
+        return _campaign_text(prompt, config)
+    except Exception as e:
+        return f"ERRO: Erro no provedor local: {e}"
+
+
+async def generate_image_description_async(prompt: str, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> dict:
+    """Variante assíncrona de `generate_image_description`."""
+    config, delay, error = _plan_call(prompt)
+    try:
+        await with_timeout(asyncio.sleep(delay), timeout)
+    except asyncio.TimeoutError:
+        return {"status": "error", "error_type": "api", "message": f"Tempo limite de {timeout}s excedido no provedor local."}
+    if error:
+        return {"status": "error", "error_type": "api", "message": error}
+    return {"status": "success", "visual_prompt": _visual_prompt(prompt, config)}
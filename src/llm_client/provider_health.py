@@ -0,0 +1,186 @@
+"""
+Registro de saúde dos provedores de IA.
+
+Cada chamada feita pelos clientes em `src/llm_client/` é registrada na tabela
+`provider_calls`. A partir das chamadas mais recentes são calculadas a latência
+p50/p95, a taxa de erro da API e a taxa de falha de decodificação do JSON, usadas
+para priorizar provedores saudáveis e pular os degradados. Como o pipeline roda cada
+etapa em um subprocesso, o histórico fica no banco para ser compartilhado entre eles.
+"""
+
+import asyncio
+import inspect
+import os
+import time
+from functools import wraps
+
+from src.utils.data_storage import insert_provider_call, get_recent_provider_calls, get_provider_circuit
+
+PROVIDERS = ("gemini", "cohere", "mistral")
+
+# Janela deslizante usada nas estatísticas.
+HEALTH_WINDOW_CALLS = 20
+HEALTH_WINDOW_MINUTES = 60
+
+# Limites a partir dos quais um provedor é considerado degradado.
+MIN_CALLS_FOR_HEALTH = 3
+MAX_ERROR_RATE = 0.5
+MAX_PARSE_FAILURE_RATE = 0.5
+MAX_P95_LATENCY_SECONDS = 240
+
+# Variável de ambiente com os provedores pulados pelo pipeline (ex: "cohere,mistral").
+SKIPPED_PROVIDERS_ENV = "SKIPPED_PROVIDERS"
+
+
+def classify_result(result):
+    """Retorna (status, error_type) a partir do retorno de uma função de cliente."""
+    if isinstance(result, dict):
+        if result.get("status") == "error":
+            return "error", result.get("error_type", "api")
+        return "success", None
+    if isinstance(result, str) and result.startswith("ERRO:"):
+        return "error", "api"
+    return "success", None
+
+
+def record_provider_call(provider: str, model: str, operation: str, status: str, latency_seconds: float, error_type: str = None):
+    """Registra uma chamada sem nunca interromper a geração em caso de falha no banco."""
+    try:
+        insert_provider_call(provider, model, operation, status, latency_seconds, error_type)
+    except Exception as e:
+        print(f"Aviso: não foi possível registrar a chamada ao provedor {provider}: {e}")
+
+
+def track_provider_call(provider: str, model: str):
+    """
+    Decorador que mede e registra cada chamada de uma função de cliente de IA
+    (síncrona ou assíncrona; chamadas canceladas não são registradas).
+
+    Args:
+        provider (str): Nome do provedor (ex: "gemini").
+        model (str): Modelo usado pela função decorada.
+    """
+    def decorator(func):
+        def record(latency, result):
+            status, error_type = classify_result(result)
+            record_provider_call(provider, model, func.__name__, status, latency, error_type)
+
+        if inspect.iscoroutinefunction(func):
+            # A gravação no banco roda em uma thread, sem bloquear o event loop compartilhado
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started_at = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception:
+                    await asyncio.to_thread(record_provider_call, provider, model, func.__name__, "error",
+                                            time.perf_counter() - started_at, "api")
+                    raise
+                await asyncio.to_thread(record, time.perf_counter() - started_at, result)
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                record_provider_call(provider, model, func.__name__, "error", time.perf_counter() - started_at, "api")
+                raise
+            record(time.perf_counter() - started_at, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _percentile(values: list, percentile: float) -> float:
+    """Percentil por interpolação linear (values não precisa estar ordenado)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percentile
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def get_provider_health(provider: str) -> dict:
+    """
+    Calcula as estatísticas de saúde de um provedor na janela deslizante.
+
+    Args:
+        provider (str): Nome do provedor.
+
+    Returns:
+        dict: {"provider", "calls", "p50_latency", "p95_latency", "error_rate",
+               "parse_failure_rate", "degraded", "reason"}.
+    """
+    calls = get_recent_provider_calls(provider, HEALTH_WINDOW_CALLS, HEALTH_WINDOW_MINUTES)
+    total = len(calls)
+    latencies = [call["latency_seconds"] for call in calls if call["status"] == "success" and call["latency_seconds"] is not None]
+    api_errors = sum(1 for call in calls if call["status"] == "error" and call["error_type"] != "json")
+    parse_failures = sum(1 for call in calls if call["status"] == "error" and call["error_type"] == "json")
+
+    health = {
+        "provider": provider,
+        "calls": total,
+        "p50_latency": _percentile(latencies, 0.5),
+        "p95_latency": _percentile(latencies, 0.95),
+        "error_rate": api_errors / total if total else 0.0,
+        "parse_failure_rate": parse_failures / total if total else 0.0,
+        "degraded": False,
+        "reason": None,
+    }
+
+    circuit = get_provider_circuit(provider)
+    if circuit and circuit["state"] != "closed":
+        health["reason"] = "circuit breaker aberto"
+        health["degraded"] = True
+    elif total >= MIN_CALLS_FOR_HEALTH:
+        if health["error_rate"] > MAX_ERROR_RATE:
+            health["reason"] = f"taxa de erro de {health['error_rate']:.0%}"
+        elif health["parse_failure_rate"] > MAX_PARSE_FAILURE_RATE:
+            health["reason"] = f"taxa de falha de JSON de {health['parse_failure_rate']:.0%}"
+        elif health["p95_latency"] is not None and health["p95_latency"] > MAX_P95_LATENCY_SECONDS:
+            health["reason"] = f"latência p95 de {health['p95_latency']:.0f}s"
+        health["degraded"] = health["reason"] is not None
+
+    return health
+
+
+def is_provider_degraded(provider: str) -> bool:
+    """Indica se o provedor está degradado segundo as chamadas recentes."""
+    return get_provider_health(provider)["degraded"]
+
+
+def rank_providers(providers: list = PROVIDERS) -> list:
+    """
+    Ordena os provedores do mais para o menos indicado.
+
+    Provedores saudáveis vêm primeiro, do mais rápido (menor p50) para o mais lento;
+    provedores sem histórico ficam logo após os saudáveis medidos; os degradados vêm
+    por último, do menor para o maior número de erros.
+
+    Args:
+        providers (list): Nomes dos provedores a ordenar.
+
+    Returns:
+        list: Os estados de saúde (como em `get_provider_health`), já ordenados.
+    """
+    health = [get_provider_health(provider) for provider in providers]
+
+    def sort_key(item):
+        if item["degraded"]:
+            return (2, item["error_rate"] + item["parse_failure_rate"], 0.0)
+        if item["p50_latency"] is None:
+            return (1, 0.0, 0.0)
+        return (0, item["p50_latency"], item["error_rate"])
+
+    return sorted(health, key=sort_key)
+
+
+def get_skipped_providers() -> set:
+    """Retorna os provedores marcados como pulados pelo pipeline (variável SKIPPED_PROVIDERS)."""
+    value = os.getenv(SKIPPED_PROVIDERS_ENV, "")
+    return {name.strip().lower() for name in value.split(",") if name.strip()}
@@ -0,0 +1,199 @@
+"""
+Abstração dos provedores de IA usados na geração de campanhas.
+
+Cada provedor é descrito uma única vez: módulo do cliente em `src/llm_client/`, método do
+PromptManager que monta o prompt, modelo e capacidades (streaming, modo JSON, lotes,
+chamadas assíncronas e tabela de custo). O pipeline de geração recebe o provedor como
+parâmetro, então cache, retentativas ou qualquer otimização feita no pipeline vale para
+todos os modelos. O módulo do cliente só é importado na primeira chamada, de modo que a
+falta do SDK de um provedor não impede o uso dos demais.
+"""
+
+import importlib
+from dataclasses import dataclass
+
+from src.llm_client.cassettes import call_with_cassette, call_with_cassette_async, get_cassette_mode
+from src.utils.tracing import trace_span
+
+
+@dataclass(frozen=True)
+class ProviderCapabilities:
+    """O que o provedor suporta e quanto custa (USD por 1.000 tokens estimados)."""
+    streaming: bool = False
+    json_mode: bool = False
+    batching: bool = False
+    async_calls: bool = True
+    input_cost_per_1k_tokens: float = 0.0002
+    output_cost_per_1k_tokens: float = 0.0
+
+
+@dataclass(frozen=True)
+class LLMProvider:
+    """
+    Um provedor de IA e a forma de chamá-lo.
+
+    Attributes:
+        name (str): Identificador usado no código e no banco (ex: "gemini").
+        display_name (str): Nome exibido e usado nos diretórios de saída (ex: "Gemini").
+        module_name (str): Módulo do cliente, com as funções `generate_text_content`,
+                           `generate_content`, `generate_image_description` e suas variantes `*_async`.
+        prompt_builder (str): Método do PromptManager que monta o prompt da campanha.
+        model (str): Modelo principal do provedor.
+        capabilities (ProviderCapabilities): Capacidades e tabela de custo.
+        local (bool): True para provedores que rodam na máquina, sem rede (ex: o provedor "mock"
+                      usado em testes de carga); ficam fora da corrida e da escolha automática.
+    """
+    name: str
+    display_name: str
+    module_name: str
+    prompt_builder: str
+    model: str
+    capabilities: ProviderCapabilities = ProviderCapabilities()
+    local: bool = False
+
+    @property
+    def client(self):
+        """Módulo do cliente (importado na primeira chamada)."""
+        return importlib.import_module(self.module_name)
+
+    def build_prompt(self, prompt_manager, reused_sections: dict = None, **kwargs) -> str:
+        """
+        Monta o prompt da campanha com o método do PromptManager deste provedor.
+
+        Args:
+            prompt_manager (PromptManager): O gerenciador de prompts do cliente.
+            reused_sections (dict): Seções reaproveitadas (só o prompt do Gemini as omite;
+                                    os demais prompts não pedem essas seções).
+            **kwargs: content_type, weekly_themes, weekly_goal, campaign_type, strategic_analysis.
+        """
+        if self.prompt_builder == "build_prompt":
+            kwargs["reused_sections"] = reused_sections
+        return getattr(prompt_manager, self.prompt_builder)(**kwargs)
+
+    def estimate_cost(self, input_tokens: int, output_tokens: int = 0) -> float:
+        """Custo estimado em USD segundo a tabela de custo do provedor."""
+        return (input_tokens / 1000) * self.capabilities.input_cost_per_1k_tokens + \
+               (output_tokens / 1000) * self.capabilities.output_cost_per_1k_tokens
+
+    # As chamadas passam pelos cassetes (gravação/reprodução, ver src/llm_client/cassettes.py);
+    # com os cassetes desligados, vão direto ao cliente. Cada chamada é um span "llm.call".
+    def _call(self, operation: str, prompt: str, call):
+        with trace_span("llm.call", **self._span_attributes(operation, prompt)) as span:
+            response = call_with_cassette(self, operation, prompt, call)
+            self._finish_span(span, response)
+            return response
+
+    async def _call_async(self, operation: str, prompt: str, call):
+        with trace_span("llm.call", **self._span_attributes(operation, prompt)) as span:
+            response = await call_with_cassette_async(self, operation, prompt, call)
+            self._finish_span(span, response)
+            return response
+
+    def _span_attributes(self, operation: str, prompt: str) -> dict:
+        return {"llm.provider": self.name, "llm.model": self.model, "llm.operation": operation,
+                "llm.cassette_mode": get_cassette_mode(), "llm.estimated_input_tokens": len(prompt.split())}
+
+    @staticmethod
+    def _finish_span(span, response):
+        # `llm.time_to_first_token_seconds` é marcado pelos clientes com streaming ao receber o
+        # primeiro trecho (`src/llm_client/streaming.py`); sem streaming o atributo não existe.
+        failed = response.get("status") == "error" if isinstance(response, dict) else str(response).startswith("ERRO")
+        if failed:
+            span.set_error(response.get("message", "Erro") if isinstance(response, dict) else str(response)[:200])
+
+    def generate_text_content(self, prompt: str) -> dict:
+        return self._call("generate_text_content", prompt, lambda: self.client.generate_text_content(prompt))
+
+    def generate_content(self, prompt: str) -> str:
+        return self._call("generate_content", prompt, lambda: self.client.generate_content(prompt))
+
+    def generate_image_description(self, prompt: str) -> dict:
+        return self._call("generate_image_description", prompt, lambda: self.client.generate_image_description(prompt))
+
+    async def generate_text_content_async(self, prompt: str, **kwargs) -> dict:
+        return await self._call_async("generate_text_content", prompt, lambda: self.client.generate_text_content_async(prompt, **kwargs))
+
+    async def generate_content_async(self, prompt: str, **kwargs) -> str:
+        return await self._call_async("generate_content", prompt, lambda: self.client.generate_content_async(prompt, **kwargs))
+
+    async def generate_image_description_async(self, prompt: str, **kwargs) -> dict:
+        return await self._call_async("generate_image_description", prompt, lambda: self.client.generate_image_description_async(prompt, **kwargs))
+
+
+# Os custos são as estimativas usadas até aqui no pipeline (0,0002 USD por 1.000 tokens de entrada).
+_PROVIDERS = {
+    provider.name: provider for provider in (
+        LLMProvider(
+            name="gemini",
+            display_name="Gemini",
+            module_name="src.llm_client.gemini_client",
+            prompt_builder="build_prompt",
+            model="gemini-2.5-pro",
+            capabilities=ProviderCapabilities(streaming=True, json_mode=True, batching=True),
+        ),
+        LLMProvider(
+            name="cohere",
+            display_name="Cohere",
+            module_name="src.llm_client.cohere_client",
+            prompt_builder="build_prompt_cohere",
+            model="command-r-plus-08-2024",
+            capabilities=ProviderCapabilities(streaming=True, json_mode=True),
+        ),
+        LLMProvider(
+            name="mistral",
+            display_name="Mistral",
+            module_name="src.llm_client.mistral_client",
+            prompt_builder="build_prompt_cohere",
+            model="mistral-medium-latest",
+            capabilities=ProviderCapabilities(streaming=True, json_mode=True, batching=True),
+        ),
+        # Provedor local para testes de carga (ver src/llm_client/mock_client.py)
+        LLMProvider(
+            name="mock",
+            display_name="Mock",
+            module_name="src.llm_client.mock_client",
+            prompt_builder="build_prompt",
+            model="mock-campaign",
+            capabilities=ProviderCapabilities(json_mode=True, batching=True, input_cost_per_1k_tokens=0.0),
+            local=True,
+        ),
+    )
+}
+
+
+def register_provider(provider: LLMProvider):
+    """
+    Registra (ou substitui) um provedor, tornando-o disponível para todo o pipeline.
+
+    Args:
+        provider (LLMProvider): O provedor a registrar.
+    """
+    _PROVIDERS[provider.name] = provider
+
+
+def get_provider(provider) -> LLMProvider:
+    """
+    Retorna o provedor pelo nome (sem diferenciar maiúsculas).
+
+    Args:
+        provider (str | LLMProvider): Nome do provedor (ex: "gemini") ou o próprio provedor.
+
+    Raises:
+        ValueError: Se o provedor não estiver registrado.
+    """
+    if isinstance(provider, LLMProvider):
+        return provider
+    try:
+        return _PROVIDERS[str(provider).lower()]
+    except KeyError:
+        raise ValueError(f"Provedor de IA desconhecido: '{provider}'. Disponíveis: {', '.join(_PROVIDERS)}.")
+
+
+def list_providers(include_local: bool = False) -> list:
+    """
+    Nomes dos provedores registrados, na ordem de registro.
+
+    Args:
+        include_local (bool): Se True, inclui os provedores locais (ex: "mock").
+    """
+    return [name for name, provider in _PROVIDERS.items() if include_local or not provider.local]
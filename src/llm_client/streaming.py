@@ -0,0 +1,53 @@
+"""
+Leitura das respostas em streaming dos SDKs das IAs.
+
+Nas campanhas (`generate_text_content` e `generate_text_content_async`), os clientes pedem
+a resposta em trechos: a chegada do primeiro trecho marca o tempo até o primeiro token no
+span `llm.call` atual (`record_first_token`) e o texto completo, montado aqui, segue para
+`parse_llm_json` como antes.
+"""
+
+from src.utils.tracing import record_first_token
+
+
+def collect_stream(chunks, chunk_text) -> str:
+    """
+    Consome uma resposta em streaming e devolve o texto completo.
+
+    Args:
+        chunks: Iterável de trechos devolvido pelo SDK.
+        chunk_text (callable): Extrai o texto de um trecho (None ou "" para trechos sem texto,
+                               como eventos de início e fim).
+
+    Returns:
+        str: O texto completo da resposta.
+    """
+    parts = []
+    for chunk in chunks:
+        text = chunk_text(chunk)
+        if text:
+            record_first_token()
+            parts.append(text)
+    return "".join(parts)
+
+
+async def collect_stream_async(chunks, chunk_text) -> str:
+    """
+    Variante assíncrona de `collect_stream`.
+
+    Args:
+        chunks: Iterável assíncrono de trechos (ou corrotina que o devolve).
+        chunk_text (callable): Extrai o texto de um trecho.
+
+    Returns:
+        str: O texto completo da resposta.
+    """
+    if hasattr(chunks, "__await__"):
+        chunks = await chunks
+    parts = []
+    async for chunk in chunks:
+        text = chunk_text(chunk)
+        if text:
+            record_first_token()
+            parts.append(text)
+    return "".join(parts)
@@ -8,9 +8,9 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.utils.prompt_manager.build_mistral_prompt import build_mistral_prompt
-from src.llm_client.mistral_client import generate_text_content
-from src.utils.html_generator.create_briefing_html import create_briefing_html
-from src.utils.pdf_generator.create_briefing_pdf import create_briefing_pdf
+from src.llm_client.providers import get_provider
+from src.utils.document_renderer import render_briefing_documents
+from src.utils.llm_output.campaign_model import build_campaign
 from src.utils.prompt_manager.analyze_briefing_for_strategy import analyze_briefing_for_strategy
 
 def find_latest_summary_file(directory):
@@ -141,9 +141,9 @@ def main():
         f.write(prompt)
     print(f"Prompt salvo em: {prompt_filename}")
     
-    # Chamar a API da Mistral
+    # Chamar a API da Mistral (pelo provedor: cassetes, tracing e demais camadas valem aqui também)
     print("Chamando a API da Mistral...")
-    response = generate_text_content(prompt)
+    response = get_provider("mistral").generate_text_content(prompt)
     
     # Verificar se a resposta foi bem-sucedida
     if response["status"] == "success":
@@ -157,32 +157,35 @@ def main():
         html_filename = briefings_dir / f"Relatorio-de-Postagem_{client_name}_{timestamp}.html"
         pdf_filename = briefings_dir / f"Relatorio-de-Postagem_{client_name}_{timestamp}.pdf"
         
-        try:
-            # Gerar HTML
-            create_briefing_html(
-                content_json=response["generated_content"],
-                client_name=client_profile.get("nome_do_cliente", "Cliente"),
-                output_filename=str(html_filename)
-            )
+        # Gerar HTML e PDF ao mesmo tempo (o PDF é renderizado em um processo separado),
+        # ambos a partir da mesma campanha validada uma única vez
+        campaign = build_campaign(response["generated_content"])
+        result = render_briefing_documents(
+            pdf_kwargs={
+                "content_json": campaign,
+                "client_name": client_profile.get("nome_do_cliente", "Cliente"),
+                "output_filename": str(pdf_filename),
+                "model_name": "Mistral",
+                "target_audience": publico_alvo,
+                "tone_of_voice": tom_de_voz,
+                "marketing_objectives": objetivos_de_marketing,
+                "suggested_metrics": campaign.suggested_metrics
+            },
+            html_kwargs={
+                "content_json": campaign,
+                "client_name": client_profile.get("nome_do_cliente", "Cliente"),
+                "output_filename": str(html_filename)
+            }
+        )
+        if result["html"]["status"] == "success":
             print(f"HTML gerado em: {html_filename}")
-            
-            # Gerar PDF
-            create_briefing_pdf(
-                content_json=response["generated_content"],
-                client_name=client_profile.get("nome_do_cliente", "Cliente"),
-                output_filename=str(pdf_filename),
-                model_name="Mistral",
-                target_audience=publico_alvo,
-                tone_of_voice=tom_de_voz,
-                marketing_objectives=objetivos_de_marketing,
-                suggested_metrics=response["generated_content"].get("metricas_de_sucesso_sugeridas", {})
-            )
+        if result["pdf"]["status"] == "success":
             print(f"PDF gerado em: {pdf_filename}")
-            
+
+        if result["status"] == "success":
             print("Processo concluído com sucesso!")
-            
-        except Exception as e:
-            print(f"Erro ao gerar HTML/PDF: {e}")
+        else:
+            print("Erro ao gerar HTML/PDF.")
     else:
         print(f"Erro na resposta da IA: {response['message']}")
 
@@ -0,0 +1,11 @@
+from src.utils.main_functions.run_generation_pipeline import run_generation_pipeline
+
+def main():
+    """
+    Executa o fluxo do Concierge MVP (briefing, geração de conteúdo, DB, PDF e HTML)
+    com o provedor local "mock", sem rede e sem custo (ver src/llm_client/mock_client.py).
+    """
+    run_generation_pipeline("mock")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from src.content_generator_race import RACE_PROVIDER
+from src.utils.main_functions.run_generation_pipeline import run_generation_pipeline
+
+def main():
+    """
+    Executa o fluxo do Concierge MVP no modo corrida: o briefing é enviado aos provedores
+    ao mesmo tempo e a primeira resposta válida é usada para salvar no DB e gerar PDF/HTML.
+    """
+    run_generation_pipeline(RACE_PROVIDER)
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ import os
 import sys
 from datetime import datetime
 
+from src.llm_client.provider_health import get_skipped_providers
+
 def find_latest_posts_file(directory):
     """
     Encontra o arquivo de posts mais recente em um diretório.
@@ -142,29 +144,31 @@ def process_pre_summarized_file(ia_name, posts_dir, summary_output_dir):
 def combine_summaries(gemini_summary_path, cohere_summary_path):
     """
     Combina os resumos da Gemini e Cohere em um único JSON.
+    Um dos caminhos pode ser None quando o provedor foi pulado nesta execução.
     
     Args:
-        gemini_summary_path (str): Caminho do arquivo de resumo da Gemini
-        cohere_summary_path (str): Caminho do arquivo de resumo da Cohere
+        gemini_summary_path (str): Caminho do arquivo de resumo da Gemini (ou None)
+        cohere_summary_path (str): Caminho do arquivo de resumo da Cohere (ou None)
     
     Returns:
         str: Caminho do arquivo combinado ou None se ocorrer um erro
     """
     try:
-        # Carregar os resumos
-        gemini_data = load_posts_data(gemini_summary_path)
-        cohere_data = load_posts_data(cohere_summary_path)
+        # Carregar os resumos disponíveis
+        summaries = {}
+        for ia_key, summary_path in (("gemini", gemini_summary_path), ("cohere", cohere_summary_path)):
+            if summary_path is None:
+                continue
+            data = load_posts_data(summary_path)
+            if not data:
+                return None
+            summaries[ia_key] = data.get("posts", [])
         
-        if not gemini_data or not cohere_data:
+        if not summaries:
             return None
         
         # Criar estrutura do JSON combinado
-        combined_data = {
-            "resumos": {
-                "gemini": gemini_data.get("posts", []),
-                "cohere": cohere_data.get("posts", [])
-            }
-        }
+        combined_data = {"resumos": summaries}
         
         # Criar diretório para o JSON combinado
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -203,21 +207,32 @@ def main():
     cohere_posts_dir = os.path.join(base_dir, "output_files", "respostas_IA", "Cohere", "Resumo")
     cohere_summary_output_dir = os.path.join(base_dir, "output_files", "Resumo", "Cohere")
 
+    # Provedores pulados pelo pipeline (degradados) não entram no resumo combinado
+    skipped_providers = get_skipped_providers()
+
     # Processar arquivo pré-resumido da Gemini
-    gemini_summary_path = process_pre_summarized_file("Gemini", gemini_posts_dir, gemini_summary_output_dir)
-    if gemini_summary_path:
-        print(f"Resumo da Gemini processado com sucesso: {gemini_summary_path}")
+    gemini_summary_path = None
+    if "gemini" in skipped_providers:
+        print("Gemini pulada nesta execução (provedor degradado).")
     else:
-        print("Falha ao processar resumo da Gemini")
-        return
+        gemini_summary_path = process_pre_summarized_file("Gemini", gemini_posts_dir, gemini_summary_output_dir)
+        if gemini_summary_path:
+            print(f"Resumo da Gemini processado com sucesso: {gemini_summary_path}")
+        else:
+            print("Falha ao processar resumo da Gemini")
+            return
 
     # Processar arquivo pré-resumido da Cohere
-    cohere_summary_path = process_pre_summarized_file("Cohere", cohere_posts_dir, cohere_summary_output_dir)
-    if cohere_summary_path:
-        print(f"Resumo da Cohere processado com sucesso: {cohere_summary_path}")
+    cohere_summary_path = None
+    if "cohere" in skipped_providers:
+        print("Cohere pulada nesta execução (provedor degradado).")
     else:
-        print("Falha ao processar resumo da Cohere")
-        return
+        cohere_summary_path = process_pre_summarized_file("Cohere", cohere_posts_dir, cohere_summary_output_dir)
+        if cohere_summary_path:
+            print(f"Resumo da Cohere processado com sucesso: {cohere_summary_path}")
+        else:
+            print("Falha ao processar resumo da Cohere")
+            return
 
     # Combinar os resumos em um único JSON
     combined_path = combine_summaries(gemini_summary_path, cohere_summary_path)
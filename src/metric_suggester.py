@@ -1,5 +1,6 @@
 import json
-import os
+
+from src.utils.metrics_catalog import find_campaign_metrics, get_metrics_catalog
 
 def suggest_metrics(campaign_type: str, objetivos_de_marketing: str) -> dict:
     """
@@ -12,17 +13,7 @@ def suggest_metrics(campaign_type: str, objetivos_de_marketing: str) -> dict:
     Returns:
         dict: Um dicionário contendo as métricas de sucesso sugeridas, formatado para inclusão no JSON final.
     """
-    script_dir = os.path.dirname(__file__)
-    metricas_map_path = os.path.join(script_dir, "metricas_map.json")
-
-    try:
-        with open(metricas_map_path, 'r', encoding='utf-8') as f:
-            metricas_map = json.load(f)
-    except FileNotFoundError:
-        print(f"Erro: O arquivo {metricas_map_path} não foi encontrado.")
-        return {}
-    except json.JSONDecodeError:
-        print(f"Erro: O arquivo {metricas_map_path} não é um JSON válido.")
+    if not get_metrics_catalog():
         return {}
 
     suggested_metrics = {
@@ -31,10 +22,14 @@ def suggest_metrics(campaign_type: str, objetivos_de_marketing: str) -> dict:
         "metricas_secundarias": []
     }
 
-    if campaign_type in metricas_map:
-        campaign_data = metricas_map[campaign_type]
-        suggested_metrics["indicadores_chave"] = campaign_data.get("metricas_principais", [])
-        suggested_metrics["metricas_secundarias"] = campaign_data.get("metricas_secundarias", [])
+    # Catálogo carregado uma única vez (recarregado só se o arquivo mudar), com busca tolerante
+    matched_type, campaign_data = find_campaign_metrics(campaign_type)
+    if campaign_data is not None:
+        if matched_type != campaign_type:
+            print(f"Tipo de campanha '{campaign_type}' associado a '{matched_type}' no metricas_map.json.")
+        # Cópias: o catálogo em memória é compartilhado entre as chamadas
+        suggested_metrics["indicadores_chave"] = list(campaign_data["metricas_principais"])
+        suggested_metrics["metricas_secundarias"] = list(campaign_data["metricas_secundarias"])
     else:
         print(f"Aviso: Tipo de campanha '{campaign_type}' não encontrado no metricas_map.json.")
 
@@ -3,6 +3,7 @@ import json
 from .utils.prompt_manager.build_prompt import build_prompt
 from .utils.prompt_manager.build_prompt_cohere import build_prompt_cohere
 from .utils.prompt_manager.analyze_briefing_for_strategy import analyze_briefing_for_strategy
+from .utils.prompt_manager.get_strategy_analysis import get_strategy_analysis
 from .utils.prompt_manager.build_image_prompt import build_image_prompt
 
 from .utils.prompt_manager.get_token_count import get_token_count
@@ -19,7 +20,7 @@ class PromptManager:
         self.client_profile = client_profile
         self.niche_guidelines = niche_guidelines
 
-    def build_prompt(self, content_type: str, weekly_themes: list[str], weekly_goal: str, campaign_type: str, strategic_analysis: dict = None) -> str:
+    def build_prompt(self, content_type: str, weekly_themes: list[str], weekly_goal: str, campaign_type: str, strategic_analysis: dict = None, reused_sections: dict = None) -> str:
         """
         Constrói o prompt completo para a API do Gemini, utilizando a função build_prompt refatorada.
 
@@ -31,11 +32,12 @@ class PromptManager:
             weekly_goal (str): O objetivo principal do conteúdo para a semana.
             campaign_type (str): O tipo de campanha (e.g., "lancamento", "autoridade").
             strategic_analysis (dict): O resultado da análise estratégica do briefing.
+            reused_sections (dict): Seções reaproveitadas de uma execução anterior, que não são pedidas à IA.
 
         Returns:
             str: O prompt completo formatado para a API do Gemini.
         """
-        return build_prompt(self.client_profile, self.niche_guidelines, content_type, weekly_themes, weekly_goal, campaign_type, strategic_analysis)
+        return build_prompt(self.client_profile, self.niche_guidelines, content_type, weekly_themes, weekly_goal, campaign_type, strategic_analysis, reused_sections)
 
     def build_prompt_cohere(self, content_type: str, weekly_themes: list[str], weekly_goal: str, campaign_type: str, strategic_analysis: dict = None) -> str:
         """
@@ -65,6 +67,20 @@ class PromptManager:
             niche_guidelines=self.niche_guidelines
         )
 
+    def get_strategy_analysis(self) -> dict:
+        """
+        Retorna a análise estratégica pré-calculada no perfil do cliente, recalculando-a só
+        quando os campos relevantes do briefing mudaram.
+
+        Returns:
+            dict: Um dicionário com informações estratégicas analisadas.
+        """
+        return get_strategy_analysis(
+            client_name=self.client_profile.get("nome_do_cliente"),
+            client_profile=self.client_profile,
+            niche_guidelines=self.niche_guidelines
+        )
+
     def build_image_prompt(self, client_profile: dict, post_content: dict) -> str:
         """
         Constrói um prompt detalhado para uma IA de geração de imagens/vídeos com base no conteúdo do post.
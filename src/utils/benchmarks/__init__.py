@@ -0,0 +1,4 @@
+from .synthetic_campaign import build_synthetic_campaign
+from .run_render_benchmarks import run_render_benchmarks, load_benchmark_history, save_benchmark_run, find_regressions
+from .run_pipeline_benchmark import run_pipeline_benchmark
+from .replay_cassettes import replay_cassettes
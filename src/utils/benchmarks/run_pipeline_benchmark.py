@@ -0,0 +1,150 @@
+import contextvars
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from src.config import BASE_DIR
+from src.utils.benchmarks.run_render_benchmarks import _git_revision
+from src.utils.briefing_ingestion import preflight_briefings
+from src.utils.tracing import trace_span
+
+# Arquivo (JSON Lines) com o histórico das execuções do benchmark do pipeline
+PIPELINE_BENCHMARK_RESULTS_FILE = os.path.join(BASE_DIR, "output_files", "benchmarks", "pipeline_benchmarks.jsonl")
+
+# Briefings usados por padrão
+DEFAULT_BENCHMARK_BRIEFINGS = os.path.join(BASE_DIR, "briefing_docs", "Exemplos")
+
+
+def _percentile(values: list, percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile * (len(ordered) - 1))))]
+
+
+def _summarize(values: list) -> dict:
+    if not values:
+        return {"median_seconds": None, "p95_seconds": None, "max_seconds": None}
+    return {
+        "median_seconds": round(statistics.median(values), 4),
+        "p95_seconds": round(_percentile(values, 0.95), 4),
+        "max_seconds": round(max(values), 4),
+    }
+
+
+def _run_once(benchmark_id: str, run_number: int, brief_data: dict, output_dir: str, render: bool) -> dict:
+    """
+    Executa geração (prompt, chamada ao provedor local, parse) e renderização de um briefing.
+    Os documentos e o log do prompt ficam em `output_dir` (temporário), fora de output_files.
+    """
+    from src.utils.main_functions.generate_social_media_content import generate_social_media_content
+    from src.utils.main_functions.generate_briefing_documents import generate_briefing_documents
+
+    # Um nome por execução (e por benchmark) evita que o cache de conteúdo do processo devolva
+    # a campanha de uma execução anterior.
+    client_name = f"{brief_data['nome_do_cliente']} #{benchmark_id}-{run_number}"
+    timings = {}
+
+    with trace_span("pipeline", **{"client.name": client_name, "benchmark.run": run_number}):
+        started_at = time.perf_counter()
+        generated_content, _, _, _, _ = generate_social_media_content(
+            brief_data, client_name, brief_data.get("tipo_de_conteudo"), brief_data.get("conteudos_semanais", []),
+            brief_data.get("objetivos_de_marketing"), provider="mock",
+            prompt_log_dir=os.path.join(output_dir, "logs_para_IA")
+        )
+        timings["generation"] = time.perf_counter() - started_at
+        if generated_content is None:
+            return {"status": "error", "timings": timings}
+
+        if render:
+            started_at = time.perf_counter()
+            pdf_path, html_path = generate_briefing_documents(
+                generated_content, client_name, output_dir, brief_data.get("publico_alvo"), brief_data.get("tom_de_voz"),
+                brief_data.get("objetivos_de_marketing"), model_name="Mock"
+            )
+            timings["render"] = time.perf_counter() - started_at
+            if pdf_path is None or html_path is None:
+                return {"status": "error", "timings": timings}
+
+    timings["total"] = sum(timings.values())
+    return {"status": "success", "timings": timings}
+
+
+def run_pipeline_benchmark(briefings_source=DEFAULT_BENCHMARK_BRIEFINGS, runs: int = 20, concurrency: int = 1,
+                           render: bool = True, **mock_settings) -> dict:
+    """
+    Mede o pipeline de ponta a ponta (orquestração, parse e renderização) com o provedor local,
+    sem rede e sem custo.
+
+    Args:
+        briefings_source: Origem dos briefings (qualquer origem aceita por `preflight_briefings`);
+                          as execuções percorrem os briefings válidos em ciclo.
+        runs (int): Quantidade de execuções do pipeline.
+        concurrency (int): Execuções simultâneas (threads).
+        render (bool): Se True, gera também o PDF e o HTML de cada execução.
+        **mock_settings: Ajustes do provedor local (mode, latency, jitter, error_rate, posts, seed);
+                         ver `configure_mock`.
+
+    Returns:
+        dict: {"timestamp", "revision", "runs", "concurrency", "render", "mock", "succeeded", "failed",
+               "elapsed_seconds", "runs_per_minute", "stages": {etapa: {"median_seconds", "p95_seconds", "max_seconds"}}}.
+    """
+    # Importado aqui: o provedor local usa `build_synthetic_campaign`, deste mesmo pacote.
+    from src.llm_client.mock_client import configure_mock, get_mock_config
+
+    preflight = preflight_briefings(briefings_source)
+    briefings = [result["briefing"] for result in preflight["results"] if result["valid"]]
+    if not briefings:
+        raise ValueError(f"Nenhum briefing válido em {briefings_source}.")
+
+    configure_mock(**mock_settings)
+    try:
+        mock_config = get_mock_config()
+        print(f"Benchmark do pipeline: {runs} execuções, {concurrency} simultâneas, provedor local em modo "
+              f"{mock_config['mode']} (latência {mock_config['latency']}s +/- {mock_config['jitter']}s, "
+              f"erros {mock_config['error_rate']:.0%}, {mock_config['posts']} posts).")
+
+        benchmark_id = uuid.uuid4().hex[:8]
+        with tempfile.TemporaryDirectory() as output_dir:
+            started_at = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                # Cada execução leva uma cópia do contexto (span atual) para a thread que a executa.
+                futures = [
+                    executor.submit(contextvars.copy_context().run, _run_once, benchmark_id, number,
+                                    briefings[number % len(briefings)], output_dir, render)
+                    for number in range(runs)
+                ]
+                results = [future.result() for future in futures]
+            elapsed = time.perf_counter() - started_at
+    finally:
+        configure_mock(**{key: None for key in mock_settings})
+
+    succeeded = [result for result in results if result["status"] == "success"]
+    stages = {}
+    for stage in ("generation", "render", "total"):
+        values = [result["timings"][stage] for result in succeeded if stage in result["timings"]]
+        if values:
+            stages[stage] = _summarize(values)
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "runs": runs,
+        "concurrency": concurrency,
+        "render": render,
+        "mock": {key: value for key, value in mock_config.items() if key != "replay_dir"},
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "elapsed_seconds": round(elapsed, 3),
+        "runs_per_minute": round(len(succeeded) / elapsed * 60, 1) if elapsed else None,
+        "stages": stages,
+    }
+
+    print(f"\n{run['succeeded']}/{runs} execuções concluídas em {run['elapsed_seconds']}s "
+          f"({run['runs_per_minute']} por minuto).")
+    for stage, summary in stages.items():
+        print(f"{stage:<12} mediana {summary['median_seconds']:8.4f}s | p95 {summary['p95_seconds']:8.4f}s | "
+              f"máx {summary['max_seconds']:8.4f}s")
+    return run
@@ -0,0 +1,205 @@
+import json
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.config import BASE_DIR
+from src.utils.benchmarks.synthetic_campaign import build_synthetic_campaign
+
+# Arquivo (JSON Lines) com o histórico das execuções do benchmark
+BENCHMARK_RESULTS_FILE = os.path.join(BASE_DIR, "output_files", "benchmarks", "render_benchmarks.jsonl")
+
+# Tamanhos de campanha medidos por padrão (quantidade de posts)
+DEFAULT_SIZES = (5, 20, 100)
+
+# Aumento do tempo mediano, em relação à execução anterior, considerado regressão
+REGRESSION_THRESHOLD = 0.20
+
+
+def _clear_render_caches():
+    """Esvazia os caches de renderização para medir sempre a geração completa."""
+    from src.utils.html_generator.create_briefing_html import _converter_markdown_inline
+    from src.utils.pdf_generator.section_cache import clear_section_cache
+
+    _converter_markdown_inline.cache_clear()
+    clear_section_cache()
+
+
+def _targets(content_json: dict, output_dir: str) -> dict:
+    """Funções medidas: cada uma recebe o conteúdo pronto e retorna o tamanho da saída (bytes)."""
+    from src.utils.html_generator.create_briefing_html import create_briefing_html, formatar_json_markdown
+    from src.utils.html_generator.quick_view import gerar_quick_view_section
+    from src.utils.llm_output.campaign_model import build_campaign
+    from src.utils.pdf_generator.create_briefing_pdf import create_briefing_pdf
+
+    pdf_path = os.path.join(output_dir, "benchmark.pdf")
+    html_path = os.path.join(output_dir, "benchmark.html")
+    campaign = build_campaign(content_json)
+    formatted_posts = formatar_json_markdown(campaign).posts
+
+    def run_pdf():
+        create_briefing_pdf(content_json, "Cliente Benchmark", pdf_path, backend="reportlab")
+        return os.path.getsize(pdf_path)
+
+    def run_html():
+        create_briefing_html(content_json, "Cliente Benchmark", html_path)
+        return os.path.getsize(html_path)
+
+    def run_markdown():
+        formatar_json_markdown(campaign)
+        return None
+
+    def run_quick_view():
+        return len(gerar_quick_view_section(formatted_posts).encode("utf-8"))
+
+    return {
+        "create_briefing_pdf": run_pdf,
+        "create_briefing_html": run_html,
+        "formatar_json_markdown": run_markdown,
+        "gerar_quick_view_section": run_quick_view,
+    }
+
+
+def _measure(function, repetitions: int, clear_caches: bool) -> dict:
+    """Mede o tempo (várias execuções) e o pico de memória (uma execução com tracemalloc)."""
+    timings = []
+    output_size = None
+    for _ in range(repetitions):
+        if clear_caches:
+            _clear_render_caches()
+        started_at = time.perf_counter()
+        output_size = function()
+        timings.append(time.perf_counter() - started_at)
+
+    # O tracemalloc deixa o código bem mais lento, por isso a memória é medida em uma execução à parte
+    if clear_caches:
+        _clear_render_caches()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_seconds": round(statistics.median(timings), 4),
+        "min_seconds": round(min(timings), 4),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "output_bytes": output_size,
+    }
+
+
+def _git_revision() -> str:
+    """Commit atual do repositório (None se o git não estiver disponível)."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_render_benchmarks(sizes=DEFAULT_SIZES, repetitions: int = 3, clear_caches: bool = True) -> dict:
+    """
+    Mede o caminho de renderização (PDF, HTML, Markdown e Quick View) com campanhas sintéticas.
+
+    Args:
+        sizes (tuple): Quantidades de posts das campanhas medidas.
+        repetitions (int): Execuções por medição de tempo (é registrada a mediana).
+        clear_caches (bool): Se True, esvazia os caches de renderização antes de cada execução
+                             (mede a geração completa); se False, mede as re-renderizações.
+                             As seções de PDF ficam em um diretório temporário, fora do cache real.
+
+    Returns:
+        dict: {"timestamp", "revision", "repetitions", "clear_caches", "results"}, em que "results"
+              é uma lista de {"target", "posts", "median_seconds", "min_seconds", "peak_memory_kb", "output_bytes"}.
+    """
+    from src.utils.pdf_generator.section_cache import configure_section_cache, reset_section_cache
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        configure_section_cache(directory=os.path.join(output_dir, "pdf_sections"))
+        try:
+            for size in sizes:
+                content_json = build_synthetic_campaign(size)
+                for target, function in _targets(content_json, output_dir).items():
+                    measurement = _measure(function, repetitions, clear_caches)
+                    results.append({"target": target, "posts": size, **measurement})
+                    print(f"{target:<26} {size:>4} posts | mediana {measurement['median_seconds']:8.4f}s | "
+                          f"pico {measurement['peak_memory_kb']:10.1f} KB | saída {measurement['output_bytes'] or '-'}")
+        finally:
+            reset_section_cache()
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "repetitions": repetitions,
+        "clear_caches": clear_caches,
+        "results": results,
+    }
+
+
+def load_benchmark_history(results_file: str = BENCHMARK_RESULTS_FILE) -> list:
+    """
+    Lê o histórico de execuções salvas.
+
+    Returns:
+        list: As execuções, da mais antiga para a mais recente.
+    """
+    if not os.path.exists(results_file):
+        return []
+    history = []
+    with open(results_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    history.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"Aviso: linha inválida ignorada em {results_file}.")
+    return history
+
+
+def save_benchmark_run(run: dict, results_file: str = BENCHMARK_RESULTS_FILE) -> str:
+    """
+    Acrescenta uma execução ao histórico (JSON Lines).
+
+    Returns:
+        str: O caminho do arquivo de resultados.
+    """
+    os.makedirs(os.path.dirname(results_file), exist_ok=True)
+    with open(results_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+    return results_file
+
+
+def find_regressions(run: dict, history: list, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    Compara uma execução com a anterior de mesmo modo (com ou sem caches).
+
+    Args:
+        run (dict): A execução atual (retorno de `run_render_benchmarks`).
+        history (list): Execuções anteriores (retorno de `load_benchmark_history`).
+        threshold (float): Aumento relativo do tempo mediano considerado regressão.
+
+    Returns:
+        list: Uma mensagem por medição que ficou mais lenta que o limite.
+    """
+    previous = next((past for past in reversed(history) if past.get("clear_caches") == run["clear_caches"]), None)
+    if previous is None:
+        return []
+
+    baseline = {(item["target"], item["posts"]): item for item in previous["results"]}
+    regressions = []
+    for item in run["results"]:
+        before = baseline.get((item["target"], item["posts"]))
+        if not before or not before["median_seconds"]:
+            continue
+        change = item["median_seconds"] / before["median_seconds"] - 1
+        if change > threshold:
+            regressions.append(f"{item['target']} ({item['posts']} posts): {before['median_seconds']:.4f}s -> "
+                               f"{item['median_seconds']:.4f}s (+{change:.0%}, comparado a {previous.get('revision')})")
+    return regressions
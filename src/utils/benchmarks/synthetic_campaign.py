@@ -0,0 +1,99 @@
+import random
+from datetime import datetime
+
+_WORDS = (
+    "estratégia conteúdo engajamento público marca comunidade resultado criativo campanha "
+    "alcance autoridade confiança produto serviço cliente história bastidores dica tutorial "
+    "transformação oferta lançamento novidade experiência qualidade inovação parceria"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Frase pseudoaleatória com um pouco de Markdown (negrito/itálico), como nas respostas das IAs."""
+    tokens = [rng.choice(_WORDS) for _ in range(words)]
+    if words > 6:
+        tokens[2] = f"**{tokens[2]}**"
+        tokens[5] = f"*{tokens[5]}*"
+    return " ".join(tokens).capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, count: int, words: int) -> str:
+    return "\n\n".join(" ".join(_sentence(rng, words) for _ in range(3)) for _ in range(count))
+
+
+def build_synthetic_campaign(num_posts: int, seed: int = 42) -> dict:
+    """
+    Gera uma campanha sintética no formato JSON das IAs, para benchmarks de renderização.
+
+    Os posts têm legendas longas, variações, carrosséis (posts ímpares) ou roteiros de vídeo
+    (posts pares) e roteiros de resposta, como as campanhas reais mais pesadas.
+
+    Args:
+        num_posts (int): Quantidade de posts da campanha.
+        seed (int): Semente do gerador; a mesma semente gera sempre o mesmo conteúdo.
+
+    Returns:
+        dict: O conteúdo da campanha (mesmo formato de `generated_content`).
+    """
+    rng = random.Random(seed)
+    days = ["segunda", "terça", "quarta", "quinta", "sexta", "sábado", "domingo"]
+    posts = []
+    for number in range(1, num_posts + 1):
+        is_carousel = number % 2 == 1
+        posts.append({
+            "titulo": f"Post {number}: {_sentence(rng, 6)}",
+            "tema": _sentence(rng, 8),
+            "legenda_principal": _paragraphs(rng, 3, 14),
+            "variacoes_legenda": [_paragraphs(rng, 1, 12) for _ in range(3)],
+            "hashtags": [f"#{rng.choice(_WORDS)}{i}" for i in range(12)],
+            "horario_de_postagem": f"{days[number % 7].capitalize()}, {rng.randint(8, 21)}:00",
+            "sugestao_formato": "Carrossel" if is_carousel else "Reels",
+            "carrossel_slides": [
+                {"titulo_slide": _sentence(rng, 4), "texto_slide": _sentence(rng, 18), "sugestao_visual_slide": _sentence(rng, 10)}
+                for _ in range(6)
+            ] if is_carousel else [],
+            "micro_roteiro": [] if is_carousel else [
+                {"cena": scene, "descricao": _sentence(rng, 14), "texto_tela": _sentence(rng, 5), "fala": _sentence(rng, 16)}
+                for scene in range(1, 6)
+            ],
+            "post_strategy_rationale": _paragraphs(rng, 2, 12),
+            "micro_briefing": _paragraphs(rng, 1, 14),
+            "visual_prompt_suggestion": _sentence(rng, 30),
+            "text_in_image": _sentence(rng, 6),
+            "visual_description_portuguese": _sentence(rng, 24),
+            "cta_individual": _sentence(rng, 8),
+            "ab_test_suggestions": _sentence(rng, 20),
+            "indicador_principal": "Taxa de salvamentos",
+            "optimization_triggers": _sentence(rng, 20),
+            "interacao": _sentence(rng, 12),
+            "response_script": [
+                {
+                    "comentario_generico": _sentence(rng, 8),
+                    "resposta_sugerida": _sentence(rng, 16),
+                    "comentario_negativo": _sentence(rng, 8),
+                    "resposta_negativo": _sentence(rng, 18),
+                }
+                for _ in range(3)
+            ],
+        })
+
+    return {
+        "weekly_strategy_summary": _paragraphs(rng, 2, 16),
+        "future_strategy": {
+            "proximos_passos": _paragraphs(rng, 1, 14),
+            "posts_nutricao": [{"tema": _sentence(rng, 6), "formato": "Carrossel", "objetivo": _sentence(rng, 8)} for _ in range(3)],
+            "remarketing": [{"estrategia": _sentence(rng, 10), "canal": "Instagram Ads"} for _ in range(2)],
+        },
+        "market_references": [
+            {"Nome/Handle": f"@referencia{i}", "Diferenciais": _sentence(rng, 14), "Oportunidades": _sentence(rng, 14),
+             "Posicionamento do Cliente": _sentence(rng, 14)}
+            for i in range(3)
+        ],
+        "posts": posts,
+        "metricas_de_sucesso_sugeridas": {
+            "objetivo_principal": _sentence(rng, 10),
+            "indicadores_chave": [_sentence(rng, 5) for _ in range(4)],
+            "metricas_secundarias": [_sentence(rng, 5) for _ in range(4)],
+        },
+        "start_date": datetime(2025, 1, 6).strftime("%Y-%m-%d"),
+    }
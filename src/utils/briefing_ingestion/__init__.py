@@ -0,0 +1,5 @@
+from .briefing_schema import BRIEFING_SCHEMA, get_briefing_validator, validate_briefing
+from .load_briefings import load_briefings
+from .preflight_briefings import preflight_briefings
+from .briefing_fingerprint import VOLATILE_BRIEFING_FIELDS, briefing_fingerprint
+from .reusable_sections import REUSABLE_SECTIONS, find_reusable_sections, merge_reused_sections
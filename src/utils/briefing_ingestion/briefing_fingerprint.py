@@ -0,0 +1,35 @@
+import hashlib
+import json
+
+# Campos que mudam a cada semana e não fazem parte da impressão digital do briefing
+VOLATILE_BRIEFING_FIELDS = ("conteudos_semanais",)
+
+
+def _canonical(value):
+    """Forma canônica do valor: chaves como texto e espaços repetidos/nas bordas ignorados."""
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def briefing_fingerprint(brief_data: dict, volatile_fields: tuple = VOLATILE_BRIEFING_FIELDS) -> str:
+    """
+    Calcula a impressão digital canônica de um briefing, sem os campos voláteis.
+
+    Dois briefings com o mesmo conteúdo estável têm a mesma impressão digital, mesmo que a
+    ordem das chaves, a formatação do arquivo ou os conteúdos semanais sejam diferentes.
+
+    Args:
+        brief_data (dict): Os dados do briefing do cliente.
+        volatile_fields (tuple): Campos ignorados no cálculo (padrão: conteudos_semanais).
+
+    Returns:
+        str: Hash SHA-256 (hexadecimal) do briefing canônico.
+    """
+    stable = {key: value for key, value in brief_data.items() if key not in volatile_fields}
+    canonical = json.dumps(_canonical(stable), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
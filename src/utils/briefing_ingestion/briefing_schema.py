@@ -0,0 +1,119 @@
+"""
+Esquema do briefing do cliente, compilado uma única vez em funções de verificação.
+
+Cada campo do esquema vira uma função pronta (tipo, obrigatoriedade, itens de listas e
+campos de objetos aninhados). Validar um briefing é só executar essas funções, e todos os
+problemas são reportados de uma vez, em vez de parar no primeiro.
+"""
+
+from functools import lru_cache
+
+_LIST_OF_STR = {"type": list, "items": {"type": str}}
+
+BRIEFING_SCHEMA = {
+    "nome_do_cliente": {"type": str, "required": True, "non_empty": True},
+    "subnicho": {"type": str, "required": True},
+    "publico_alvo": {"type": str, "required": True},
+    "tom_de_voz": {"type": str, "required": True},
+    "objetivos_de_marketing": {"type": str, "required": True},
+    "chamada_para_acao": {"type": str, "required": True},
+    "tipo_de_conteudo": {"type": str, "required": True},
+    "conteudos_semanais": {
+        "type": list,
+        "required": True,
+        "items": {
+            "type": dict,
+            "fields": {
+                "objetivo_do_conteudo_individual": {"type": str, "required": True},
+                "chamada_para_acao_individual": {"type": str},
+            },
+        },
+    },
+    "informacoes_de_contato": {"type": str},
+    "estilo_de_comunicacao": {"type": str},
+    "vocabulario_da_marca": _LIST_OF_STR,
+    "exemplos_de_nicho": _LIST_OF_STR,
+    "canais_de_distribuicao": _LIST_OF_STR,
+    "topicos_principais": _LIST_OF_STR,
+    "palavras_chave": _LIST_OF_STR,
+    "restricoes_e_diretrizes": {"type": str},
+    "informacoes_adicionais": {"type": str},
+    "referencias_de_concorrentes": _LIST_OF_STR,
+    "referencias_de_estilo_e_formato": _LIST_OF_STR,
+    "tipo_de_campanha": {"type": str},
+    "posts_anteriores": {"type": list},
+}
+
+
+def _compile_value(spec: dict):
+    """Compila a verificação de um valor (tipo, vazio, itens e campos aninhados)."""
+    expected_type = spec["type"]
+    non_empty = spec.get("non_empty", False)
+    check_item = _compile_value(spec["items"]) if "items" in spec else None
+    check_fields = _compile_fields(spec["fields"]) if "fields" in spec else None
+
+    def check(value, path: str, errors: list):
+        if not isinstance(value, expected_type):
+            errors.append(f"Campo '{path}' deve ser do tipo {expected_type.__name__}, mas é {type(value).__name__}.")
+            return
+        if non_empty and not value.strip():
+            errors.append(f"Campo '{path}' não pode ser vazio.")
+        if check_item is not None:
+            for i, item in enumerate(value):
+                check_item(item, f"{path}[{i}]", errors)
+        if check_fields is not None:
+            check_fields(value, path, errors)
+
+    return check
+
+
+def _compile_fields(fields: dict):
+    """Compila a verificação de um objeto: campos obrigatórios e tipo de cada campo presente."""
+    checks = tuple((name, spec.get("required", False), _compile_value(spec)) for name, spec in fields.items())
+
+    def check(obj: dict, path: str, errors: list):
+        for name, required, check_value in checks:
+            field_path = f"{path}.{name}" if path else name
+            if name not in obj:
+                if required:
+                    if path:
+                        errors.append(f"Campo obrigatório '{field_path}' faltando.")
+                    else:
+                        errors.append(f"Campo obrigatório '{name}' faltando no briefing do cliente.")
+                continue
+            check_value(obj[name], field_path, errors)
+
+    return check
+
+
+@lru_cache(maxsize=None)
+def get_briefing_validator():
+    """
+    Retorna o validador compilado do esquema de briefing (compilado na primeira chamada).
+
+    Returns:
+        callable: Função `validador(briefing) -> list[str]` com todos os erros encontrados.
+    """
+    check_fields = _compile_fields(BRIEFING_SCHEMA)
+
+    def validate(brief_data) -> list:
+        if not isinstance(brief_data, dict):
+            return [f"O briefing deve ser um objeto JSON, mas é {type(brief_data).__name__}."]
+        errors = []
+        check_fields(brief_data, "", errors)
+        return errors
+
+    return validate
+
+
+def validate_briefing(brief_data) -> list:
+    """
+    Valida um briefing contra o esquema compilado.
+
+    Args:
+        brief_data (dict): Os dados do briefing do cliente.
+
+    Returns:
+        list: Todas as mensagens de erro encontradas (vazia se o briefing for válido).
+    """
+    return get_briefing_validator()(brief_data)
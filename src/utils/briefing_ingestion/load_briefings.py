@@ -0,0 +1,74 @@
+import json
+import os
+
+# Extensões tratadas como NDJSON (um briefing JSON por linha)
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+
+def _entries_from_json_text(text: str, source: str) -> list:
+    """Um arquivo .json pode conter um briefing (objeto) ou vários (lista de objetos)."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        return [{"source": source, "briefing": None, "errors": [f"JSON inválido: {e}"]}]
+    if isinstance(data, list):
+        return [{"source": f"{source}[{i}]", "briefing": item, "errors": []} for i, item in enumerate(data)]
+    return [{"source": source, "briefing": data, "errors": []}]
+
+
+def _entries_from_lines(lines, source: str) -> list:
+    """Lê um fluxo NDJSON; linhas em branco são ignoradas e linhas inválidas viram erros da própria linha."""
+    entries = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        line_source = f"{source}:{line_number}"
+        try:
+            entries.append({"source": line_source, "briefing": json.loads(line), "errors": []})
+        except json.JSONDecodeError as e:
+            entries.append({"source": line_source, "briefing": None, "errors": [f"JSON inválido: {e}"]})
+    return entries
+
+
+def _entries_from_path(path: str) -> list:
+    if os.path.isdir(path):
+        entries = []
+        for name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path) and name.lower().endswith((".json",) + NDJSON_EXTENSIONS):
+                entries.extend(_entries_from_path(file_path))
+        return entries
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.lower().endswith(NDJSON_EXTENSIONS):
+                return _entries_from_lines(f, path)
+            return _entries_from_json_text(f.read(), path)
+    except OSError as e:
+        return [{"source": path, "briefing": None, "errors": [f"Não foi possível ler o arquivo: {e}"]}]
+
+
+def load_briefings(source) -> list:
+    """
+    Carrega um ou vários briefings de uma vez.
+
+    Args:
+        source: Um caminho (arquivo .json com um objeto ou uma lista, arquivo .ndjson/.jsonl ou
+                diretório com esses arquivos, ex: "briefing_docs/Exemplos"), um fluxo de texto
+                NDJSON (arquivo aberto, sys.stdin), um briefing (dict) ou uma lista de briefings.
+
+    Returns:
+        list: Uma entrada por briefing: {"source": origem (arquivo, arquivo:linha ou índice),
+              "briefing": dict ou None se não pôde ser lido, "errors": erros de leitura}.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if not os.path.exists(path):
+            return [{"source": path, "briefing": None, "errors": ["Arquivo ou diretório não encontrado."]}]
+        return _entries_from_path(path)
+    if isinstance(source, dict):
+        return [{"source": "briefing", "briefing": source, "errors": []}]
+    if hasattr(source, "read"):
+        return _entries_from_lines(source, getattr(source, "name", "stream"))
+    return [{"source": f"briefing[{i}]", "briefing": item, "errors": []} for i, item in enumerate(source)]
@@ -0,0 +1,45 @@
+import time
+
+from src.utils.briefing_ingestion.briefing_schema import get_briefing_validator
+from src.utils.briefing_ingestion.load_briefings import load_briefings
+
+
+def preflight_briefings(source) -> dict:
+    """
+    Lê e valida vários briefings em uma única passada, antes de qualquer chamada às IAs.
+
+    Args:
+        source: Qualquer origem aceita por `load_briefings` (arquivo, diretório, NDJSON, dict ou lista).
+
+    Returns:
+        dict: {"status": "success" se todos forem válidos, senão "error",
+               "total", "valid", "invalid", "elapsed_seconds",
+               "results": [{"source", "client_name", "valid", "errors", "briefing"}]}.
+    """
+    started_at = time.perf_counter()
+    validate = get_briefing_validator()
+
+    results = []
+    for entry in load_briefings(source):
+        brief_data = entry["briefing"]
+        errors = list(entry["errors"])
+        if brief_data is not None:
+            errors.extend(validate(brief_data))
+        client_name = brief_data.get("nome_do_cliente") if isinstance(brief_data, dict) else None
+        results.append({
+            "source": entry["source"],
+            "client_name": client_name,
+            "valid": not errors,
+            "errors": errors,
+            "briefing": brief_data,
+        })
+
+    valid = sum(1 for result in results if result["valid"])
+    return {
+        "status": "success" if results and valid == len(results) else "error",
+        "total": len(results),
+        "valid": valid,
+        "invalid": len(results) - valid,
+        "elapsed_seconds": round(time.perf_counter() - started_at, 4),
+        "results": results,
+    }
@@ -0,0 +1,46 @@
+from src.data_storage import get_latest_brief_by_fingerprint
+
+# Seções da campanha que dependem só da parte estável do briefing (não dos temas da semana)
+REUSABLE_SECTIONS = ("future_strategy", "market_references")
+
+
+def find_reusable_sections(client_name: str, fingerprint: str) -> dict:
+    """
+    Busca as seções estáveis geradas na última execução com o mesmo briefing.
+
+    Args:
+        client_name (str): Nome do cliente.
+        fingerprint (str): Impressão digital do briefing atual (ver `briefing_fingerprint`).
+
+    Returns:
+        dict: {seção: conteúdo anterior} para as seções reaproveitáveis encontradas
+              (vazio se o briefing mudou ou se não houver execução anterior).
+    """
+    previous = get_latest_brief_by_fingerprint(client_name, fingerprint)
+    if not previous or not isinstance(previous["generated_content"], dict):
+        return {}
+
+    content = previous["generated_content"]
+    sections = {name: content[name] for name in REUSABLE_SECTIONS if content.get(name)}
+    if sections:
+        print(f"Briefing de '{client_name}' sem mudanças desde {previous['delivery_date']}: "
+              f"reaproveitando {', '.join(sections)}.")
+    return sections
+
+
+def merge_reused_sections(generated_content, reused_sections: dict):
+    """
+    Completa o conteúdo gerado com as seções reaproveitadas que não vieram na resposta da IA.
+
+    Args:
+        generated_content (dict): Conteúdo gerado pela IA (alterado no lugar).
+        reused_sections (dict): Seções retornadas por `find_reusable_sections`.
+
+    Returns:
+        O próprio `generated_content`.
+    """
+    if isinstance(generated_content, dict):
+        for name, value in (reused_sections or {}).items():
+            if not generated_content.get(name):
+                generated_content[name] = value
+    return generated_content
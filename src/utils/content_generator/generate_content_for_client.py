@@ -1,10 +1,10 @@
-import json
-import re
 from typing import List, Dict
 
-from src.llm_client.gemini_client import generate_text_content
+from src.llm_client.providers import get_provider
 from src.prompt_manager import PromptManager
 from src.utils.cache_manager import get_cache_key, get_from_cache, set_to_cache
+from src.utils.briefing_ingestion.reusable_sections import merge_reused_sections
+from src.utils.tracing import trace_span
 
 
 
@@ -14,10 +14,12 @@ def generate_content_for_client(
     weekly_themes: List[str],
     weekly_goal: str,
     campaign_type: str,
-    content_type: str
+    content_type: str,
+    reused_sections: Dict = None,
+    provider: str = "gemini"
 ) -> Dict:
     """
-    Gera conteúdo de mídia social para um cliente usando a API Google Gemini.
+    Gera conteúdo de mídia social para um cliente usando o provedor de IA informado.
 
     Args:
         client_data (Dict): Dados do cliente.
@@ -25,21 +27,32 @@ def generate_content_for_client(
         weekly_themes (List[str]): Temas semanais para o conteúdo.
         weekly_goal (str): Objetivo semanal de marketing.
         campaign_type (str): O tipo de campanha (e.g., "lancamento", "autoridade").
+        content_type (str): O tipo de conteúdo a ser gerado.
+        reused_sections (Dict, optional): Seções de uma execução anterior com o mesmo briefing;
+                                          não são pedidas à IA e são incluídas no conteúdo final.
+        provider (str): Provedor registrado em `src/llm_client/providers.py` (ex: "gemini", "cohere", "mistral").
 
     Returns:
-        Dict: O conteúdo gerado para mídia social.
+        Dict: O conteúdo gerado para mídia social, com o prompt enviado, a estimativa de tokens
+              e "provider" (nome de exibição do provedor).
     """
+    llm_provider = get_provider(provider)
 
-    prompt_manager = PromptManager(client_data, niche_data)
-    strategic_analysis = prompt_manager.analyze_briefing_for_strategy()
-    prompt = prompt_manager.build_prompt(content_type=content_type, weekly_themes=weekly_themes, weekly_goal=weekly_goal, campaign_type=campaign_type, strategic_analysis=strategic_analysis)
+    with trace_span("prompt.build", **{"llm.provider": llm_provider.name}):
+        prompt_manager = PromptManager(client_data, niche_data)
+        strategic_analysis = prompt_manager.get_strategy_analysis()
+        prompt = llm_provider.build_prompt(prompt_manager, reused_sections=reused_sections, content_type=content_type, weekly_themes=weekly_themes, weekly_goal=weekly_goal, campaign_type=campaign_type, strategic_analysis=strategic_analysis)
 
     # Tenta carregar do cache primeiro
     cache_key_data = {
         "client_data": client_data,
         "niche_data": niche_data,
         "weekly_themes": weekly_themes,
-        "weekly_goal": weekly_goal
+        "weekly_goal": weekly_goal,
+        "campaign_type": campaign_type,
+        "content_type": content_type,
+        "provider": llm_provider.name,
+        "reused_sections": sorted(reused_sections or {})
     }
     cache_key = get_cache_key(cache_key_data)
     cached_content = get_from_cache(cache_key)
@@ -47,24 +60,24 @@ def generate_content_for_client(
         print("Conteúdo carregado do cache.")
         return cached_content
 
-    print("Gerando novo conteúdo com a API Gemini...")
-    
-    llm_response = generate_text_content(prompt)
+    print(f"Gerando novo conteúdo com a API {llm_provider.display_name}...")
+
+    llm_response = llm_provider.generate_text_content(prompt)
 
     if llm_response["status"] == "success":
-        generated_content = llm_response["generated_content"]
-        set_to_cache(cache_key, generated_content)
-        return {
+        estimated_input_tokens = len(prompt.split())
+        result = {
             "status": "success",
-            "generated_content": generated_content,
+            "generated_content": merge_reused_sections(llm_response["generated_content"], reused_sections),
             "prompt_sent": prompt,
             "token_usage": {
-                "estimated_input_tokens": len(prompt.split()),
-                "estimated_cost_usd": (len(prompt.split()) / 1000) * 0.0002
-            }
+                "estimated_input_tokens": estimated_input_tokens,
+                "estimated_cost_usd": llm_provider.estimate_cost(estimated_input_tokens)
+            },
+            "provider": llm_provider.display_name
         }
+        set_to_cache(cache_key, result)
+        return result
     else:
-        print("DEBUG: Entrando no bloco ELSE (erro).")
-        print("DEBUG: llm_response['message'] no bloco else: " + str(llm_response.get('message', 'N/A')))
-        print("Erro ao gerar conteúdo: " + str(llm_response.get('message', 'N/A')))
-        return {"status": "error", "message": llm_response.get("message", "Erro desconhecido")}
\ No newline at end of file
+        print(f"Erro ao gerar conteúdo com {llm_provider.display_name}: " + str(llm_response.get('message', 'N/A')))
+        return {"status": "error", "message": llm_response.get("message", "Erro desconhecido")}
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Dict
+
+from src.config import BASE_DIR
+from src.llm_client.async_runtime import run_async
+from src.llm_client.providers import get_provider, list_providers
+from src.llm_client.provider_health import rank_providers
+from src.prompt_manager import PromptManager
+from src.utils.cache_manager import get_cache_key, get_from_cache, set_to_cache
+from src.utils.briefing_ingestion.reusable_sections import merge_reused_sections
+from src.utils.tracing import trace_span
+
+# Pseudo-provedor aceito pelo pipeline (`run_generation_pipeline`) para gerar no modo corrida
+RACE_PROVIDER = "race"
+
+async def _call_provider(provider: str, prompt: str, started_at: float):
+    """Executa a chamada assíncrona de um provedor e retorna (resposta, tempo gasto)."""
+    try:
+        response = await get_provider(provider).generate_text_content_async(prompt, timeout=None)
+    except Exception as e:
+        response = {"status": "error", "message": f"Erro ao chamar {provider}: {e}"}
+    return response, time.perf_counter() - started_at
+
+
+async def _run_race(providers: List[str], prompts: Dict, timeout: float):
+    """
+    Dispara os provedores no event loop compartilhado e espera a primeira resposta válida.
+
+    As chamadas que ainda estiverem em andamento ao fim da corrida (ou ao estourar o
+    tempo limite) são canceladas.
+
+    Returns:
+        tuple: (resultado de cada provedor que respondeu, (provedor, resposta, tempo) do vencedor ou None, início)
+    """
+    started_at = time.perf_counter()
+    tasks = {
+        asyncio.ensure_future(_call_provider(provider, prompts[get_provider(provider).prompt_builder], started_at)): provider
+        for provider in providers
+    }
+    pending = set(tasks)
+    deadline = None if timeout is None else started_at + timeout
+    race = []
+    winner = None
+    try:
+        while pending and winner is None:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                provider = tasks[task]
+                response, elapsed = task.result()
+                race.append({"provider": provider, "status": response["status"], "elapsed_seconds": round(elapsed, 2)})
+                if response["status"] == "success" and winner is None:
+                    winner = (provider, response, elapsed)
+                elif response["status"] != "success":
+                    print(f"{get_provider(provider).display_name} falhou em {elapsed:.1f}s: {response.get('message', 'Erro desconhecido')}")
+    finally:
+        for task in pending:
+            task.cancel()
+    return race, winner, started_at
+
+
+def _log_race(client_name: str, race_log: dict):
+    """Acrescenta o resultado da corrida ao log de corridas (um JSON por linha)."""
+    log_dir = os.path.join(BASE_DIR, "output_files", "logs_para_IA")
+    os.makedirs(log_dir, exist_ok=True)
+    filepath = os.path.join(log_dir, "provider_race_log.jsonl")
+    entry = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "client_name": client_name, **race_log}
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def generate_content_for_client_race(
+    client_data: Dict,
+    niche_data: Dict,
+    weekly_themes: List[str],
+    weekly_goal: str,
+    campaign_type: str,
+    content_type: str,
+    providers: List[str] = None,
+    timeout: float = None,
+    reused_sections: Dict = None
+) -> Dict:
+    """
+    Gera conteúdo de mídia social disparando o mesmo briefing em vários provedores ao mesmo tempo.
+
+    A primeira resposta que passar na validação do esquema da campanha vence; as demais
+    chamadas são canceladas. As chamadas usam os clientes assíncronos, no event loop
+    compartilhado do processo (ver `src/llm_client/async_runtime.py`).
+
+    Args:
+        client_data (Dict): Dados do cliente.
+        niche_data (Dict): Dados do nicho.
+        weekly_themes (List[str]): Temas semanais para o conteúdo.
+        weekly_goal (str): Objetivo semanal de marketing.
+        campaign_type (str): O tipo de campanha (e.g., "lancamento", "autoridade").
+        content_type (str): O tipo de conteúdo a ser gerado.
+        providers (List[str]): Provedores participantes (padrão: os provedores registrados
+                               em `src/llm_client/providers.py` que não estão degradados).
+        timeout (float): Tempo máximo total de espera, em segundos (None = sem limite).
+        reused_sections (Dict, optional): Seções de uma execução anterior com o mesmo briefing;
+                                          não são pedidas à IA e são incluídas no conteúdo final.
+
+    Returns:
+        Dict: O mesmo formato de `generate_content_for_client`, acrescido de "provider"
+              (nome do vencedor), "elapsed_seconds" e "race" (resultado de cada provedor).
+    """
+    if not providers:
+        ranking = rank_providers(list_providers())
+        providers = [item["provider"] for item in ranking if not item["degraded"]] or [ranking[0]["provider"]]
+
+    cache_key = get_cache_key({
+        "client_data": client_data,
+        "niche_data": niche_data,
+        "weekly_themes": weekly_themes,
+        "weekly_goal": weekly_goal,
+        "race": sorted(providers),
+        "reused_sections": sorted(reused_sections or {})
+    })
+    cached_content = get_from_cache(cache_key)
+    if cached_content:
+        print("Conteúdo carregado do cache.")
+        return cached_content
+
+    with trace_span("prompt.build", **{"llm.provider": ",".join(providers)}):
+        prompt_manager = PromptManager(client_data, niche_data)
+        strategic_analysis = prompt_manager.get_strategy_analysis()
+        prompts = {}
+        for provider in providers:
+            llm_provider = get_provider(provider)
+            if llm_provider.prompt_builder not in prompts:
+                prompts[llm_provider.prompt_builder] = llm_provider.build_prompt(
+                    prompt_manager,
+                    reused_sections=reused_sections,
+                    content_type=content_type,
+                    weekly_themes=weekly_themes,
+                    weekly_goal=weekly_goal,
+                    campaign_type=campaign_type,
+                    strategic_analysis=strategic_analysis
+                )
+
+    print(f"Iniciando corrida entre provedores: {', '.join(providers)}...")
+    race, winner, started_at = run_async(_run_race(providers, prompts, timeout))
+
+    race_log = {
+        "providers": providers,
+        "winner": winner[0] if winner else None,
+        "elapsed_seconds": round(winner[2], 2) if winner else round(time.perf_counter() - started_at, 2),
+        "race": race
+    }
+    try:
+        _log_race(client_data.get("nome_do_cliente", "N/A"), race_log)
+    except OSError as e:
+        print(f"Aviso: não foi possível registrar o resultado da corrida: {e}")
+
+    if winner is None:
+        message = "Nenhum provedor retornou uma resposta válida" + (" dentro do tempo limite." if len(race) < len(providers) else ".")
+        print(f"Erro ao gerar conteúdo: {message}")
+        return {"status": "error", "message": message, "race": race}
+
+    provider, response, elapsed = winner
+    llm_provider = get_provider(provider)
+    prompt = prompts[llm_provider.prompt_builder]
+    estimated_input_tokens = len(prompt.split())
+    print(f"{llm_provider.display_name} venceu a corrida em {elapsed:.1f}s.")
+    result = {
+        "status": "success",
+        "generated_content": merge_reused_sections(response["generated_content"], reused_sections),
+        "prompt_sent": prompt,
+        "token_usage": {
+            "estimated_input_tokens": estimated_input_tokens,
+            "estimated_cost_usd": llm_provider.estimate_cost(estimated_input_tokens)
+        },
+        "provider": llm_provider.display_name,
+        "elapsed_seconds": round(elapsed, 2),
+        "race": race
+    }
+    set_to_cache(cache_key, result)
+    return result
@@ -1,8 +1,18 @@
 from .init_db import init_db
 from .insert_brief import insert_brief
 from .get_briefs_by_client import get_briefs_by_client
+from .get_latest_brief_by_fingerprint import get_latest_brief_by_fingerprint
 from .insert_client_profile import insert_client_profile
 from .get_client_profile import get_client_profile
 from .get_all_briefs import get_all_briefs
 from .update_brief_feedback import update_brief_feedback
-from .export_all_briefs_to_json import export_all_briefs_to_json
\ No newline at end of file
+from .export_all_briefs_to_json import export_all_briefs_to_json
+from .update_client_profile import update_client_profile
+from .save_client_strategy import save_client_strategy
+from .upsert_client_profile import upsert_client_profile
+from .profile_cache import invalidate_profile_cache
+from .insert_provider_call import insert_provider_call
+from .get_recent_provider_calls import get_recent_provider_calls
+from .get_provider_circuit import get_provider_circuit
+from .save_provider_circuit import save_provider_circuit
+from .claim_provider_circuit_probe import claim_provider_circuit_probe
@@ -0,0 +1,35 @@
+import sqlite3
+import time
+from .database_config import DATABASE_PATH
+
+def claim_provider_circuit_probe(provider: str, cooldown_seconds: float, stale_probe_seconds: float = 900) -> bool:
+    """
+    Tenta passar o circuito de um provedor de "open" para "half_open" de forma atômica.
+
+    Apenas um processo consegue fazer a transição, então apenas um deles envia a
+    chamada de teste enquanto os demais continuam falhando rápido.
+
+    Args:
+        provider (str): Nome do provedor.
+        cooldown_seconds (float): Tempo mínimo com o circuito aberto antes do teste.
+        stale_probe_seconds (float): Após esse tempo em "half_open" sem resposta (ex: o
+                                     processo do teste morreu), outro processo pode testar.
+
+    Returns:
+        bool: True se este processo ficou responsável pela chamada de teste.
+    """
+    now = time.time()
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        cursor = conn.execute("""
+            UPDATE provider_circuits
+            SET state = 'half_open', updated_at = ?
+            WHERE provider = ?
+              AND ((state = 'open' AND opened_at <= ?) OR (state = 'half_open' AND updated_at <= ?))
+        """, (now, provider, now - cooldown_seconds, now - stale_probe_seconds))
+        conn.commit()
+        return cursor.rowcount == 1
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
@@ -24,6 +24,7 @@ def get_all_briefs() -> list:
             "tokens_consumed": row[6],
             "api_cost_usd": row[7],
             "delivery_date": row[8],
-            "feedback_summary": row[9]
+            "feedback_summary": row[9],
+            "briefing_fingerprint": row[10] if len(row) > 10 else None
         })
     return briefs
\ No newline at end of file
@@ -1,10 +1,29 @@
 import sqlite3
 import json
 from .database_config import DATABASE_PATH
+from .profile_cache import get_cached_profile, set_cached_profile
+
+def profile_from_row(row) -> dict:
+    """
+    Converte uma linha da tabela client_profiles (SELECT *) em dicionário.
+    """
+    return {
+        "id": row[0],
+        "client_name": row[1],
+        "contact_info": row[2],
+        "public_target": row[3],
+        "tone_of_voice": row[4],
+        "niche_examples": json.loads(row[5]),
+        "status": row[6],
+        "strategy_block": json.loads(row[7]) if len(row) > 7 and row[7] else None,
+        "strategy_version": row[8] if len(row) > 8 else None,
+        "strategy_fingerprint": row[9] if len(row) > 9 else None
+    }
 
 def get_client_profile(client_name: str) -> dict:
     """
     Retorna o perfil de um cliente específico.
+    O perfil fica em cache no processo até a próxima escrita no perfil.
 
     Args:
         client_name (str): Nome do cliente.
@@ -12,6 +31,10 @@ def get_client_profile(client_name: str) -> dict:
     Returns:
         dict: Um dicionário representando o perfil do cliente, ou None se não encontrado.
     """
+    cached = get_cached_profile(client_name)
+    if cached is not None:
+        return cached
+
     conn = sqlite3.connect(DATABASE_PATH)
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM client_profiles WHERE client_name = ?", (client_name,))
@@ -19,13 +42,7 @@ def get_client_profile(client_name: str) -> dict:
     conn.close()
 
     if row:
-        return {
-            "id": row[0],
-            "client_name": row[1],
-            "contact_info": row[2],
-            "public_target": row[3],
-            "tone_of_voice": row[4],
-            "niche_examples": json.loads(row[5]),
-            "status": row[6]
-        }
-    return None
\ No newline at end of file
+        profile = profile_from_row(row)
+        set_cached_profile(client_name, profile)
+        return profile
+    return None
@@ -0,0 +1,38 @@
+import sqlite3
+import json
+from .database_config import DATABASE_PATH
+
+def get_latest_brief_by_fingerprint(client_name: str, briefing_fingerprint: str):
+    """
+    Retorna o briefing mais recente de um cliente com a mesma impressão digital.
+
+    Args:
+        client_name (str): Nome do cliente.
+        briefing_fingerprint (str): Impressão digital do briefing (ver `briefing_fingerprint`).
+
+    Returns:
+        dict | None: {"id", "generated_content", "delivery_date"} do registro mais recente,
+                     ou None se não houver registro com essa impressão digital.
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        row = conn.execute("""
+            SELECT id, generated_content, delivery_date
+            FROM client_briefs
+            WHERE client_name = ? AND briefing_fingerprint = ?
+            ORDER BY id DESC
+            LIMIT 1
+        """, (client_name, briefing_fingerprint)).fetchone()
+    except sqlite3.OperationalError:
+        # Tabela ou coluna ainda não criada: nenhum briefing anterior disponível.
+        row = None
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    try:
+        generated_content = json.loads(row[1]) if row[1] else None
+    except json.JSONDecodeError:
+        generated_content = None
+    return {"id": row[0], "generated_content": generated_content, "delivery_date": row[2]}
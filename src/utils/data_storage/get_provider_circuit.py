@@ -0,0 +1,36 @@
+import sqlite3
+from .database_config import DATABASE_PATH
+
+def get_provider_circuit(provider: str) -> dict:
+    """
+    Retorna o estado do circuit breaker de um provedor de IA.
+
+    Args:
+        provider (str): Nome do provedor (ex: "gemini", "cohere", "mistral").
+
+    Returns:
+        dict: {"provider", "state", "consecutive_failures", "opened_at", "updated_at"},
+              ou None se o provedor ainda não tiver estado registrado.
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        cursor = conn.execute("""
+            SELECT provider, state, consecutive_failures, opened_at, updated_at
+            FROM provider_circuits WHERE provider = ?
+        """, (provider,))
+        row = cursor.fetchone()
+    except sqlite3.OperationalError:
+        # Tabela ainda não criada: circuito considerado fechado.
+        row = None
+    finally:
+        conn.close()
+
+    if row:
+        return {
+            "provider": row[0],
+            "state": row[1],
+            "consecutive_failures": row[2],
+            "opened_at": row[3],
+            "updated_at": row[4]
+        }
+    return None
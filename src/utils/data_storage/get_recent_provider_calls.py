@@ -0,0 +1,38 @@
+import sqlite3
+from datetime import datetime, timedelta
+from .database_config import DATABASE_PATH
+
+def get_recent_provider_calls(provider: str, limit: int = 20, max_age_minutes: int = 60) -> list:
+    """
+    Retorna as chamadas mais recentes feitas a um provedor de IA.
+
+    Args:
+        provider (str): Nome do provedor (ex: "gemini", "cohere", "mistral").
+        limit (int): Número máximo de chamadas retornadas.
+        max_age_minutes (int): Considera apenas chamadas feitas nos últimos N minutos.
+
+    Returns:
+        list: Lista de dicionários (da mais recente para a mais antiga) com as chaves
+              "status", "error_type", "latency_seconds" e "created_at".
+    """
+    since = (datetime.now() - timedelta(minutes=max_age_minutes)).strftime('%Y-%m-%d %H:%M:%S')
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        cursor = conn.execute("""
+            SELECT status, error_type, latency_seconds, created_at
+            FROM provider_calls
+            WHERE provider = ? AND created_at >= ?
+            ORDER BY id DESC
+            LIMIT ?
+        """, (provider, since, limit))
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError:
+        # Tabela ainda não criada: nenhum histórico disponível.
+        rows = []
+    finally:
+        conn.close()
+
+    return [
+        {"status": row[0], "error_type": row[1], "latency_seconds": row[2], "created_at": row[3]}
+        for row in rows
+    ]
@@ -4,8 +4,8 @@ from .database_config import DATABASE_PATH
 
 def init_db():
     """
-    Conecta-se ao banco de dados SQLite e cria as tabelas 'client_briefs' e 'client_profiles'
-    se elas não existirem. Garante que o diretório 'data' exista.
+    Conecta-se ao banco de dados SQLite e cria as tabelas 'client_briefs', 'client_profiles',
+    'provider_calls' e 'provider_circuits' se elas não existirem. Garante que o diretório 'data' exista.
     """
     DATA_DIR = os.path.dirname(DATABASE_PATH)
     # Criar o diretório 'data' se ele não existir
@@ -30,9 +30,15 @@ def init_db():
             tokens_consumed INTEGER,
             api_cost_usd REAL,
             delivery_date TEXT,
-            feedback_summary TEXT
+            feedback_summary TEXT,
+            briefing_fingerprint TEXT
         )
     """)
+    # Bancos criados antes da coluna briefing_fingerprint recebem a coluna aqui
+    brief_columns = {row[1] for row in cursor.execute("PRAGMA table_info(client_briefs)")}
+    if "briefing_fingerprint" not in brief_columns:
+        cursor.execute("ALTER TABLE client_briefs ADD COLUMN briefing_fingerprint TEXT")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_client_briefs_fingerprint ON client_briefs (client_name, briefing_fingerprint)")
 
     # Tabela client_profiles
     cursor.execute("""
@@ -43,10 +49,44 @@ def init_db():
             public_target TEXT,
             tone_of_voice TEXT,
             niche_examples TEXT,
-            status TEXT
+            status TEXT,
+            strategy_block TEXT,
+            strategy_version INTEGER,
+            strategy_fingerprint TEXT
         )
     """
     )
+    # Bancos criados antes do bloco de estratégia pré-calculado recebem as colunas aqui
+    profile_columns = {row[1] for row in cursor.execute("PRAGMA table_info(client_profiles)")}
+    for column, column_type in (("strategy_block", "TEXT"), ("strategy_version", "INTEGER"), ("strategy_fingerprint", "TEXT")):
+        if column not in profile_columns:
+            cursor.execute(f"ALTER TABLE client_profiles ADD COLUMN {column} {column_type}")
+
+    # Tabela provider_calls (histórico de chamadas às IAs, usado no registro de saúde dos provedores)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS provider_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            provider TEXT NOT NULL,
+            model TEXT,
+            operation TEXT,
+            status TEXT NOT NULL,
+            error_type TEXT,
+            latency_seconds REAL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_provider_calls_provider ON provider_calls (provider, created_at)")
+
+    # Tabela provider_circuits (estado do circuit breaker de cada provedor, compartilhado entre processos)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS provider_circuits (
+            provider TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            consecutive_failures INTEGER NOT NULL DEFAULT 0,
+            opened_at REAL,
+            updated_at REAL
+        )
+    """)
     conn.commit()
     conn.close()
     print("Banco de dados inicializado e tabelas criadas (se não existiam).")
\ No newline at end of file
@@ -2,10 +2,12 @@ import sqlite3
 import json
 from datetime import datetime
 from .database_config import DATABASE_PATH
+from src.utils.tracing import traced
 
+@traced("db.insert_brief")
 def insert_brief(client_name: str, subniche: str, brief_data: dict,
                  generated_content: dict, prompt_used: str, tokens_consumed: int,
-                 api_cost_usd: float, delivery_date: str = None):
+                 api_cost_usd: float, delivery_date: str = None, briefing_fingerprint: str = None):
     """
     Insere um novo registro de briefing e conteúdo gerado no banco de dados.
 
@@ -19,6 +21,8 @@ def insert_brief(client_name: str, subniche: str, brief_data: dict,
         api_cost_usd (float): Custo da API em USD.
         delivery_date (str, optional): Data de entrega no formato YYYY-MM-DD.
                                        Padrão para a data atual se não fornecido.
+        briefing_fingerprint (str, optional): Impressão digital do briefing (ver `briefing_fingerprint`),
+                                              usada para reaproveitar seções em execuções futuras.
     """
     if delivery_date is None:
         delivery_date = datetime.now().strftime('%Y-%m-%d')
@@ -27,10 +31,11 @@ def insert_brief(client_name: str, subniche: str, brief_data: dict,
     cursor = conn.cursor()
     cursor.execute("""
         INSERT INTO client_briefs (client_name, subniche, brief_data, generated_content,
-                                   prompt_used, tokens_consumed, api_cost_usd, delivery_date)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                                   prompt_used, tokens_consumed, api_cost_usd, delivery_date,
+                                   briefing_fingerprint)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
     """, (client_name, subniche, json.dumps(brief_data), json.dumps(generated_content),
-          prompt_used, tokens_consumed, api_cost_usd, delivery_date))
+          prompt_used, tokens_consumed, api_cost_usd, delivery_date, briefing_fingerprint))
     conn.commit()
     conn.close()
     print(f"Briefing para '{client_name}' inserido com sucesso.")
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sqlite3
 import json
 from .database_config import DATABASE_PATH
+from .profile_cache import invalidate_profile_cache
 
 def insert_client_profile(client_name: str, contact_info: str, public_target: str,
                           tone_of_voice: str, niche_examples: list, status: str = 'active'):
@@ -27,4 +28,5 @@ def insert_client_profile(client_name: str, contact_info: str, public_target: st
           json.dumps(niche_examples), status))
     conn.commit()
     conn.close()
+    invalidate_profile_cache(client_name)
     print(f"Perfil do cliente '{client_name}' inserido/atualizado com sucesso.")
\ No newline at end of file
@@ -0,0 +1,36 @@
+import sqlite3
+from datetime import datetime
+from .database_config import DATABASE_PATH
+from .init_db import init_db
+
+def insert_provider_call(provider: str, model: str, operation: str, status: str,
+                         latency_seconds: float, error_type: str = None):
+    """
+    Registra uma chamada feita a um provedor de IA.
+
+    Args:
+        provider (str): Nome do provedor (ex: "gemini", "cohere", "mistral").
+        model (str): Modelo utilizado na chamada.
+        operation (str): Função chamada (ex: "generate_text_content").
+        status (str): "success" ou "error".
+        latency_seconds (float): Duração da chamada em segundos.
+        error_type (str, optional): "api" para falhas da API/rede, "json" para respostas
+                                    que não puderam ser decodificadas/validadas.
+    """
+    row = (provider, model, operation, status, error_type, latency_seconds,
+           datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    sql = """
+        INSERT INTO provider_calls (provider, model, operation, status, error_type, latency_seconds, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        try:
+            conn.execute(sql, row)
+        except sqlite3.OperationalError:
+            # Banco ainda não inicializado neste ambiente: cria as tabelas e tenta de novo.
+            init_db()
+            conn.execute(sql, row)
+        conn.commit()
+    finally:
+        conn.close()
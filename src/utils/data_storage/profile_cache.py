@@ -0,0 +1,26 @@
+import copy
+
+# Perfis de clientes já lidos neste processo: client_name -> perfil
+_profile_cache = {}
+
+def get_cached_profile(client_name: str):
+    """
+    Retorna uma cópia do perfil em cache, ou None se o cliente não estiver em cache.
+    """
+    profile = _profile_cache.get(client_name)
+    return copy.deepcopy(profile) if profile is not None else None
+
+def set_cached_profile(client_name: str, profile: dict):
+    """
+    Guarda (uma cópia de) o perfil lido do banco de dados.
+    """
+    _profile_cache[client_name] = copy.deepcopy(profile)
+
+def invalidate_profile_cache(client_name: str = None):
+    """
+    Remove um perfil do cache (ou todos, se nenhum cliente for informado). Chamada a cada escrita.
+    """
+    if client_name is None:
+        _profile_cache.clear()
+    else:
+        _profile_cache.pop(client_name, None)
@@ -0,0 +1,37 @@
+import sqlite3
+import json
+from .database_config import DATABASE_PATH
+from .profile_cache import invalidate_profile_cache
+
+def save_client_strategy(client_name: str, strategy_block: dict, strategy_version: int, strategy_fingerprint: str) -> bool:
+    """
+    Salva o bloco de estratégia pré-calculado no perfil do cliente, apenas se ele mudou.
+
+    Args:
+        client_name (str): Nome do cliente.
+        strategy_block (dict): Resultado da análise estratégica (será armazenado como JSON string).
+        strategy_version (int): Versão do formato da análise estratégica.
+        strategy_fingerprint (str): Hash dos campos do briefing usados na análise.
+
+    Returns:
+        bool: True se o perfil foi atualizado; False se o bloco salvo já era o mesmo
+              (ou se o perfil não existe).
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        cursor = conn.execute("""
+            UPDATE client_profiles
+            SET strategy_block = ?, strategy_version = ?, strategy_fingerprint = ?
+            WHERE client_name = ?
+              AND (strategy_version IS NOT ? OR strategy_fingerprint IS NOT ?)
+        """, (json.dumps(strategy_block, ensure_ascii=False), strategy_version, strategy_fingerprint,
+              client_name, strategy_version, strategy_fingerprint))
+        conn.commit()
+        changed = cursor.rowcount > 0
+    finally:
+        conn.close()
+    invalidate_profile_cache(client_name)
+
+    if changed:
+        print(f"Estratégia pré-calculada do cliente '{client_name}' atualizada (versão {strategy_version}).")
+    return changed
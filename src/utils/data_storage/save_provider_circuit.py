@@ -0,0 +1,36 @@
+import sqlite3
+import time
+from .database_config import DATABASE_PATH
+from .init_db import init_db
+
+def save_provider_circuit(provider: str, state: str, consecutive_failures: int, opened_at: float = None):
+    """
+    Insere ou atualiza o estado do circuit breaker de um provedor de IA.
+
+    Args:
+        provider (str): Nome do provedor.
+        state (str): "closed", "open" ou "half_open".
+        consecutive_failures (int): Número de falhas consecutivas da API.
+        opened_at (float, optional): Momento (time.time()) em que o circuito abriu.
+    """
+    row = (provider, state, consecutive_failures, opened_at, time.time())
+    sql = """
+        INSERT INTO provider_circuits (provider, state, consecutive_failures, opened_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(provider) DO UPDATE SET
+            state = excluded.state,
+            consecutive_failures = excluded.consecutive_failures,
+            opened_at = excluded.opened_at,
+            updated_at = excluded.updated_at
+    """
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        try:
+            conn.execute(sql, row)
+        except sqlite3.OperationalError:
+            # Banco ainda não inicializado neste ambiente: cria as tabelas e tenta de novo.
+            init_db()
+            conn.execute(sql, row)
+        conn.commit()
+    finally:
+        conn.close()
@@ -1,10 +1,12 @@
 import sqlite3
 import json
 from .database_config import DATABASE_PATH
+from .profile_cache import invalidate_profile_cache
 
-def update_client_profile(client_name: str, contact_info: str, public_target: str, tone_of_voice: str, niche_examples: list):
+def update_client_profile(client_name: str, contact_info: str, public_target: str, tone_of_voice: str, niche_examples: list) -> bool:
     """
     Atualiza um perfil de cliente existente no banco de dados.
+    Se os dados forem iguais aos já salvos, nada é gravado.
 
     Args:
         client_name (str): O nome do cliente.
@@ -12,14 +14,24 @@ def update_client_profile(client_name: str, contact_info: str, public_target: st
         public_target (str): O público-alvo atualizado do cliente.
         tone_of_voice (str): O tom de voz preferido atualizado do cliente.
         niche_examples (list): Exemplos de nicho atualizados do cliente.
+
+    Returns:
+        bool: True se algum campo mudou e o perfil foi gravado; False caso contrário.
     """
+    niche_examples_json = json.dumps(niche_examples)
     conn = sqlite3.connect(DATABASE_PATH)
     cursor = conn.cursor()
     cursor.execute("""
         UPDATE client_profiles
         SET contact_info = ?, public_target = ?, tone_of_voice = ?, niche_examples = ?
         WHERE client_name = ?
-    """, (contact_info, public_target, tone_of_voice, json.dumps(niche_examples), client_name))
+          AND (contact_info IS NOT ? OR public_target IS NOT ? OR tone_of_voice IS NOT ? OR niche_examples IS NOT ?)
+    """, (contact_info, public_target, tone_of_voice, niche_examples_json, client_name,
+          contact_info, public_target, tone_of_voice, niche_examples_json))
     conn.commit()
+    changed = cursor.rowcount > 0
     conn.close()
-    print(f"Perfil do cliente '{client_name}' atualizado com sucesso.")
\ No newline at end of file
+    invalidate_profile_cache(client_name)
+    if changed:
+        print(f"Perfil do cliente '{client_name}' atualizado com sucesso.")
+    return changed
\ No newline at end of file
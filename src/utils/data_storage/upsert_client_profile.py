@@ -0,0 +1,63 @@
+import sqlite3
+import json
+from .database_config import DATABASE_PATH
+from .get_client_profile import profile_from_row
+from .profile_cache import get_cached_profile, set_cached_profile, invalidate_profile_cache
+
+def upsert_client_profile(client_name: str, contact_info: str, public_target: str,
+                          tone_of_voice: str, niche_examples: list, status: str = 'active'):
+    """
+    Cria o perfil do cliente ou atualiza os campos que mudaram, em uma única instrução.
+
+    Usa `INSERT ... ON CONFLICT DO UPDATE ... WHERE` (só grava se algum campo for diferente)
+    com `RETURNING`, em uma única conexão. Se o perfil em cache no processo já tiver os mesmos
+    dados, o banco de dados nem é consultado. Um perfil existente mantém seu `status` e o
+    bloco de estratégia pré-calculado.
+
+    Args:
+        client_name (str): Nome único do cliente.
+        contact_info (str): Informações de contato do cliente.
+        public_target (str): Público-alvo do cliente.
+        tone_of_voice (str): Tom de voz preferido do cliente.
+        niche_examples (list): Exemplos de nicho (será armazenado como JSON string).
+        status (str, optional): Status usado apenas na criação do perfil. Padrão é 'active'.
+
+    Returns:
+        tuple: (perfil do cliente (dict), True se o perfil foi criado ou alterado).
+    """
+    cached = get_cached_profile(client_name)
+    if (cached is not None and cached["contact_info"] == contact_info and cached["public_target"] == public_target
+            and cached["tone_of_voice"] == tone_of_voice and cached["niche_examples"] == niche_examples):
+        return cached, False
+
+    niche_examples_json = json.dumps(niche_examples)
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        row = conn.execute("""
+            INSERT INTO client_profiles (client_name, contact_info, public_target,
+                                         tone_of_voice, niche_examples, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (client_name) DO UPDATE SET
+                contact_info = excluded.contact_info,
+                public_target = excluded.public_target,
+                tone_of_voice = excluded.tone_of_voice,
+                niche_examples = excluded.niche_examples
+            WHERE contact_info IS NOT excluded.contact_info
+               OR public_target IS NOT excluded.public_target
+               OR tone_of_voice IS NOT excluded.tone_of_voice
+               OR niche_examples IS NOT excluded.niche_examples
+            RETURNING *
+        """, (client_name, contact_info, public_target, tone_of_voice, niche_examples_json, status)).fetchone()
+        changed = row is not None
+        if changed:
+            conn.commit()
+        else:
+            # Nada mudou: nenhuma linha é retornada, então lê o perfil existente na mesma conexão.
+            row = conn.execute("SELECT * FROM client_profiles WHERE client_name = ?", (client_name,)).fetchone()
+    finally:
+        conn.close()
+
+    invalidate_profile_cache(client_name)
+    profile = profile_from_row(row)
+    set_cached_profile(client_name, profile)
+    return profile, changed
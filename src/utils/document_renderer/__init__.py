@@ -0,0 +1,3 @@
+from .render_pool import get_render_pool, shutdown_render_pool
+from .render_briefing_documents import render_briefing_documents
+from .render_briefings_batch import render_briefings_batch
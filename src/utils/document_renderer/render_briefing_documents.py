@@ -0,0 +1,73 @@
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from src.utils.document_renderer.render_pool import get_render_pool, render_pdf_job, render_html_job
+from src.utils.tracing import current_traceparent
+from src.utils.pdf_generator.create_briefing_pdf_weasyprint import resolve_pdf_backend
+
+
+def render_briefing_documents(pdf_kwargs: dict = None, html_kwargs: dict = None) -> dict:
+    """
+    Renderiza o PDF e o HTML de um mesmo briefing ao mesmo tempo.
+
+    O PDF (ReportLab, limitado pela CPU) é enviado ao pool de processos enquanto o HTML
+    é gerado no processo atual. Se o pool não puder ser usado, o PDF é gerado aqui mesmo.
+    Com o backend weasyprint o layout é renderizado uma única vez: o HTML é gerado primeiro
+    e o PDF é convertido a partir dele.
+
+    Args:
+        pdf_kwargs (dict): Argumentos de `create_briefing_pdf` (None = não gerar PDF).
+        html_kwargs (dict): Argumentos de `create_briefing_html` (None = não gerar HTML).
+
+    Returns:
+        dict: {"status", "pdf", "html", "elapsed_seconds"}, em que "pdf" e "html" são os
+              resultados de cada documento ({"status", "path", "elapsed_seconds"}) ou None.
+              "status" é "success" apenas se todos os documentos pedidos foram gerados.
+    """
+    started_at = time.perf_counter()
+    if pdf_kwargs is not None and html_kwargs is not None and resolve_pdf_backend(pdf_kwargs.get("backend")) == "weasyprint":
+        return _render_from_html(pdf_kwargs, html_kwargs, started_at)
+
+    pdf_future = None
+    if pdf_kwargs is not None:
+        try:
+            pdf_future = get_render_pool().submit(render_pdf_job, pdf_kwargs, current_traceparent())
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"Aviso: pool de renderização indisponível ({e}). Gerando o PDF no processo atual.")
+
+    html_result = render_html_job(html_kwargs) if html_kwargs is not None else None
+
+    pdf_result = None
+    if pdf_kwargs is not None:
+        try:
+            pdf_result = pdf_future.result() if pdf_future is not None else render_pdf_job(pdf_kwargs)
+        except BrokenProcessPool as e:
+            print(f"Aviso: processo de renderização encerrado ({e}). Gerando o PDF no processo atual.")
+            pdf_result = render_pdf_job(pdf_kwargs)
+
+    return _summarize(pdf_result, html_result, started_at)
+
+
+def _render_from_html(pdf_kwargs: dict, html_kwargs: dict, started_at: float) -> dict:
+    """Gera o HTML e converte esse mesmo arquivo em PDF (backend weasyprint)."""
+    html_result = render_html_job(html_kwargs)
+    pdf_kwargs = dict(pdf_kwargs, backend="weasyprint")
+    if html_result["status"] == "success":
+        pdf_kwargs["html_filename"] = html_result["path"]
+    pdf_result = render_pdf_job(pdf_kwargs)
+    return _summarize(pdf_result, html_result, started_at)
+
+
+def _summarize(pdf_result: dict, html_result: dict, started_at: float) -> dict:
+    """Monta o resultado combinado dos documentos gerados."""
+    results = [result for result in (pdf_result, html_result) if result is not None]
+    for result in results:
+        if result["status"] == "error":
+            print(result["message"])
+
+    return {
+        "status": "success" if all(result["status"] == "success" for result in results) else "error",
+        "pdf": pdf_result,
+        "html": html_result,
+        "elapsed_seconds": round(time.perf_counter() - started_at, 3)
+    }
@@ -0,0 +1,59 @@
+import time
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from src.utils.document_renderer.render_pool import get_render_pool, render_pdf_job, render_html_job
+from src.utils.tracing import current_traceparent
+
+
+def render_briefings_batch(jobs: list, max_workers: int = None) -> list:
+    """
+    Renderiza os documentos de vários clientes de uma vez, distribuindo-os entre os núcleos.
+
+    Cada PDF e cada HTML vira uma tarefa independente no pool de processos, então o tempo
+    de uma semana em lote é limitado pelo número de núcleos, e não por um único interpretador.
+
+    Args:
+        jobs (list): Lista de dicionários {"pdf": pdf_kwargs, "html": html_kwargs}, um por cliente
+                     (qualquer uma das chaves pode ser omitida ou None).
+        max_workers (int): Número de processos do pool (padrão: número de núcleos).
+
+    Returns:
+        list: Um resultado por job, na mesma ordem, no formato de `render_briefing_documents`.
+    """
+    started_at = time.perf_counter()
+    results = [{"status": "success", "pdf": None, "html": None, "elapsed_seconds": 0.0} for _ in jobs]
+    pending = {}
+
+    try:
+        pool = get_render_pool(max_workers)
+        traceparent = current_traceparent()
+        for index, job in enumerate(jobs):
+            if job.get("pdf") is not None:
+                pending[pool.submit(render_pdf_job, job["pdf"], traceparent)] = (index, "pdf")
+            if job.get("html") is not None:
+                pending[pool.submit(render_html_job, job["html"], traceparent)] = (index, "html")
+
+        for future in as_completed(pending):
+            index, kind = pending[future]
+            results[index][kind] = future.result()
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        print(f"Aviso: pool de renderização indisponível ({e}). Gerando os documentos restantes no processo atual.")
+        for index, job in enumerate(jobs):
+            if job.get("pdf") is not None and results[index]["pdf"] is None:
+                results[index]["pdf"] = render_pdf_job(job["pdf"])
+            if job.get("html") is not None and results[index]["html"] is None:
+                results[index]["html"] = render_html_job(job["html"])
+
+    elapsed = round(time.perf_counter() - started_at, 3)
+    for result in results:
+        documents = [document for document in (result["pdf"], result["html"]) if document is not None]
+        for document in documents:
+            if document["status"] == "error":
+                print(document["message"])
+        result["status"] = "success" if all(document["status"] == "success" for document in documents) else "error"
+        result["elapsed_seconds"] = max((document["elapsed_seconds"] for document in documents), default=0.0)
+
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    print(f"Renderização em lote concluída: {succeeded}/{len(jobs)} clientes em {elapsed:.1f}s.")
+    return results
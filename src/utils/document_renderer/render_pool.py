@@ -0,0 +1,93 @@
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils.tracing import trace_span
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool(max_workers: int = None) -> ProcessPoolExecutor:
+    """
+    Retorna o pool de processos usado para renderizar os documentos (criado na primeira chamada).
+
+    O `doc.build` do ReportLab é limitado pela CPU; com um processo por núcleo, vários
+    documentos são renderizados em paralelo em vez de disputarem um único interpretador.
+
+    Args:
+        max_workers (int): Número de processos (padrão: número de núcleos da máquina).
+                           Só é considerado na criação do pool.
+
+    Returns:
+        ProcessPoolExecutor: O pool compartilhado do processo atual.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+        return _pool
+
+
+def shutdown_render_pool():
+    """Encerra o pool de renderização (chamado automaticamente ao sair do processo)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+atexit.register(shutdown_render_pool)
+
+
+def render_pdf_job(pdf_kwargs: dict, traceparent: str = None) -> dict:
+    """
+    Renderiza um PDF de briefing (executado dentro de um processo do pool).
+
+    Args:
+        pdf_kwargs (dict): Argumentos de `create_briefing_pdf`.
+        traceparent (str): Contexto do trace de quem enviou a tarefa (o span "render.pdf" fica
+                           ligado a ele mesmo rodando em outro processo).
+
+    Returns:
+        dict: {"status", "path", "elapsed_seconds"} e "message" em caso de erro.
+    """
+    from src.utils.pdf_generator.create_briefing_pdf import create_briefing_pdf
+
+    started_at = time.perf_counter()
+    with trace_span("render.pdf", parent=traceparent, backend=pdf_kwargs.get("backend") or "padrão") as span:
+        try:
+            create_briefing_pdf(**pdf_kwargs)
+        except Exception as e:
+            span.set_error(str(e))
+            return {"status": "error", "path": pdf_kwargs.get("output_filename"), "message": f"Erro ao gerar PDF: {e}",
+                    "elapsed_seconds": round(time.perf_counter() - started_at, 3)}
+    # A story retornada por create_briefing_pdf não é devolvida: não precisa atravessar o processo.
+    return {"status": "success", "path": pdf_kwargs["output_filename"], "elapsed_seconds": round(time.perf_counter() - started_at, 3)}
+
+
+def render_html_job(html_kwargs: dict, traceparent: str = None) -> dict:
+    """
+    Renderiza um HTML de briefing (no processo atual ou em um processo do pool).
+
+    Args:
+        html_kwargs (dict): Argumentos de `create_briefing_html`.
+        traceparent (str): Contexto do trace de quem enviou a tarefa (None = span atual).
+
+    Returns:
+        dict: {"status", "path", "elapsed_seconds"} e "message" em caso de erro.
+    """
+    from src.utils.html_generator.create_briefing_html import create_briefing_html
+
+    started_at = time.perf_counter()
+    with trace_span("render.html", parent=traceparent) as span:
+        try:
+            create_briefing_html(**html_kwargs)
+        except Exception as e:
+            span.set_error(str(e))
+            return {"status": "error", "path": html_kwargs.get("output_filename"), "message": f"Erro ao gerar HTML: {e}",
+                    "elapsed_seconds": round(time.perf_counter() - started_at, 3)}
+    return {"status": "success", "path": html_kwargs["output_filename"], "elapsed_seconds": round(time.perf_counter() - started_at, 3)}
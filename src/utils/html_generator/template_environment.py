@@ -0,0 +1,58 @@
+"""
+Ambiente Jinja2 compartilhado pelos geradores de HTML.
+
+Os templates ficam em `templates/` e são compilados uma única vez por processo
+(cache do ambiente) e uma única vez por máquina (cache de bytecode em disco), de
+modo que cada briefing apenas executa o código já compilado. O auto-escape fica
+ligado: textos da IA são escapados, exceto os já convertidos de Markdown
+(`Markup`, ver `formatar_texto_markdown`).
+"""
+
+import os
+import tempfile
+from functools import lru_cache
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Diretório do cache de bytecode (pode ser trocado com a variável de ambiente HTML_TEMPLATE_CACHE_DIR)
+TEMPLATE_CACHE_DIR_ENV = "HTML_TEMPLATE_CACHE_DIR"
+
+
+def _bytecode_cache_dir() -> str:
+    """Retorna (e cria, se preciso) o diretório do cache de bytecode dos templates."""
+    cache_dir = os.getenv(TEMPLATE_CACHE_DIR_ENV) or os.path.join(tempfile.gettempdir(), "fluxo_criativo_jinja_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+@lru_cache(maxsize=None)
+def get_template_environment() -> Environment:
+    """
+    Retorna o ambiente Jinja2 dos briefings (criado na primeira chamada e reutilizado).
+
+    Returns:
+        Environment: Ambiente com loader de `templates/`, auto-escape e cache de bytecode.
+    """
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(enabled_extensions=("html", "j2"), default_for_string=True, default=True),
+        bytecode_cache=FileSystemBytecodeCache(_bytecode_cache_dir()),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+
+
+def get_template(name: str):
+    """
+    Retorna um template compilado pelo nome (ex: "briefing.html.j2").
+
+    Args:
+        name (str): Caminho do template relativo a `templates/`.
+
+    Returns:
+        Template: O template compilado (mantido no cache do ambiente).
+    """
+    return get_template_environment().get_template(name)
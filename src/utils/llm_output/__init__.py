@@ -0,0 +1,5 @@
+from .repair_json_text import repair_json_text
+from .validate_campaign import validate_campaign
+from .parse_llm_json import parse_llm_json
+from .build_response_schema import build_response_schema
+from .campaign_model import Campaign, Post, CarouselSlide, VideoScene, ResponseScriptItem, build_campaign
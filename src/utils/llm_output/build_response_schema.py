@@ -0,0 +1,70 @@
+from functools import lru_cache
+
+from src.utils.llm_output.campaign_schema import (
+    CAMPAIGN_FIELDS,
+    REQUIRED_POST_FIELDS,
+    RESPONSE_SHAPES,
+    SCALAR,
+    TEXT,
+)
+
+GEMINI = "gemini"
+JSON_SCHEMA = "json_schema"
+
+_TYPE_NAMES = {
+    GEMINI: {"object": "OBJECT", "array": "ARRAY", "string": "STRING", "integer": "INTEGER"},
+    JSON_SCHEMA: {"object": "object", "array": "array", "string": "string", "integer": "integer"},
+}
+
+_REQUIRED = {
+    "campaign": ("weekly_strategy_summary", "posts"),
+    "post": REQUIRED_POST_FIELDS,
+}
+
+
+def _schema_for(spec, dialect: str, required: tuple = ()) -> dict:
+    """Converte a especificação declarativa de um campo no esquema do dialeto pedido."""
+    names = _TYPE_NAMES[dialect]
+
+    if isinstance(spec, tuple):
+        _, item_spec = spec
+        return {"type": names["array"], "items": _schema_for(item_spec, dialect, required)}
+
+    if isinstance(spec, dict):
+        properties = {}
+        for name, field_spec in spec.items():
+            field_spec = RESPONSE_SHAPES.get(name, field_spec)
+            nested_required = _REQUIRED["post"] if name == "posts" else ()
+            properties[name] = _schema_for(field_spec, dialect, nested_required)
+        schema = {"type": names["object"], "properties": properties}
+        if required:
+            schema["required"] = list(required)
+        return schema
+
+    if spec == SCALAR:
+        return {"type": names["integer"]}
+    if spec == TEXT:
+        return {"type": names["string"]}
+    # OBJECT / TEXT_OR_OBJECT sem formato detalhado: o texto é o denominador comum.
+    return {"type": names["string"]}
+
+
+@lru_cache(maxsize=None)
+def build_response_schema(dialect: str = JSON_SCHEMA) -> dict:
+    """
+    Gera o esquema JSON da campanha para os modos de saída estruturada das APIs.
+
+    O esquema é derivado de `campaign_schema` e calculado uma única vez por dialeto.
+    O dicionário retornado é compartilhado e não deve ser modificado.
+
+    Args:
+        dialect (str): "gemini" (subconjunto OpenAPI com tipos em maiúsculas, usado pelo
+                       `response_schema` do Gemini) ou "json_schema" (JSON Schema padrão,
+                       usado por Cohere e Mistral).
+
+    Returns:
+        dict: O esquema da resposta esperada.
+    """
+    if dialect not in _TYPE_NAMES:
+        raise ValueError(f"Dialeto de esquema desconhecido: {dialect}")
+    return _schema_for(CAMPAIGN_FIELDS, dialect, _REQUIRED["campaign"])
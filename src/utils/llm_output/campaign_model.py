@@ -0,0 +1,179 @@
+"""
+Modelo tipado da campanha usado por todos os renderizadores (PDF, HTML, Quick View).
+
+A resposta da IA é decodificada, validada pelo esquema compilado e convertida uma
+única vez em objetos com `__slots__`. Depois disso os renderizadores leem atributos
+diretamente, sem repetir `json.loads` nem verificações de tipo a cada campo.
+"""
+
+import copy
+import json
+from dataclasses import dataclass, field, fields, asdict
+from datetime import datetime
+from functools import lru_cache
+
+from src.utils.llm_output.parse_llm_json import parse_llm_json
+from src.utils.llm_output.validate_campaign import validate_campaign
+
+
+@dataclass(slots=True)
+class CarouselSlide:
+    titulo_slide: str = ""
+    texto_slide: str = ""
+    sugestao_visual_slide: str = ""
+
+
+@dataclass(slots=True)
+class VideoScene:
+    cena: object = None
+    descricao: str = ""
+    texto_tela: str = ""
+    fala: str = ""
+
+
+@dataclass(slots=True)
+class ResponseScriptItem:
+    comentario_generico: str = ""
+    resposta_sugerida: str = ""
+    comentario_negativo: str = ""
+    resposta_negativo: str = ""
+
+
+@dataclass(slots=True)
+class Post:
+    number: int
+    titulo: str = ""
+    tema: str = ""
+    legenda_principal: str = ""
+    variacoes_legenda: list = field(default_factory=list)
+    hashtags: list = field(default_factory=list)
+    horario_de_postagem: object = ""  # Texto ou dicionário {dia: horário}
+    sugestao_formato: str = ""
+    carrossel_slides: list = field(default_factory=list)  # list[CarouselSlide]
+    micro_roteiro: list = field(default_factory=list)  # list[VideoScene]
+    post_strategy_rationale: str = ""
+    micro_briefing: str = ""
+    visual_prompt_suggestion: str = ""
+    text_in_image: str = ""
+    visual_description_portuguese: str = ""
+    cta_individual: str = ""
+    ab_test_suggestions: str = ""
+    indicador_principal: str = ""
+    optimization_triggers: str = ""
+    interacao: str = ""
+    response_script: list = field(default_factory=list)  # list[ResponseScriptItem]
+
+
+@dataclass(slots=True)
+class Campaign:
+    posts: list = field(default_factory=list)  # list[Post]
+    weekly_strategy_summary: dict = field(default_factory=dict)  # Sempre um dicionário (ex: {"summary": ...})
+    future_strategy: object = ""  # Texto ou dicionário
+    market_references: list = field(default_factory=list)
+    suggested_metrics: dict = field(default_factory=dict)
+    start_date: datetime = None
+    generation_date: str = ""
+    fixes: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Converte a campanha de volta para o formato JSON das IAs (para exportadores)."""
+        posts = []
+        for post in self.posts:
+            data = asdict(post)
+            data.pop("number")
+            posts.append(data)
+        content = {
+            "weekly_strategy_summary": self.weekly_strategy_summary,
+            "future_strategy": self.future_strategy,
+            "market_references": self.market_references,
+            "posts": posts,
+            "metricas_de_sucesso_sugeridas": self.suggested_metrics,
+        }
+        if self.start_date:
+            content["start_date"] = self.start_date.strftime("%Y-%m-%d")
+        if self.generation_date:
+            content["generation_date"] = self.generation_date
+        return content
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple:
+    """Nomes dos campos de uma dataclass (calculados uma vez por classe)."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _build(cls, data: dict, **extra):
+    """Cria a dataclass apenas com as chaves conhecidas (ignora campos extras e valores nulos)."""
+    values = {name: data[name] for name in _field_names(cls) if data.get(name) is not None}
+    values.update(extra)
+    return cls(**values)
+
+
+def _build_post(data: dict, number: int) -> Post:
+    """Converte um post validado (dicionário) em `Post`."""
+    post = _build(Post, data, number=number)
+    post.carrossel_slides = [_build(CarouselSlide, slide) for slide in post.carrossel_slides]
+    post.micro_roteiro = [_build(VideoScene, scene) for scene in post.micro_roteiro]
+    post.response_script = [_build(ResponseScriptItem, item) for item in post.response_script]
+    return post
+
+
+def _normalize_summary(value) -> dict:
+    """O resumo semanal pode vir como texto, texto com JSON ou objeto; sempre vira dicionário."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            parsed = None
+        return parsed if isinstance(parsed, dict) else {"summary": value}
+    return {}
+
+
+def build_campaign(content_json) -> Campaign:
+    """
+    Decodifica, valida e converte o conteúdo gerado pela IA no modelo tipado da campanha.
+
+    Args:
+        content_json (dict | str | Campaign): O conteúdo da campanha (objeto, texto JSON
+                                              da resposta da IA ou uma campanha já construída).
+
+    Returns:
+        Campaign: A campanha normalizada. Problemas encontrados ficam em `fixes` e `errors`;
+                  o conteúdo nunca é rejeitado, para que o briefing sempre possa ser gerado.
+    """
+    if isinstance(content_json, Campaign):
+        return content_json
+
+    if isinstance(content_json, str):
+        parsed = parse_llm_json(content_json)
+        content_json = parsed.get("generated_content", {}) if parsed["status"] == "success" else {}
+
+    if not isinstance(content_json, (dict, list)):
+        content_json = {}
+
+    # A validação altera o conteúdo no lugar; o dicionário do chamador é preservado.
+    content, fixes, errors = validate_campaign(copy.deepcopy(content_json))
+    if not isinstance(content, dict):
+        content = {}
+
+    start_date = None
+    if content.get("start_date"):
+        try:
+            start_date = datetime.strptime(content["start_date"], "%Y-%m-%d")
+        except (TypeError, ValueError):
+            fixes.append("campanha.start_date: data inválida ignorada")
+
+    return Campaign(
+        posts=[_build_post(post, number) for number, post in enumerate(content.get("posts") or [], start=1)],
+        weekly_strategy_summary=_normalize_summary(content.get("weekly_strategy_summary")),
+        future_strategy=content.get("future_strategy") or "",
+        market_references=content.get("market_references") or [],
+        suggested_metrics=content.get("metricas_de_sucesso_sugeridas") or {},
+        start_date=start_date,
+        generation_date=content.get("generation_date") or "",
+        fixes=fixes,
+        errors=errors,
+    )
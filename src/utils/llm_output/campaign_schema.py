@@ -0,0 +1,172 @@
+"""
+Esquema da estrutura de campanha/posts retornada pelas IAs.
+
+O esquema é declarado uma única vez como dicionários simples e compilado na
+importação do módulo em regras imutáveis (`FieldRule`), reutilizadas por todas
+as validações do processo.
+"""
+
+from typing import NamedTuple
+
+TEXT = "text"
+LIST = "list"
+OBJECT = "object"
+TEXT_OR_OBJECT = "text_or_object"
+SCALAR = "scalar"
+
+RESPONSE_SCRIPT_ITEM = {
+    "comentario_generico": TEXT,
+    "resposta_sugerida": TEXT,
+    "comentario_negativo": TEXT,
+    "resposta_negativo": TEXT,
+}
+
+CAROUSEL_SLIDE = {
+    "titulo_slide": TEXT,
+    "texto_slide": TEXT,
+    "sugestao_visual_slide": TEXT,
+}
+
+VIDEO_SCENE = {
+    "cena": SCALAR,
+    "descricao": TEXT,
+    "texto_tela": TEXT,
+    "fala": TEXT,
+}
+
+MARKET_REFERENCE = {
+    "Nome/Handle": TEXT,
+    "Diferenciais": TEXT,
+    "Oportunidades": TEXT,
+    "Posicionamento do Cliente": TEXT,
+}
+
+POST_FIELDS = {
+    "titulo": TEXT,
+    "tema": TEXT,
+    "legenda_principal": TEXT,
+    "variacoes_legenda": (LIST, TEXT),
+    "hashtags": (LIST, TEXT),
+    "horario_de_postagem": TEXT_OR_OBJECT,
+    "sugestao_formato": TEXT,
+    "carrossel_slides": (LIST, CAROUSEL_SLIDE),
+    "micro_roteiro": (LIST, VIDEO_SCENE),
+    "post_strategy_rationale": TEXT,
+    "micro_briefing": TEXT,
+    "visual_prompt_suggestion": TEXT,
+    "text_in_image": TEXT,
+    "visual_description_portuguese": TEXT,
+    "cta_individual": TEXT,
+    "ab_test_suggestions": TEXT,
+    "indicador_principal": TEXT,
+    "optimization_triggers": TEXT,
+    "interacao": TEXT,
+    "response_script": (LIST, RESPONSE_SCRIPT_ITEM),
+}
+
+FUTURE_STRATEGY = {
+    "proximos_passos": TEXT,
+    "posts_nutricao": (LIST, {"tema": TEXT, "formato": TEXT, "objetivo": TEXT}),
+    "remarketing": (LIST, {"estrategia": TEXT, "canal": TEXT}),
+    "long_term": {"comunidade": TEXT, "parcerias": TEXT},
+}
+
+SUCCESS_METRICS = {
+    "objetivo_principal": TEXT,
+    "indicadores_chave": (LIST, TEXT),
+    "metricas_secundarias": (LIST, TEXT),
+}
+
+# Campos sem os quais os renderizadores (PDF/HTML/Quick View) não funcionam.
+REQUIRED_POST_FIELDS = ("titulo", "legenda_principal", "hashtags", "sugestao_formato", "cta_individual")
+
+CAMPAIGN_FIELDS = {
+    "weekly_strategy_summary": TEXT_OR_OBJECT,
+    "future_strategy": TEXT_OR_OBJECT,
+    "market_references": (LIST, MARKET_REFERENCE),
+    "posts": (LIST, POST_FIELDS),
+    "metricas_de_sucesso_sugeridas": OBJECT,
+}
+
+# Formato detalhado dos campos flexíveis, usado apenas no esquema enviado aos modos
+# de saída estruturada das APIs (a validação continua aceitando texto ou objeto).
+RESPONSE_SHAPES = {
+    "weekly_strategy_summary": TEXT,
+    "future_strategy": FUTURE_STRATEGY,
+    "horario_de_postagem": TEXT,
+    "metricas_de_sucesso_sugeridas": SUCCESS_METRICS,
+}
+
+# Nomes alternativos que as IAs costumam usar para os mesmos campos.
+POST_ALIASES = {
+    "title": "titulo",
+    "titulo_post": "titulo",
+    "theme": "tema",
+    "caption": "legenda_principal",
+    "legenda": "legenda_principal",
+    "main_caption": "legenda_principal",
+    "variacoes": "variacoes_legenda",
+    "variacoes_de_legenda": "variacoes_legenda",
+    "caption_variations": "variacoes_legenda",
+    "hashtag": "hashtags",
+    "horario": "horario_de_postagem",
+    "posting_time": "horario_de_postagem",
+    "formato": "sugestao_formato",
+    "formato_sugerido": "sugestao_formato",
+    "slides": "carrossel_slides",
+    "carousel_slides": "carrossel_slides",
+    "roteiro": "micro_roteiro",
+    "cta": "cta_individual",
+    "chamada_para_acao": "cta_individual",
+    "roteiro_de_respostas": "response_script",
+}
+
+CAMPAIGN_ALIASES = {
+    "postagens": "posts",
+    "ideias_de_posts": "posts",
+    "resumo_estrategia_semanal": "weekly_strategy_summary",
+    "weekly_summary": "weekly_strategy_summary",
+    "estrategia_futura": "future_strategy",
+    "referencias_de_mercado": "market_references",
+    "metricas_de_sucesso": "metricas_de_sucesso_sugeridas",
+    "suggested_metrics": "metricas_de_sucesso_sugeridas",
+    "success_metrics": "metricas_de_sucesso_sugeridas",
+}
+
+# Chaves que às vezes envolvem a campanha inteira (ex: {"campanha": {...}}).
+CAMPAIGN_WRAPPERS = ("generated_content", "campanha", "campaign", "content", "conteudo", "data")
+
+
+class FieldRule(NamedTuple):
+    """Regra compilada de um campo: tipo esperado e regras dos itens (para listas de objetos)."""
+    name: str
+    kind: str
+    item_kind: str = None
+    item_rules: tuple = ()
+
+
+def compile_fields(fields: dict) -> tuple:
+    """
+    Compila um dicionário declarativo de campos em uma tupla de `FieldRule`.
+
+    Args:
+        fields (dict): Mapeamento nome -> tipo (ou (LIST, tipo_do_item)).
+
+    Returns:
+        tuple: As regras compiladas, na ordem de declaração.
+    """
+    rules = []
+    for name, spec in fields.items():
+        if isinstance(spec, tuple):
+            _, item_spec = spec
+            if isinstance(item_spec, dict):
+                rules.append(FieldRule(name, LIST, OBJECT, compile_fields(item_spec)))
+            else:
+                rules.append(FieldRule(name, LIST, item_spec))
+        else:
+            rules.append(FieldRule(name, spec))
+    return tuple(rules)
+
+
+COMPILED_POST_RULES = compile_fields(POST_FIELDS)
+COMPILED_CAMPAIGN_RULES = compile_fields(CAMPAIGN_FIELDS)
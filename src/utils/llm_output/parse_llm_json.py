@@ -0,0 +1,54 @@
+import json
+
+from src.utils.llm_output.repair_json_text import repair_json_text
+from src.utils.llm_output.validate_campaign import validate_campaign
+from src.utils.tracing import traced
+
+
+@traced("llm.parse_json")
+def parse_llm_json(raw_text: str, validate: bool = True) -> dict:
+    """
+    Decodifica a resposta de uma IA em JSON, reparando e validando o conteúdo.
+
+    Primeiro tenta decodificar o texto diretamente; se falhar, aplica `repair_json_text`
+    e tenta novamente. Com `validate=True`, o resultado é conferido contra o esquema de
+    campanha e corrigido por `validate_campaign`.
+
+    Args:
+        raw_text (str): A resposta bruta do modelo.
+        validate (bool): Se True, valida o conteúdo contra o esquema de campanha.
+
+    Returns:
+        dict: {"status": "success", "generated_content": ..., "repairs": [...]} em caso de
+              sucesso, ou {"status": "error", "error_type": "json", "message": ...} se o
+              texto não puder ser recuperado ou não tiver a estrutura mínima de campanha.
+    """
+    repairs = []
+    text = (raw_text or "").strip()
+
+    try:
+        content = json.loads(text)
+    except json.JSONDecodeError:
+        repaired_text, repairs = repair_json_text(text)
+        try:
+            content = json.loads(repaired_text, strict=False)
+        except json.JSONDecodeError as e:
+            return {
+                "status": "error",
+                "error_type": "json",
+                "message": f"Erro ao decodificar JSON mesmo após reparo: {e}",
+                "repairs": repairs,
+            }
+
+    if validate:
+        content, fixes, errors = validate_campaign(content)
+        repairs = repairs + fixes
+        if errors:
+            return {
+                "status": "error",
+                "error_type": "json",
+                "message": "Resposta fora do esquema esperado: " + " ".join(errors),
+                "repairs": repairs,
+            }
+
+    return {"status": "success", "generated_content": content, "repairs": repairs}
@@ -0,0 +1,240 @@
+import json
+
+_VALUE_END_CHARS = '"}]0123456789el'
+_LITERALS = ("true", "false", "null")
+
+
+def _last_significant(out: list) -> str:
+    """Retorna o último caractere não-branco já emitido (ou '' se não houver)."""
+    for chunk in reversed(out):
+        stripped = chunk.rstrip()
+        if stripped:
+            return stripped[-1]
+    return ''
+
+
+def _drop_trailing_comma(out: list) -> bool:
+    """Remove uma vírgula pendente no final da saída. Retorna True se removeu."""
+    while out and not out[-1].strip():
+        out.pop()
+    if out and out[-1].rstrip().endswith(','):
+        out[-1] = out[-1].rstrip()[:-1]
+        return True
+    return False
+
+
+def _next_significant(text: str, start: int) -> tuple:
+    """Retorna (índice, caractere) do próximo caractere não-branco a partir de `start`."""
+    length = len(text)
+    while start < length and text[start] in ' \t\r\n':
+        start += 1
+    return start, (text[start] if start < length else '')
+
+
+def _closes_string(text: str, position: int, stack: list) -> bool:
+    """
+    Indica se as aspas em `position` fecham a string atual, pelo que vem depois delas.
+
+    Após uma vírgula, o texto precisa continuar como estrutura JSON (próxima chave em um
+    objeto, próximo valor em um array); caso contrário, as aspas são internas ao texto.
+    """
+    j, following = _next_significant(text, position + 1)
+    if following == '' or following in ':}]':
+        return True
+    if following != ',':
+        return False
+    k, after = _next_significant(text, j + 1)
+    if after == '' or after in '"}]':
+        return True
+    if stack and stack[-1] == '{':
+        return False
+    return after in '{[-' or after.isdigit() or any(text.startswith(literal, k) for literal in _LITERALS)
+
+
+def _close_containers(out: list, stack: list) -> str:
+    """Fecha os arrays/objetos abertos, descartando vírgulas e chaves pendentes."""
+    out = list(out)
+    previous = _last_significant(out)
+    if previous == ':':
+        out.append('null')
+    elif previous == ',':
+        _drop_trailing_comma(out)
+    closing = ''.join('}' if opened == '{' else ']' for opened in reversed(stack))
+    return ''.join(out) + closing
+
+
+def _is_valid(text: str) -> bool:
+    """Indica se o texto é JSON válido (aceitando caracteres de controle em strings)."""
+    try:
+        json.loads(text, strict=False)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+def repair_json_text(raw_text: str) -> tuple:
+    """
+    Repara, em uma única passada, o texto JSON retornado por uma IA.
+
+    Corrige os defeitos mais comuns observados nas respostas do Gemini, Cohere e Mistral:
+    blocos ```json e texto ao redor, comentários `//`, chaves duplicadas `{{ }}` copiadas
+    do prompt, vírgulas finais ou ausentes, aspas internas não escapadas, quebras de linha
+    dentro de strings, valores sem aspas e JSON truncado (strings, arrays e objetos abertos).
+
+    Args:
+        raw_text (str): A resposta bruta do modelo.
+
+    Returns:
+        tuple: (texto_json_reparado, lista_de_reparos). A lista descreve cada tipo de
+               reparo aplicado e fica vazia quando o texto já era válido.
+    """
+    repairs = []
+
+    def note(message):
+        if message not in repairs:
+            repairs.append(message)
+
+    text = raw_text or ''
+    start = -1
+    for i, char in enumerate(text):
+        if char in '{[':
+            start = i
+            break
+    if start < 0:
+        return '', ["nenhum objeto JSON encontrado"]
+    if text[:start].strip():
+        note("texto antes do JSON removido")
+
+    out = []
+    stack = []
+    in_string = False
+    escaped = False
+    skipped_braces = 0
+    length = len(text)
+    i = start
+    finished = False
+    checkpoints = []
+
+    while i < length:
+        char = text[i]
+
+        if in_string:
+            if escaped:
+                out.append(char)
+                escaped = False
+            elif char == '\\':
+                out.append(char)
+                escaped = True
+            elif char == '"':
+                j, following = _next_significant(text, i + 1)
+                if _closes_string(text, i, stack):
+                    out.append(char)
+                    in_string = False
+                elif following == '"' and '\n' in text[i + 1:j]:
+                    # Fim de valor seguido de nova chave na linha de baixo: falta a vírgula.
+                    out.append('",')
+                    in_string = False
+                    note("vírgula ausente inserida")
+                else:
+                    out.append('\\"')
+                    note("aspas internas escapadas")
+            elif char == '\n':
+                out.append('\\n')
+            elif char == '\r':
+                pass
+            elif char == '\t':
+                out.append('\\t')
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char == '"':
+            if stack and _last_significant(out) in _VALUE_END_CHARS:
+                out.append(',')
+                note("vírgula ausente inserida")
+            out.append(char)
+            in_string = True
+        elif char == '/' and text[i + 1:i + 2] == '/':
+            end = text.find('\n', i)
+            i = length if end < 0 else end
+            note("comentários removidos")
+            continue
+        elif char == '/' and text[i + 1:i + 2] == '*':
+            end = text.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            note("comentários removidos")
+            continue
+        elif char in '{[':
+            previous = _last_significant(out)
+            if char == '{' and previous == '{' and text[i - 1] == '{':
+                skipped_braces += 1
+                note("chaves duplicadas removidas")
+            else:
+                if stack and previous in _VALUE_END_CHARS:
+                    out.append(',')
+                    note("vírgula ausente inserida")
+                stack.append(char)
+                out.append(char)
+        elif char in '}]':
+            if char == '}' and skipped_braces and text[i - 1] == '}' and _last_significant(out) == '}':
+                skipped_braces -= 1
+                i += 1
+                continue
+            if _drop_trailing_comma(out):
+                note("vírgulas finais removidas")
+            expected = '}' if char == '}' else ']'
+            while stack and ('}' if stack[-1] == '{' else ']') != expected:
+                out.append('}' if stack.pop() == '{' else ']')
+                note("estruturas não fechadas corrigidas")
+            if stack:
+                stack.pop()
+                out.append(char)
+            if not stack:
+                finished = True
+                i += 1
+                break
+        elif char == ',':
+            if _last_significant(out) in ',[{':
+                note("vírgulas duplicadas removidas")
+            else:
+                out.append(char)
+                checkpoints.append((len(out) - 1, tuple(stack)))
+        elif char.isalpha() and _last_significant(out) == ':':
+            end = text.find('\n', i)
+            segment = text[i:] if end < 0 else text[i:end]
+            cut = len(segment)
+            for terminator in ('}', ']', ', "'):
+                position = segment.find(terminator)
+                if position >= 0:
+                    cut = min(cut, position)
+            value = segment[:cut].rstrip().rstrip(',').rstrip()
+            if value in _LITERALS:
+                out.append(value)
+            else:
+                out.append('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"')
+                note("valores sem aspas convertidos em texto")
+            i += cut
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    if finished and text[i:].strip().strip('`').strip():
+        note("texto após o JSON removido")
+
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+        note("JSON truncado: string fechada")
+    if stack:
+        repaired = _close_containers(out, stack)
+        if not _is_valid(repaired) and checkpoints:
+            # Truncado no meio de um par chave/valor: descarta o último item incompleto.
+            position, open_stack = checkpoints[-1]
+            repaired = _close_containers(out[:position], list(open_stack))
+        note("JSON truncado: arrays/objetos fechados")
+        return repaired, repairs
+
+    return ''.join(out), repairs
@@ -0,0 +1,199 @@
+import json
+
+from src.utils.llm_output.campaign_schema import (
+    CAMPAIGN_ALIASES,
+    CAMPAIGN_WRAPPERS,
+    COMPILED_CAMPAIGN_RULES,
+    LIST,
+    OBJECT,
+    POST_ALIASES,
+    REQUIRED_POST_FIELDS,
+    SCALAR,
+    TEXT,
+    TEXT_OR_OBJECT,
+)
+from src.utils.llm_output.repair_json_text import repair_json_text
+
+
+def _rename_aliases(data: dict, aliases: dict, fixes: list, where: str) -> dict:
+    """Renomeia chaves alternativas para o nome canônico, sem sobrescrever chaves existentes."""
+    for alias, canonical in aliases.items():
+        if alias in data and canonical not in data:
+            data[canonical] = data.pop(alias)
+            fixes.append(f"{where}: campo '{alias}' renomeado para '{canonical}'")
+    return data
+
+
+def _parse_embedded_json(value):
+    """Tenta converter uma string contendo JSON (como às vezes a IA devolve) em objeto."""
+    if not isinstance(value, str) or not value.strip().startswith(('{', '[')):
+        return None
+    repaired, _ = repair_json_text(value)
+    try:
+        return json.loads(repaired, strict=False)
+    except json.JSONDecodeError:
+        return None
+
+
+def _coerce_text(value):
+    """Converte valores escalares/listas em texto; None vira string vazia."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return "\n".join(_coerce_text(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _coerce_field(rule, value, fixes: list, where: str):
+    """Ajusta o valor de um campo ao tipo declarado na regra compilada."""
+    name = f"{where}.{rule.name}"
+
+    if rule.kind == TEXT:
+        if not isinstance(value, str):
+            fixes.append(f"{name}: convertido para texto")
+            return _coerce_text(value)
+        return value
+
+    if rule.kind == TEXT_OR_OBJECT:
+        if value is None:
+            fixes.append(f"{name}: valor nulo substituído por texto vazio")
+            return ""
+        if not isinstance(value, (str, dict)):
+            fixes.append(f"{name}: convertido para texto")
+            return _coerce_text(value)
+        return value
+
+    if rule.kind == SCALAR:
+        return value
+
+    if rule.kind == OBJECT:
+        if isinstance(value, dict):
+            return value
+        parsed = _parse_embedded_json(value)
+        fixes.append(f"{name}: valor inválido substituído por objeto")
+        return parsed if isinstance(parsed, dict) else {}
+
+    # LIST
+    if value is None:
+        fixes.append(f"{name}: valor nulo substituído por lista vazia")
+        return []
+    if isinstance(value, str):
+        parsed = _parse_embedded_json(value)
+        if isinstance(parsed, list):
+            value = parsed
+        elif rule.item_kind == TEXT:
+            separator = "," if "," in value else None
+            fixes.append(f"{name}: texto dividido em lista")
+            return [item.strip() for item in value.split(separator) if item.strip()]
+        else:
+            fixes.append(f"{name}: texto não estruturado descartado")
+            return []
+    elif isinstance(value, dict):
+        fixes.append(f"{name}: objeto único convertido em lista")
+        value = [value]
+    elif not isinstance(value, list):
+        fixes.append(f"{name}: valor inválido substituído por lista vazia")
+        return []
+
+    if rule.item_kind == TEXT:
+        if any(not isinstance(item, str) for item in value):
+            fixes.append(f"{name}: itens convertidos para texto")
+            value = [_coerce_text(item) for item in value]
+        return value
+
+    if rule.item_kind == OBJECT:
+        items = []
+        for index, item in enumerate(value):
+            if isinstance(item, str):
+                parsed = _parse_embedded_json(item)
+                if not isinstance(parsed, dict):
+                    fixes.append(f"{name}[{index}]: item não estruturado descartado")
+                    continue
+                item = parsed
+            if not isinstance(item, dict):
+                fixes.append(f"{name}[{index}]: item inválido descartado")
+                continue
+            for item_rule in rule.item_rules:
+                if item_rule.name in item:
+                    item[item_rule.name] = _coerce_field(item_rule, item[item_rule.name], fixes, f"{name}[{index}]")
+            items.append(item)
+        return items
+
+    return value
+
+
+def _unwrap_campaign(content, fixes: list):
+    """Remove envelopes como {"campanha": {...}} e converte uma lista solta de posts em campanha."""
+    if isinstance(content, list):
+        fixes.append("lista de posts envolvida em objeto de campanha")
+        return {"posts": content}
+    while isinstance(content, dict) and len(content) == 1:
+        key = next(iter(content))
+        inner = content[key]
+        if key in CAMPAIGN_WRAPPERS and isinstance(inner, (dict, list)):
+            fixes.append(f"envelope '{key}' removido")
+            content = inner if isinstance(inner, dict) else {"posts": inner}
+        else:
+            break
+    return content
+
+
+def validate_campaign(content) -> tuple:
+    """
+    Valida e corrige a estrutura de campanha gerada pela IA, usando o esquema compilado.
+
+    Campos com nomes alternativos são renomeados, tipos são ajustados (ex: hashtags em
+    texto viram lista, números viram texto, nulos viram valores vazios) e métricas
+    colocadas por engano dentro de um post são movidas para o nível da campanha.
+    Apenas problemas estruturais que impedem a geração do briefing são considerados erros.
+
+    Args:
+        content (dict | list): O conteúdo já decodificado da resposta da IA.
+
+    Returns:
+        tuple: (conteudo_corrigido, lista_de_correcoes, lista_de_erros).
+    """
+    fixes = []
+    errors = []
+
+    content = _unwrap_campaign(content, fixes)
+    if not isinstance(content, dict):
+        return content, fixes, ["A resposta não é um objeto JSON de campanha."]
+
+    content = _rename_aliases(content, CAMPAIGN_ALIASES, fixes, "campanha")
+
+    posts = content.get("posts")
+    if isinstance(posts, list):
+        for post in posts:
+            if isinstance(post, dict):
+                _rename_aliases(post, POST_ALIASES, fixes, "post")
+                misplaced = post.pop("metricas_de_sucesso_sugeridas", None)
+                if misplaced is not None and "metricas_de_sucesso_sugeridas" not in content:
+                    content["metricas_de_sucesso_sugeridas"] = misplaced
+                    fixes.append("métricas de sucesso movidas do post para a campanha")
+
+    for rule in COMPILED_CAMPAIGN_RULES:
+        if rule.name in content:
+            content[rule.name] = _coerce_field(rule, content[rule.name], fixes, "campanha")
+        elif rule.kind == LIST and rule.name != "posts":
+            content[rule.name] = []
+
+    posts = content.get("posts")
+    if posts is None:
+        errors.append("Campo obrigatório 'posts' ausente.")
+    elif not posts:
+        errors.append("A lista 'posts' está vazia.")
+    else:
+        for index, post in enumerate(posts, start=1):
+            if not post.get("titulo") and not post.get("legenda_principal"):
+                errors.append(f"Post {index} sem 'titulo' e sem 'legenda_principal'.")
+                continue
+            post.setdefault("titulo", f"Post {index}")
+            for field in REQUIRED_POST_FIELDS:
+                post.setdefault(field, [] if field == "hashtags" else "")
+
+    return content, fixes, errors
@@ -0,0 +1,43 @@
+def build_generation_inputs(brief_data, nome_do_cliente, conteudos_semanais):
+    """
+    Monta, a partir do briefing, os dados usados por qualquer provedor na geração de conteúdo.
+
+    Args:
+        brief_data (dict): Dados completos do briefing do cliente.
+        nome_do_cliente (str): Nome do cliente.
+        conteudos_semanais (list): Lista de dicionários com os objetivos de conteúdo semanais.
+
+    Returns:
+        tuple: (client_data, niche_data, weekly_themes_list, campaign_type)
+    """
+    weekly_themes_list = [item.get("objetivo_do_conteudo_individual", "") for item in conteudos_semanais]
+    campaign_type = brief_data.get("tipo_de_campanha", "lancamento")
+
+    client_data = {
+        "nome_do_cliente": nome_do_cliente,
+        "informacoes_de_contato": brief_data.get("informacoes_de_contato"),
+        "publico_alvo": brief_data.get("publico_alvo"),
+        "tom_de_voz": brief_data.get("tom_de_voz"),
+        "exemplos_de_nicho": brief_data.get("exemplos_de_nicho"),
+        "estilo_de_comunicacao": brief_data.get("estilo_de_comunicacao"),
+        "vocabulario_da_marca": brief_data.get("vocabulario_da_marca"),
+        "canais_de_distribuicao": brief_data.get("canais_de_distribuicao"),
+        "subnicho": brief_data.get("subnicho"),
+        "analise_swot": brief_data.get("analise_swot"),
+        "publico_alvo_detalhado": brief_data.get("publico_alvo_detalhado"),
+        "objetivos_de_marketing": brief_data.get("objetivos_de_marketing"),
+        "topicos_principais": brief_data.get("topicos_principais"),
+        "palavras_chave": brief_data.get("palavras_chave"),
+        "chamada_para_acao": brief_data.get("chamada_para_acao"),
+        "restricoes_e_diretrizes": brief_data.get("restricoes_e_diretrizes"),
+        "informacoes_adicionais": brief_data.get("informacoes_adicionais"),
+        "referencias_de_estilo_e_formato": brief_data.get("referencias_de_estilo_e_formato")
+    }
+
+    niche_data = {
+        "subnicho": brief_data.get("subnicho"),
+        "exemplos_de_nicho": brief_data.get("exemplos_de_nicho"),
+        "analise_de_concorrentes_referencias": brief_data.get("analise_de_concorrentes_referencias")
+    }
+
+    return client_data, niche_data, weekly_themes_list, campaign_type
@@ -0,0 +1,59 @@
+import os
+from datetime import datetime
+
+from src.utils.document_renderer import render_briefing_documents
+from src.utils.llm_output.campaign_model import build_campaign
+
+def generate_briefing_documents(content_json: dict, client_name: str, output_dir: str, target_audience: str, tone_of_voice: str, marketing_objectives: str, model_name: str):
+    """
+    Gera o PDF e o HTML do briefing ao mesmo tempo (o PDF em um processo separado).
+
+    Args:
+        content_json (dict | Campaign): O conteúdo JSON gerado pela IA (ou a campanha já convertida).
+        client_name (str): O nome do cliente.
+        output_dir (str): O diretório de saída dos documentos.
+        target_audience (str): O público-alvo do briefing.
+        tone_of_voice (str): O tom de voz a ser utilizado no briefing.
+        marketing_objectives (str): Os objetivos de marketing do briefing.
+        model_name (str): Nome do modelo de IA que gerou o conteúdo.
+
+    Returns:
+        tuple: (caminho do PDF, caminho do HTML); cada um é None se o documento não foi gerado.
+    """
+    print("\n--- Gerando Relatórios PDF e HTML ---")
+    # Cria o diretório específico do modelo, se não existir
+    model_output_dir = os.path.join(output_dir, model_name)
+    os.makedirs(model_output_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    pdf_filepath = os.path.join(model_output_dir, f"{model_name}_briefing_{client_name}_{timestamp}.pdf")
+    html_filepath = os.path.join(model_output_dir, f"{model_name}_briefing_{client_name.replace(' ', '_')}_{timestamp}.html")
+
+    # Valida o conteúdo uma única vez: o PDF e o HTML recebem a mesma campanha tipada
+    campaign = build_campaign(content_json)
+
+    result = render_briefing_documents(
+        pdf_kwargs={
+            "content_json": campaign,
+            "client_name": client_name,
+            "output_filename": pdf_filepath,
+            "target_audience": target_audience,
+            "tone_of_voice": tone_of_voice,
+            "marketing_objectives": marketing_objectives,
+            "suggested_metrics": campaign.suggested_metrics,
+            "model_name": model_name,
+        },
+        html_kwargs={
+            "content_json": campaign,
+            "client_name": client_name,
+            "output_filename": html_filepath,
+            "target_audience": target_audience,
+            "tone_of_voice": tone_of_voice,
+            "marketing_objectives": marketing_objectives,
+        }
+    )
+    print(f"Documentos renderizados em {result['elapsed_seconds']:.1f}s.")
+
+    pdf_path = pdf_filepath if result["pdf"]["status"] == "success" else None
+    html_path = html_filepath if result["html"]["status"] == "success" else None
+    return pdf_path, html_path
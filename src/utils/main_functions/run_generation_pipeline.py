@@ -0,0 +1,62 @@
+from src.content_generator_race import RACE_PROVIDER
+from src.llm_client.providers import get_provider
+from src.utils.tracing import trace_span
+from src.utils.main_functions.initialize_environment import initialize_environment
+from src.utils.main_functions.collect_and_validate_briefing import collect_and_validate_briefing
+from src.utils.main_functions.get_or_create_client_profile import get_or_create_client_profile
+from src.utils.main_functions.generate_social_media_content import generate_social_media_content
+from src.utils.main_functions.save_content_to_database import save_content_to_database
+from src.utils.main_functions.generate_briefing_documents import generate_briefing_documents
+from src.utils.main_functions.display_success_message import display_success_message
+
+def run_generation_pipeline(provider):
+    """
+    Orquestra o fluxo de processamento do Concierge MVP com um provedor de IA:
+    inicialização do DB, coleta de briefing, geração de conteúdo,
+    salvamento no DB e geração de PDF/HTML.
+
+    Args:
+        provider (str): Provedor registrado em `src/llm_client/providers.py` (ex: "gemini", "cohere", "mistral")
+                        ou RACE_PROVIDER ("race"): o briefing é enviado aos provedores ao mesmo tempo e a
+                        primeira resposta válida é usada.
+    """
+    if provider == RACE_PROVIDER:
+        provider_name, display_name = RACE_PROVIDER, "corrida entre provedores"
+    else:
+        llm_provider = get_provider(provider)
+        provider_name, display_name = llm_provider.name, llm_provider.display_name
+    print(f"\n--- Iniciando Concierge MVP ({display_name}) ---")
+
+    with trace_span("pipeline.stage", **{"llm.provider": provider_name}) as span:
+        output_dir = initialize_environment()
+
+        brief_data, nome_do_cliente, subnicho, informacoes_de_contato, \
+        publico_alvo, tom_de_voz, exemplos_de_nicho, tipo_de_conteudo, \
+        conteudos_semanais, objetivos_de_marketing = collect_and_validate_briefing()
+
+        if nome_do_cliente is None:
+            return
+        span.set_attribute("client.name", nome_do_cliente)
+
+        get_or_create_client_profile(
+            nome_do_cliente,
+            informacoes_de_contato,
+            publico_alvo,
+            tom_de_voz,
+            exemplos_de_nicho
+        )
+
+        generated_content, prompt_used_for_content_generation, tokens_consumed, api_cost_usd, model_name = \
+            generate_social_media_content(brief_data, nome_do_cliente, tipo_de_conteudo, conteudos_semanais, objetivos_de_marketing, provider=provider)
+
+        if generated_content is None:
+            return
+
+        save_content_to_database(brief_data, nome_do_cliente, generated_content, prompt_used_for_content_generation, tokens_consumed, api_cost_usd, model_name=model_name)
+
+        # Gerar PDF e HTML (em paralelo)
+        output_pdf_filename, output_html_filename = generate_briefing_documents(generated_content, nome_do_cliente, output_dir, publico_alvo, tom_de_voz, objetivos_de_marketing, model_name=model_name)
+        if output_pdf_filename is None or output_html_filename is None:
+            return
+
+        display_success_message(output_pdf_filename, api_cost_usd)
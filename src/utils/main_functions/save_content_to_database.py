@@ -2,6 +2,7 @@ import json
 import os
 from datetime import datetime
 from src.data_storage import insert_brief
+from src.utils.briefing_ingestion import briefing_fingerprint
 
 def save_content_to_database(brief_data, nome_do_cliente, generated_content, prompt_used_for_content_generation, tokens_consumed, api_cost_usd, model_name):
     """
@@ -38,7 +39,8 @@ def save_content_to_database(brief_data, nome_do_cliente, generated_content, pro
             prompt_used=prompt_used_for_content_generation,
             tokens_consumed=tokens_consumed,
             api_cost_usd=api_cost_usd,
-            delivery_date=timestamp
+            delivery_date=timestamp,
+            briefing_fingerprint=briefing_fingerprint(brief_data)
         )
         print("Briefing e conteúdo salvos no banco de dados com sucesso!")
     except Exception as e:
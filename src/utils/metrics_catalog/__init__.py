@@ -0,0 +1 @@
+from .metrics_catalog import get_metrics_catalog, find_campaign_metrics, METRICAS_MAP_PATH
@@ -0,0 +1,151 @@
+"""
+Catálogo de métricas por tipo de campanha (src/metricas_map.json).
+
+O arquivo é lido e validado uma única vez e mantido em memória; a cada consulta só a data
+de modificação é conferida (os.stat), e o catálogo é recarregado quando o arquivo muda.
+A busca por tipo de campanha tolera acentos, maiúsculas, frases ("Lançamento de produto")
+e pequenos erros de digitação.
+"""
+
+import difflib
+import json
+import os
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+
+from src.config import BASE_DIR
+
+METRICAS_MAP_PATH = os.path.join(BASE_DIR, "src", "metricas_map.json")
+
+# Campos de cada tipo de campanha: (nome, tipo esperado)
+_CAMPAIGN_FIELDS = (
+    ("objetivo_principal", str),
+    ("metricas_principais", list),
+    ("metricas_secundarias", list),
+    ("interpretacao", str),
+)
+
+# Similaridade mínima (0 a 1) para aceitar um tipo de campanha parecido
+FUZZY_CUTOFF = 0.75
+
+_catalog_lock = threading.Lock()
+_loaded = {}  # caminho -> (assinatura do arquivo, catálogo)
+
+
+def _normalize(text: str) -> str:
+    """Minúsculas, sem acentos e com palavras separadas por um espaço (ex: "Lançamento!" -> "lancamento")."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def _validate_catalog(data, path: str) -> dict:
+    """Mantém apenas os tipos de campanha válidos, com campos do tipo esperado."""
+    if not isinstance(data, dict):
+        print(f"Erro: {path} deve conter um objeto com os tipos de campanha.")
+        return {}
+
+    catalog = {}
+    for campaign_type, entry in data.items():
+        if not isinstance(entry, dict):
+            print(f"Aviso: tipo de campanha '{campaign_type}' ignorado em {path} (não é um objeto).")
+            continue
+        clean_entry = dict(entry)
+        for field, expected_type in _CAMPAIGN_FIELDS:
+            value = entry.get(field)
+            if value is not None and not isinstance(value, expected_type):
+                print(f"Aviso: '{campaign_type}.{field}' inválido em {path}; campo ignorado.")
+                value = None
+            if value is None:
+                value = [] if expected_type is list else ""
+            if expected_type is list:
+                value = [str(item) for item in value]
+            clean_entry[field] = value
+        catalog[campaign_type] = clean_entry
+    return catalog
+
+
+def get_metrics_catalog(path: str = METRICAS_MAP_PATH) -> dict:
+    """
+    Retorna o catálogo de métricas, lendo o arquivo apenas na primeira vez ou quando ele muda.
+
+    Args:
+        path (str): Caminho do metricas_map.json.
+
+    Returns:
+        dict: {tipo_de_campanha: {"objetivo_principal", "metricas_principais", "metricas_secundarias",
+              "interpretacao"}}. Vazio se o arquivo não existir ou for inválido. Não altere o retorno:
+              ele é compartilhado entre as chamadas.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        print(f"Erro: O arquivo {path} não foi encontrado.")
+        return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _catalog_lock:
+        cached = _loaded.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                catalog = _validate_catalog(json.load(f), path)
+        except json.JSONDecodeError:
+            print(f"Erro: O arquivo {path} não é um JSON válido.")
+            # Mantém a última versão válida, se houver, até o arquivo ser alterado de novo
+            catalog = cached[1] if cached else {}
+
+        _loaded[path] = (signature, catalog)
+        return catalog
+
+
+@lru_cache(maxsize=256)
+def _match_campaign_type(campaign_type: str, known_types: tuple):
+    """Encontra o tipo do catálogo correspondente (memorizado por versão do catálogo)."""
+    wanted = _normalize(campaign_type)
+    if not wanted:
+        return None
+    normalized = {_normalize(known): known for known in known_types}
+
+    # 1. Igual, a menos de acentos/maiúsculas ("Lançamento" -> "lancamento")
+    if wanted in normalized:
+        return normalized[wanted]
+
+    # 2. Frase que contém o tipo ("campanha de lançamento de produto" -> "lancamento")
+    words = wanted.split()
+    for key, known in normalized.items():
+        if key in words or key in wanted:
+            return known
+
+    # 3. Parecido com o tipo ou com alguma palavra da frase ("engajamneto" -> "engajamento")
+    for candidate in [wanted, *words]:
+        close = difflib.get_close_matches(candidate, list(normalized), n=1, cutoff=FUZZY_CUTOFF)
+        if close:
+            return normalized[close[0]]
+    return None
+
+
+def find_campaign_metrics(campaign_type: str, path: str = METRICAS_MAP_PATH):
+    """
+    Busca as métricas de um tipo de campanha, com tolerância a variações no nome.
+
+    Args:
+        campaign_type (str): O tipo de campanha informado (ex: "Lançamento", "autoridade").
+        path (str): Caminho do metricas_map.json.
+
+    Returns:
+        tuple: (tipo encontrado no catálogo, dados do tipo) ou (None, None) se nada corresponder.
+    """
+    catalog = get_metrics_catalog(path)
+    if not campaign_type or not catalog:
+        return None, None
+    if campaign_type in catalog:
+        return campaign_type, catalog[campaign_type]
+
+    matched = _match_campaign_type(str(campaign_type), tuple(catalog))
+    if matched is None:
+        return None, None
+    return matched, catalog[matched]
@@ -2,10 +2,6 @@ import os
 from datetime import datetime
 from reportlab.platypus import Paragraph, Spacer, Image
 from reportlab.platypus.flowables import HRFlowable
-from reportlab.lib.styles import ParagraphStyle
-
-from reportlab.lib.colors import HexColor
-
 from src.config import COMPANY_NAME, LOGO_PATH
 
 def _build_cover_page(styles: dict, client_name: str, formatted_period: str, formatted_generation_date: str) -> list:
@@ -23,9 +19,9 @@ def _build_cover_page(styles: dict, client_name: str, formatted_period: str, for
     """
     cover_story = []
 
-    # Definir estilos para a capa com texto branco
-    cover_title_style = ParagraphStyle(name='CoverTitle', parent=styles['TitleStyle'], textColor=HexColor('#FFFFFF'), alignment=1)
-    cover_subtitle_style = ParagraphStyle(name='CoverSubtitle', parent=styles['SubtitleStyle'], textColor=HexColor('#FFFFFF'), alignment=1)
+    # Estilos da capa com texto branco (pré-calculados no registro de estilos)
+    cover_title_style = styles['CoverTitle']
+    cover_subtitle_style = styles['CoverSubtitle']
 
     cover_story.append(Spacer(1, 150)) # Espaçamento maior no topo
     cover_story.append(Paragraph(f"Calendário Semanal de Conteúdo", cover_title_style))
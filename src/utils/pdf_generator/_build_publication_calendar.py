@@ -34,7 +34,7 @@ def _build_publication_calendar(styles: dict, publication_calendar: list) -> lis
     table = Table(data, colWidths=[2*inch, 1.5*inch, 3*inch])
     ts = [
         ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#1A237E')),  # Header
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor(styles.palette['primary'])),  # Header
         ('TEXTCOLOR', (0,0), (-1,0), colors.white),
         ('ALIGN', (0,0), (-1,-1), 'CENTER'),
         ('FONTNAME', (0,0), (-1,0), 'DejaVuSans-Bold'),
@@ -43,9 +43,9 @@ def _build_publication_calendar(styles: dict, publication_calendar: list) -> lis
         ('LEFTPADDING', (0,0), (-1,-1), 12),
         ('RIGHTPADDING', (0,0), (-1,-1), 12),
         ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#E8EAF6')]),  # Alternating
+        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor(styles.palette['table_background'])]),  # Alternating
         ('ROUNDEDCORNERS', [10, 10, 10, 10]),  # Rounded all corners
-        ('BACKGROUND', (0,1), (-1,-1), colors.HexColor('#E8EAF6')),
+        ('BACKGROUND', (0,1), (-1,-1), colors.HexColor(styles.palette['table_background'])),
     ]
     table.setStyle(TableStyle(ts))
     calendar_story.append(table)
@@ -63,7 +63,7 @@ def _build_publication_calendar(styles: dict, publication_calendar: list) -> lis
         bc.data = [[count for count in post_counts.values()]]
         bc.categoryAxis.labels.angle = 30
         bc.categoryAxis.categoryNames = list(post_counts.keys())
-        bc.bars[0].fillColor = colors.HexColor('#1A237E')
+        bc.bars[0].fillColor = colors.HexColor(styles.palette['primary'])
         drawing.add(bc)
         calendar_story.append(drawing)
         calendar_story.append(Spacer(1, 0.1*inch))
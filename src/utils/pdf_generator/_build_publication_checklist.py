@@ -34,13 +34,13 @@ def _build_publication_checklist(styles: dict, publication_checklist: list) -> l
             task_str = f"{type_} Post {post_num}: '{title}'"
             # Use style for color
             style_name = f'Checklist{type_.split()[0]}_Post{post_num}'  # Adapt
-            data.append([date, Paragraph(task_str, styles.get(style_name, 'ChecklistItem'))])
+            data.append([date, Paragraph(task_str, styles.get(style_name, styles['ChecklistItem']))])
             date = ''
 
     table = Table(data, colWidths=[1*inch, 4*inch])
     ts = [
         ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#3F51B5')),
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor(styles.palette['secondary'])),
         ('TEXTCOLOR', (0,0), (-1,0), colors.white),
         ('ALIGN', (0,0), (-1,-1), 'CENTER'),
         ('FONTNAME', (0,0), (-1,0), 'DejaVuSans-Bold'),
@@ -49,9 +49,9 @@ def _build_publication_checklist(styles: dict, publication_checklist: list) -> l
         ('LEFTPADDING', (0,0), (-1,-1), 12),
         ('RIGHTPADDING', (0,0), (-1,-1), 12),
         ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor('#E8EAF6')]),
+        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.HexColor(styles.palette['table_background'])]),
         ('ROUNDEDCORNERS', [10, 10, 10, 10]),
-        ('BACKGROUND', (0,1), (-1,-1), colors.HexColor('#E8EAF6')),
+        ('BACKGROUND', (0,1), (-1,-1), colors.HexColor(styles.palette['table_background'])),
     ]
     table.setStyle(TableStyle(ts))
     checklist_story.append(table)
@@ -6,6 +6,7 @@ from reportlab.platypus import Image
 import os
 
 from src.config import COMPANY_NAME, LOGO_PATH
+from src.utils.pdf_generator.image_cache import draw_image_form
 
 def _header_footer(canvas_obj: canvas.Canvas, doc) -> None:
     """
@@ -19,7 +20,8 @@ def _header_footer(canvas_obj: canvas.Canvas, doc) -> None:
 
     # Header Logo 
     if os.path.exists(LOGO_PATH): 
-        canvas_obj.drawImage(LOGO_PATH, doc.leftMargin, doc.height + doc.topMargin - inch, width=inch, height=0.5*inch, preserveAspectRatio=True, mask='auto') 
+        # Logo reduzido ao tamanho do cabeçalho, registrado uma vez por documento
+        draw_image_form(canvas_obj, "HeaderLogo", LOGO_PATH, doc.leftMargin, doc.height + doc.topMargin - inch, width=inch, height=0.5*inch)
     
     # Footer 
     footer_text = f"{COMPANY_NAME} | Página {doc.page}" 
@@ -2,16 +2,20 @@ from datetime import datetime, timedelta
 import json
 from collections import defaultdict
 
+# Nomes dos dias da semana indexados por datetime.weekday() (0 = Segunda)
+WEEKDAY_NAMES = ("Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira", "Sexta-feira", "Sábado", "Domingo")
+
 def generate_publication_calendar(start_date: datetime, posts_list: list) -> list:
     """
     Gera um calendário de publicação sugerido para a próxima semana, distribuindo posts.
 
     Args:
         start_date (datetime): A data de início para calcular a semana.
-        posts_list (list): Uma lista de dicionários, onde cada dicionário representa um post e contém um 'title'.
+        posts_list (list): Os posts da campanha (objetos `Post` do modelo da campanha).
 
     Returns:
         list: Uma lista de dicionários representando o calendário de publicação, com posts atribuídos a dias.
+              Cada dia traz "day" (ex: "Sexta-feira, 17/10"), "datetime" (a data do dia) e "entries".
     """
     calendar = []
     # Dias da semana priorizados para posts: Sexta (4), Sábado (5), Domingo (6), Segunda (0), Quarta (2)
@@ -47,11 +51,11 @@ def generate_publication_calendar(start_date: datetime, posts_list: list) -> lis
     for day_index in prioritized_days_of_week:
         if day_index in week_dates and assigned_posts_by_day[day_index]:
             date_for_day = week_dates[day_index]
-            day_name = date_for_day.strftime("%A, %d/%m").replace("Monday", "Segunda-feira").replace("Tuesday", "Terça-feira").replace("Wednesday", "Quarta-feira").replace("Thursday", "Quinta-feira").replace("Friday", "Sexta-feira").replace("Saturday", "Sábado").replace("Sunday", "Domingo")
+            day_name = f"{WEEKDAY_NAMES[day_index]}, {date_for_day.strftime('%d/%m')}"
             
             entries = []
             for assigned_post in assigned_posts_by_day[day_index]:
-                horarios_raw = assigned_post["post_data"].get("horario_de_postagem", "Horário não informado")
+                horarios_raw = assigned_post["post_data"].horario_de_postagem or "Horário não informado"
 
                 post_time = "Horário não informado"
                 if isinstance(horarios_raw, str):
@@ -73,11 +77,11 @@ def generate_publication_calendar(start_date: datetime, posts_list: list) -> lis
                         day_name_key = day_name_lower
                     post_time = horarios_raw.get(day_name_key, "Horário não informado")
 
-                entries.append({"time": post_time, "content": assigned_post["post_data"].get("titulo", "Título não disponível"), "post_number": assigned_post["post_number"]})
+                entries.append({"time": post_time, "content": assigned_post["post_data"].titulo or "Título não disponível", "post_number": assigned_post["post_number"]})
             
-            calendar.append({"day": day_name, "entries": entries})
+            calendar.append({"day": day_name, "datetime": date_for_day, "entries": entries})
 
-    # Ordenar o calendário por data (garantindo o ano para ordenação correta)
-    calendar.sort(key=lambda x: datetime.strptime(x["day"].split(', ')[1] + f"/{start_date.year}", "%d/%m/%Y"))
+    # Ordenar o calendário por data (a data real já inclui o ano, inclusive na virada de ano)
+    calendar.sort(key=lambda x: x["datetime"])
 
     return calendar
\ No newline at end of file
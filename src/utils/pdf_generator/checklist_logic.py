@@ -10,18 +10,13 @@ def generate_publication_checklist(publication_calendar: list) -> list:
 
     Returns:
         list: Uma lista de dicionários, onde cada dicionário representa um dia com suas tarefas.
+              Cada dia traz "date" (ex: "17/10"), "datetime" (a data do dia) e "tasks".
     """
     daily_checklist = defaultdict(list)
     
     for day_entry in publication_calendar:
-        day_name_and_date = day_entry["day"]
-        # Extrair a data para cálculo
-        day_date_str = day_name_and_date.split(', ')[1] # Ex: "17/10"
-        current_year = datetime.now().year
-        try:
-            day_date = datetime.strptime(f"{day_date_str}/{current_year}", "%d/%m/%Y")
-        except ValueError:
-            day_date = datetime.now() # Fallback
+        # Data real do dia, já calculada pelo calendário de publicação
+        day_date = day_entry.get("datetime") or datetime.now() # Fallback
 
         for post_entry in day_entry["entries"]:
             post_title = post_entry["content"]
@@ -29,22 +24,26 @@ def generate_publication_checklist(publication_calendar: list) -> list:
             
             # Preparar o post: 2 dias antes
             prepare_date = day_date - timedelta(days=2)
-            daily_checklist[prepare_date.strftime("%d/%m")].append({"type": "Preparar", "title": post_title, "post_number": post_number})
+            daily_checklist[prepare_date.date()].append({"type": "Preparar", "title": post_title, "post_number": post_number})
             
             # Postar (ou agendar): No dia do post
-            daily_checklist[day_date.strftime("%d/%m")].append({"type": "Postar", "title": post_title, "post_number": post_number})
+            daily_checklist[day_date.date()].append({"type": "Postar", "title": post_title, "post_number": post_number})
             
             # Responder comentários: 2 dias depois
             respond_date_2_days = day_date + timedelta(days=2)
-            daily_checklist[respond_date_2_days.strftime("%d/%m")].append({"type": "Responder comentários", "title": post_title, "post_number": post_number})
+            daily_checklist[respond_date_2_days.date()].append({"type": "Responder comentários", "title": post_title, "post_number": post_number})
 
         # Responder comentários: 4 dias depois
         respond_checklist = day_date + timedelta(days=4)
-        daily_checklist[respond_checklist.strftime("%d/%m")].append({"type": "Responder 2ª vez comentários", "title": post_title, "post_number": post_number})
+        daily_checklist[respond_checklist.date()].append({"type": "Responder 2ª vez comentários", "title": post_title, "post_number": post_number})
 
     # Converter o defaultdict para uma lista de dicionários e ordenar por data
     sorted_checklist = []
-    for date_str in sorted(daily_checklist.keys(), key=lambda x: datetime.strptime(x, "%d/%m")):
-        sorted_checklist.append({"date": date_str, "tasks": daily_checklist[date_str]})
+    for task_date in sorted(daily_checklist.keys()):
+        sorted_checklist.append({
+            "date": task_date.strftime("%d/%m"),
+            "datetime": datetime.combine(task_date, datetime.min.time()),
+            "tasks": daily_checklist[task_date]
+        })
 
     return sorted_checklist
\ No newline at end of file
@@ -1,8 +1,10 @@
 import os
 import json
+from dataclasses import asdict
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle, PageTemplate, Frame, NextPageTemplate, KeepTogether, HRFlowable
+from reportlab.pdfgen import canvas as pdf_canvas
+from reportlab.platypus import BaseDocTemplate, SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle, PageTemplate, Frame, NextPageTemplate, HRFlowable
 from src.utils.pdf_generator.styles.pdf_styles import get_pdf_styles
 from src.utils.pdf_generator._build_cover_page import _build_cover_page
 from reportlab.lib.units import inch
@@ -17,217 +19,217 @@ from src.utils.pdf_generator._header_footer import _header_footer
 from src.utils.pdf_generator.calendar_logic import generate_publication_calendar
 from src.utils.pdf_generator.checklist_logic import generate_publication_checklist
 from src.utils.pdf_generator._build_success_metrics import _build_success_metrics
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from src.utils.pdf_generator.styles.font_manager import ensure_fonts_registered
+from src.config import BASE_DIR, COMPANY_NAME, LOGO_PATH
+from src.utils.llm_output.campaign_model import Campaign, build_campaign
+from src.utils.pdf_generator.create_briefing_pdf_weasyprint import create_briefing_pdf_weasyprint, resolve_pdf_backend
+from src.utils.pdf_generator.section_cache import PdfSection, render_with_section_cache, section_cache_enabled
 from reportlab.lib import colors # Importar colors
 # from reportlab.graphics.renderPDF import LinearGradient # Importar LinearGradient
 
+# Variável de ambiente que ativa o dump de depuração do content_json em todas as renderizações
+PDF_DEBUG_DUMP_ENV = "PDF_DEBUG_DUMP"
+
 def _cover_page_background(canvas, doc):
     """
-    Desenha o fundo colorido para a página de capa.
+    Desenha o fundo colorido para a página de capa, com as cores do tema do documento.
     """
+    start_color, end_color = getattr(doc, 'cover_gradient', ('#1A237E', '#0D47A1'))
     canvas.saveState()
-    canvas.linearGradient(0, 0, 0, doc.height, [colors.HexColor('#1A237E'), colors.HexColor('#0D47A1')])
+    canvas.linearGradient(0, 0, 0, doc.height, [colors.HexColor(start_color), colors.HexColor(end_color)])
     canvas.restoreState()
 
-def create_briefing_pdf(content_json: dict, client_name: str, output_filename: str, model_name: str = "Unknown", target_audience: str = "", tone_of_voice: str = "", marketing_objectives: str = "", suggested_metrics: dict = {}, posting_time: str = ""):
+def _dump_content_json(content_json, model_name: str):
     """
-    Converte o JSON de conteúdo gerado em um "PDF de Briefing Profissional".
-
-    Args:
-        content_json (dict): O objeto JSON com os posts, legendas, variações, hashtags e formatos.
-        client_name (str): Nome do cliente para personalizar o PDF.
-        output_filename (str): Nome do arquivo PDF a ser salvo.
-        model_name (str): Nome do modelo de IA que gerou o conteúdo (ex: "Gemini", "Mistral").
-        target_audience (str): O público-alvo do briefing.
-        tone_of_voice (str): O tom de voz a ser utilizado no briefing.
-        marketing_objectives (str): Os objetivos de marketing do briefing.
+    Salva o content_json bruto em output_files/respostas_IA/<modelo> para depuração.
     """
+    if isinstance(content_json, Campaign):
+        content_json = content_json.to_dict()
+    debug_output_dir = os.path.join(BASE_DIR, 'output_files', 'respostas_IA', model_name)
+    os.makedirs(debug_output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    debug_file_path = os.path.join(debug_output_dir, f"{model_name}_content_json_debug_{timestamp}.json")
+    with open(debug_file_path, 'w', encoding='utf-8') as f:
+        json.dump(content_json, f, indent=4, ensure_ascii=False)
+    print(f"Content_json salvo para depuração em: {debug_file_path}")
+
+def create_briefing_pdf(content_json: dict, client_name: str, output_filename: str, model_name: str = "Unknown", target_audience: str = "", tone_of_voice: str = "", marketing_objectives: str = "", suggested_metrics: dict = {}, posting_time: str = "", theme: str = "default", debug_dump: bool = False, backend: str = None, html_filename: str = None, section_cache: bool = None):
     """
     Converte o JSON de conteúdo gerado em um "PDF de Briefing Profissional".
 
     Args:
-        content_json (dict): O objeto JSON com os posts, legendas, variações, hashtags e formatos.
+        content_json (dict | Campaign): O objeto JSON com os posts, legendas, variações, hashtags e formatos
+                                        (ou a campanha já convertida por `build_campaign`).
         client_name (str): Nome do cliente para personalizar o PDF.
         output_filename (str): Nome do arquivo PDF a ser salvo.
         model_name (str): Nome do modelo de IA que gerou o conteúdo (ex: "Gemini", "Mistral").
         target_audience (str): O público-alvo do briefing.
         tone_of_voice (str): O tom de voz a ser utilizado no briefing.
         marketing_objectives (str): Os objetivos de marketing do briefing.
+        theme (str): Tema visual/marca do documento (chave de THEMES em styles/pdf_styles.py).
+        debug_dump (bool): Se True, salva o content_json recebido em output_files/respostas_IA/<modelo>
+                           para depuração (também ativado com a variável de ambiente PDF_DEBUG_DUMP=1).
+        backend (str): "reportlab" (flowables montados aqui) ou "weasyprint" (converte o briefing HTML
+                       com a folha de estilo de impressão). Padrão: variável de ambiente PDF_BACKEND.
+        html_filename (str): Apenas no backend weasyprint: HTML do briefing já gerado, a ser reaproveitado.
+        section_cache (bool): Reaproveita as páginas já renderizadas das seções sem mudança (ver
+                              section_cache.py). Padrão: variável de ambiente PDF_SECTION_CACHE (ligado).
+
+    Returns:
+        list: A story do ReportLab (com o cache de seções, só as seções renderizadas de novo;
+              None no backend weasyprint).
     """
-    # Salvar o content_json bruto em um arquivo para depuração
-    current_file_path = os.path.abspath(__file__)
-    project_root = current_file_path
-    while os.path.basename(project_root) != "plataforma_automacao_ia_generativa":
-        project_root = os.path.dirname(project_root)
-        if project_root == os.path.dirname(project_root): # Reached filesystem root
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__))) # Fallback
-            break
-
-    debug_output_dir = os.path.join(project_root, '..', '..', '..', 'output_files', 'respostas_IA', model_name)
-    os.makedirs(debug_output_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    debug_file_path = os.path.join(debug_output_dir, f"{model_name}_content_json_debug_{timestamp}.json")
-    with open(debug_file_path, 'w', encoding='utf-8') as f:
-        json.dump(content_json, f, indent=4, ensure_ascii=False)
-    print(f"Content_json salvo para depuração em: {debug_file_path}")
-
-    # Garante que content_json é um dicionário, caso seja passado como string JSON
-    if isinstance(content_json, str):
-        try:
-            content_json = json.loads(content_json)
-        except json.JSONDecodeError:
-            content_json = {}
-    elif not isinstance(content_json, dict):
-        content_json = {}
-
-    posts = content_json.get('posts', [])
-    if isinstance(posts, str):
-        try:
-            posts = json.loads(posts)
-        except json.JSONDecodeError:
-            posts = []
-    if not isinstance(posts, list):
-        posts = []
-
-    styles = get_pdf_styles()
-    story = []
-    
-    doc = SimpleDocTemplate(output_filename, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=36)
+    # Salvar o content_json bruto em um arquivo para depuração (opcional)
+    if debug_dump or os.getenv(PDF_DEBUG_DUMP_ENV) == "1":
+        _dump_content_json(content_json, model_name)
+
+    if resolve_pdf_backend(backend) == "weasyprint":
+        create_briefing_pdf_weasyprint(content_json, client_name, output_filename, target_audience=target_audience,
+                                       tone_of_voice=tone_of_voice, marketing_objectives=marketing_objectives,
+                                       suggested_metrics=suggested_metrics, html_filename=html_filename)
+        return None
+
+    # Decodifica e valida o conteúdo uma única vez; daqui em diante só o modelo tipado é usado
+    campaign = build_campaign(content_json)
+    posts = campaign.posts
+    if not suggested_metrics:
+        suggested_metrics = campaign.suggested_metrics
+
+    ensure_fonts_registered()
+    styles = get_pdf_styles(theme)
     
     today = datetime.now()
     formatted_generation_date = today.strftime('%d/%m/%y')
-    
-    publication_calendar = generate_publication_calendar(today, posts)
-
-    # Extrair a última data do calendário de publicação para o período final
-    latest_date = None
-    if publication_calendar:
-        for entry in publication_calendar:
-            # A data está na string 'day', por exemplo "Sexta-feira, 26/07"
-            day_str = entry['day'].split(', ')[1] # Pega "26/07"
-            # Adiciona o ano atual para criar um objeto datetime completo
-            current_calendar_date = datetime.strptime(f"{day_str}/{today.year}", "%d/%m/%Y")
-            if latest_date is None or current_calendar_date > latest_date:
-                latest_date = current_calendar_date
-
-    start_date = datetime.now()
+
+    # Calendário de publicação: calculado uma única vez, a partir da data de início do conteúdo (ou de hoje)
+    start_date_for_calendar = campaign.start_date or today
+    publication_calendar = generate_publication_calendar(start_date_for_calendar, posts)
+
+    # A última data do calendário (datetime real) define o fim do período da capa
+    latest_date = max((entry['datetime'] for entry in publication_calendar), default=None)
     if latest_date:
         # Formata a data para o padrão DD/MM/AA
-        formatted_period = f"{start_date.strftime('%d/%m/%y')} a {latest_date.strftime('%d/%m/%y')}"
+        formatted_period = f"{today.strftime('%d/%m/%y')} a {latest_date.strftime('%d/%m/%y')}"
     else:
-        formatted_period = f"{start_date.strftime('%d/%m/%y')}"
-    
+        formatted_period = f"{today.strftime('%d/%m/%y')}"
+
+    publication_checklist = generate_publication_checklist(publication_calendar)
+    section_rule_color = colors.HexColor(styles.palette['secondary'])
+
+    def section_rule():
+        return HRFlowable(width="100%", thickness=0.5, color=section_rule_color, spaceBefore=12)
+
+    # Seções do documento, cada uma começando em uma página nova (o conteúdo entra na chave do cache de seções)
+    sections = [
+        PdfSection("capa", [client_name, formatted_period, formatted_generation_date],
+                   lambda: _build_cover_page(styles, client_name, formatted_period, formatted_generation_date),
+                   chrome=False),
+        # --- Sumário Executivo / Visão Geral da Semana ----
+        PdfSection("sumario", [campaign.weekly_strategy_summary, target_audience, tone_of_voice, marketing_objectives,
+                               campaign.future_strategy, campaign.market_references],
+                   lambda: _build_executive_summary(
+                       styles,
+                       campaign.weekly_strategy_summary,
+                       target_audience,
+                       tone_of_voice,
+                       marketing_objectives,
+                       future_strategy=campaign.future_strategy,
+                       market_references=campaign.market_references
+                   ) + [HRFlowable(width="100%", thickness=0.5, color=section_rule_color, spaceBefore=12, spaceAfter=12)]),
+        # --- Calendário de Publicação ---
+        PdfSection("calendario", publication_calendar,
+                   lambda: [section_rule()] + _build_publication_calendar(styles, publication_calendar)),
+    ]
+    # --- Seção de Posts (um post por seção: editar um post só renderiza esse post de novo) ---
+    # Cada post já começa em uma página nova, então o bloco não precisa de KeepTogether
+    # (que, em posts maiores que uma página, deixaria uma página em branco antes do post).
+    for post in posts:
+        sections.append(PdfSection("post", asdict(post), lambda post=post: _build_post_section(styles, post, post.number) + [
+            Spacer(1, 0.3*inch),
+            HRFlowable(width="80%", thickness=0.5, color=colors.grey, hAlign='CENTER', spaceAfter=12),
+        ]))
+    sections.append(PdfSection("metricas", suggested_metrics,
+                               lambda: [section_rule()] + _build_success_metrics(styles, suggested_metrics) + [Spacer(1, 20)]))
+    # --- Checklist de Publicação ---
+    sections.append(PdfSection("checklist", publication_checklist,
+                               lambda: [section_rule()] + _build_publication_checklist(styles, publication_checklist)))
+
+    if section_cache_enabled(section_cache):
+        story = []
+
+        def render_section(section, filename):
+            flowables = section.build()
+            story.extend(flowables)
+            # Cabeçalho e rodapé ficam de fora: são aplicados depois, com a numeração do documento final
+            _build_document(filename, styles, flowables, cover=not section.chrome, chrome=False)
+
+        context = {"theme": theme, "company": COMPANY_NAME, "logo": _logo_signature()}
+        render_with_section_cache(sections, context, render_section, _build_page_chrome, output_filename)
+        return story
+
+    # Documento inteiro de uma vez (mesmo layout: cada seção começa em uma página nova)
+    story = [NextPageTemplate('CoverPage')]
+    for index, section in enumerate(sections):
+        if index == 1:
+            story.append(NextPageTemplate('NormalPage'))
+        if index:
+            story.append(PageBreak())
+        story.extend(section.build())
+    _build_document(output_filename, styles, story)
+
+    return story
+
+
+def _logo_signature():
+    """Identifica a versão do logo (a chave do cache de seções muda se o arquivo for trocado)."""
+    if not os.path.exists(LOGO_PATH):
+        return None
+    stat = os.stat(LOGO_PATH)
+    return [stat.st_size, stat.st_mtime]
+
+
+def _build_document(output_filename: str, styles, story: list, cover: bool = None, chrome: bool = True):
+    """
+    Gera um PDF com os templates do briefing.
+
+    Args:
+        output_filename (str): Arquivo PDF a ser salvo.
+        styles: Registro de estilos do tema (cores da capa).
+        story (list): Flowables do documento.
+        cover (bool): None para o documento inteiro (capa seguida das páginas normais); True ou
+                      False para uma seção isolada, só com a capa ou só com páginas normais.
+        chrome (bool): Se False, as páginas normais saem sem cabeçalho e rodapé (ver `_build_page_chrome`).
+    """
+    # BaseDocTemplate: o SimpleDocTemplate troca para o template 'Later' (sem cabeçalho e rodapé) em toda
+    # página nova, e só a primeira página normal recebia o cabeçalho e o rodapé
+    doc = BaseDocTemplate(output_filename, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=36)
+    doc.cover_gradient = styles.palette['cover_gradient']
+
     # Templates 
     cover_template = PageTemplate(id='CoverPage', frames=Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='cover'), onPage=_cover_page_background) 
     normal_frame = Frame(doc.leftMargin, doc.bottomMargin + 0.5*inch, doc.width, doc.height - 1.5*inch, id='normal')  # Espaço header 
-    normal_template = PageTemplate(id='NormalPage', frames=[normal_frame], onPage=_header_footer) 
-    doc.addPageTemplates([cover_template, normal_template]) 
-
-    # Capa 
-    story.append(NextPageTemplate('CoverPage')) 
-    story.extend(_build_cover_page(styles, client_name, formatted_period, formatted_generation_date)) 
-    story.append(NextPageTemplate('NormalPage')) 
-    story.append(PageBreak())  # Após capa 
-
-    # --- Sumário Executivo / Visão Geral da Semana ----
-    weekly_strategy_summary_content = content_json.get('weekly_strategy_summary', '')
-    if isinstance(weekly_strategy_summary_content, str):
-        # Se for uma string, tenta carregar como JSON. Se falhar, usa a string como summary.
-        try:
-            weekly_strategy_summary_dict = json.loads(weekly_strategy_summary_content)
-        except json.JSONDecodeError:
-            weekly_strategy_summary_dict = {'summary': weekly_strategy_summary_content}
-    elif isinstance(weekly_strategy_summary_content, dict):
-        weekly_strategy_summary_dict = weekly_strategy_summary_content
+    normal_template = PageTemplate(id='NormalPage', frames=[normal_frame], onPage=_header_footer if chrome else (lambda canvas, doc: None)) 
+    if cover is None:
+        doc.addPageTemplates([cover_template, normal_template])
     else:
-        weekly_strategy_summary_dict = {}
-    future_strategy = content_json.get('future_strategy', '')
-    market_references = content_json.get('market_references', None)
-
-    story.extend(_build_executive_summary(
-        styles,
-        weekly_strategy_summary_dict,
-        target_audience,
-        tone_of_voice,
-        marketing_objectives,
-        future_strategy=future_strategy,
-        market_references=market_references
-    ))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#3F51B5'), spaceBefore=12, spaceAfter=12))
-
-        # --- Calendário de Publicação ---
-    story.append(PageBreak())
-    story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#3F51B5'), spaceBefore=12))
-    # Gerar o calendário de publicação com base na data atual e na lista de posts
-    start_date_str = content_json.get('start_date')
-    if start_date_str:
-        try:
-            start_date_for_calendar = datetime.strptime(start_date_str, '%Y-%m-%d')
-        except ValueError:
-            start_date_for_calendar = datetime.now()
-    else:
-        start_date_for_calendar = datetime.now()
-
-    publication_calendar = generate_publication_calendar(start_date_for_calendar, posts)
-    story.extend(_build_publication_calendar(styles, publication_calendar))
-    
-    # --- Seção de Posts ---
-    story.append(PageBreak())
-
-    for i, post in enumerate(posts):
-        # Garante que cada 'post' individual é um dicionário
-        if isinstance(post, str):
-            try:
-                post = json.loads(post)
-            except json.JSONDecodeError:
-                post = {}
-        elif not isinstance(post, dict):
-            post = {}
-        
-        post_content = _build_post_section(styles, post, i + 1)
-        story.append(KeepTogether(post_content))
-        story.append(Spacer(1, 0.3*inch))
-        if i < len(posts):
-            story.append(HRFlowable(width="80%", thickness=0.5, color=colors.grey, hAlign='CENTER', spaceAfter=12))
-
-    story.append(PageBreak())
-    story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#3F51B5'), spaceBefore=12))
-    story.extend(_build_success_metrics(styles, suggested_metrics))
-    story.append(Spacer(1, 20))
-    
-    
-    # --- Checklist de Publicação ---
-    story.append(PageBreak())
-    story.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#3F51B5'), spaceBefore=12))
-    publication_checklist = generate_publication_checklist(publication_calendar)
-    story.extend(_build_publication_checklist(styles, publication_checklist))
+        doc.addPageTemplates([cover_template if cover else normal_template])
 
     doc.build(story)
 
-    return story
 
-
-def register_fonts():
+def _build_page_chrome(page_numbers: list, output_filename: str):
     """
-    Registra as fontes DejaVu Sans para uso no ReportLab.
-    Isso permite a renderização correta de caracteres Unicode, incluindo emojis.
+    Gera um PDF só com o cabeçalho e o rodapé das páginas normais, uma página para cada número.
+
+    Args:
+        page_numbers (list): Números das páginas no documento final (o rodapé mostra esse número).
+        output_filename (str): Arquivo PDF a ser salvo.
     """
-    try:
-        # 1. Registra as fontes
-        pdfmetrics.registerFont(TTFont('DejaVuSans', 'src/utils/pdf_generator/styles/fonts/dejavu-sans.book.ttf'))
-        pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', 'src/utils/pdf_generator/styles/fonts/dejavu-sans.bold.ttf'))
-        pdfmetrics.registerFont(TTFont('DejaVuSans-Oblique', 'src/utils/pdf_generator/styles/fonts/dejavu-sans.oblique.ttf'))
-        pdfmetrics.registerFont(TTFont('DejaVuSans-BoldOblique', 'src/utils/pdf_generator/styles/fonts/dejavu-sans.bold-oblique.ttf'))
-
-        # 2. Cria um alias para facilitar o uso
-        pdfmetrics.registerFontFamily('DejaVuSans',
-                                      normal='DejaVuSans',
-                                      bold='DejaVuSans-Bold',
-                                      italic='DejaVuSans-Oblique',
-                                      boldItalic='DejaVuSans-BoldOblique')
-        print("Fontes DejaVu Sans registradas com sucesso.")
-    except Exception as e:
-        print(f"Erro ao registrar fontes: {e}")
-
-register_fonts()
\ No newline at end of file
+    # O documento só fornece as margens e o número da página usados por `_header_footer`
+    doc = BaseDocTemplate(output_filename, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=36)
+    canvas_obj = pdf_canvas.Canvas(output_filename, pagesize=A4)
+    for number in page_numbers:
+        doc.page = number
+        _header_footer(canvas_obj, doc)
+        canvas_obj.showPage()
+    canvas_obj.save()
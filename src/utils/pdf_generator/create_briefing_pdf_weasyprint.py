@@ -0,0 +1,119 @@
+"""
+Backend alternativo de PDF: converte o briefing HTML (templates Jinja2) em PDF com o weasyprint.
+
+O layout passa a existir em um único lugar (os templates HTML + `briefing_print.css`),
+e o PDF pode reaproveitar o HTML que acabou de ser gerado, em vez de remontar cada
+seção com flowables do ReportLab.
+"""
+
+import os
+from functools import lru_cache
+
+from src.utils.html_generator.template_environment import TEMPLATES_DIR
+
+PRINT_STYLESHEET = os.path.join(TEMPLATES_DIR, "briefing_print.css")
+
+# Backends disponíveis para o PDF e variável de ambiente que define o padrão
+PDF_BACKENDS = ("reportlab", "weasyprint")
+PDF_BACKEND_ENV = "PDF_BACKEND"
+
+
+@lru_cache(maxsize=None)
+def weasyprint_available() -> bool:
+    """Indica se o weasyprint (e as bibliotecas do sistema, como o Pango) pode ser carregado."""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as e:
+        print(f"Aviso: weasyprint indisponível ({e}).")
+        return False
+    return True
+
+
+def resolve_pdf_backend(backend: str = None) -> str:
+    """
+    Define o backend de PDF efetivamente usado.
+
+    Args:
+        backend (str): "reportlab" ou "weasyprint" (None = variável de ambiente PDF_BACKEND,
+                       ou "reportlab" se ela não estiver definida).
+
+    Returns:
+        str: O backend escolhido; volta para "reportlab" se o weasyprint não puder ser usado.
+    """
+    backend = (backend or os.getenv(PDF_BACKEND_ENV) or "reportlab").lower()
+    if backend not in PDF_BACKENDS:
+        print(f"Aviso: backend de PDF desconhecido '{backend}'. Usando reportlab.")
+        return "reportlab"
+    if backend == "weasyprint" and not weasyprint_available():
+        print("Aviso: usando o backend reportlab para o PDF.")
+        return "reportlab"
+    return backend
+
+
+def _offline_url_fetcher(url: str, *args, **kwargs):
+    """Não baixa recursos remotos (Google Fonts, Font Awesome): a conversão fica local e previsível."""
+    from weasyprint import default_url_fetcher
+
+    if url.startswith(("http://", "https://")):
+        return {"string": b"", "mime_type": "text/css"}
+    return default_url_fetcher(url, *args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_print_stylesheet():
+    """Folha de estilo de impressão, lida e compilada uma única vez por processo."""
+    from weasyprint import CSS
+
+    return CSS(filename=PRINT_STYLESHEET, url_fetcher=_offline_url_fetcher)
+
+
+def render_html_to_pdf(html_filename: str, output_filename: str) -> str:
+    """
+    Converte um briefing HTML já gerado em PDF.
+
+    Args:
+        html_filename (str): Caminho do HTML gerado por `create_briefing_html`.
+        output_filename (str): Caminho do PDF a ser salvo.
+
+    Returns:
+        str: O caminho do PDF gerado.
+    """
+    from weasyprint import HTML
+
+    document = HTML(filename=html_filename, base_url=TEMPLATES_DIR, url_fetcher=_offline_url_fetcher)
+    document.write_pdf(output_filename, stylesheets=[_get_print_stylesheet()])
+    return output_filename
+
+
+def create_briefing_pdf_weasyprint(content_json: dict, client_name: str, output_filename: str, target_audience: str = "", tone_of_voice: str = "", marketing_objectives: str = "", suggested_metrics: dict = None, html_filename: str = None):
+    """
+    Gera o PDF do briefing a partir do HTML do briefing (backend weasyprint).
+
+    Args:
+        content_json (dict | Campaign): O conteúdo da campanha.
+        client_name (str): Nome do cliente.
+        output_filename (str): Caminho do PDF a ser salvo.
+        target_audience (str): O público-alvo do briefing.
+        tone_of_voice (str): O tom de voz a ser utilizado no briefing.
+        marketing_objectives (str): Os objetivos de marketing do briefing.
+        suggested_metrics (dict): Métricas sugeridas (padrão: as da campanha).
+        html_filename (str): HTML do briefing já gerado. Se existir, é convertido diretamente
+                             (uma única renderização do layout para os dois documentos);
+                             caso contrário, um HTML temporário é gerado ao lado do PDF.
+
+    Returns:
+        str: O caminho do PDF gerado.
+    """
+    if html_filename and os.path.exists(html_filename):
+        return render_html_to_pdf(html_filename, output_filename)
+
+    from src.utils.html_generator.create_briefing_html import create_briefing_html
+
+    temporary_html = os.path.splitext(output_filename)[0] + ".print.html"
+    create_briefing_html(content_json, client_name, temporary_html, target_audience=target_audience,
+                         tone_of_voice=tone_of_voice, marketing_objectives=marketing_objectives,
+                         suggested_metrics=suggested_metrics)
+    try:
+        return render_html_to_pdf(temporary_html, output_filename)
+    finally:
+        os.remove(temporary_html)
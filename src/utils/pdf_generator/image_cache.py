@@ -0,0 +1,52 @@
+"""
+Logo do cabeçalho reduzido ao tamanho em que é desenhado.
+
+O logo original (1153x534 RGBA) aparece no cabeçalho com 1 polegada de largura, mas era
+codificado (Flate + máscara) em tamanho original em todo documento, o que custava mais do
+que todo o restante do layout. Aqui a imagem é reduzida uma única vez por processo (300 dpi
+no tamanho desenhado) e, em cada documento, registrada uma única vez como form XObject
+(`beginForm`/`doForm`), reaproveitado em todas as páginas. Só a API pública do ReportLab é usada.
+"""
+
+import os
+from functools import lru_cache
+
+from PIL import Image as PILImage
+from reportlab.lib.utils import ImageReader
+
+# Resolução da imagem reduzida, no tamanho em que é desenhada
+IMAGE_DPI = 300
+
+
+@lru_cache(maxsize=16)
+def _scaled_image(path: str, max_width_px: int, max_height_px: int, mtime: float) -> ImageReader:
+    """Reduz a imagem uma vez (a data de modificação na chave invalida o cache se o arquivo mudar)."""
+    with PILImage.open(path) as image:
+        image.load()
+        scaled = image.copy()
+    scaled.thumbnail((max_width_px, max_height_px), PILImage.LANCZOS)
+    return ImageReader(scaled)
+
+
+def draw_image_form(canvas_obj, form_name: str, path: str, x: float, y: float, width: float, height: float):
+    """
+    Desenha uma imagem reduzida ao tamanho de destino, registrada uma única vez por documento.
+
+    Args:
+        canvas_obj (canvas.Canvas): O canvas do documento sendo gerado.
+        form_name (str): Nome do form XObject (o mesmo em todas as páginas do documento).
+        path (str): Caminho da imagem.
+        x (float): Posição horizontal do canto inferior esquerdo.
+        y (float): Posição vertical do canto inferior esquerdo.
+        width (float): Largura da área de desenho, em pontos.
+        height (float): Altura da área de desenho, em pontos (a proporção da imagem é mantida).
+    """
+    if not canvas_obj.hasForm(form_name):
+        image = _scaled_image(path, round(width / 72 * IMAGE_DPI), round(height / 72 * IMAGE_DPI), os.path.getmtime(path))
+        canvas_obj.beginForm(form_name)
+        canvas_obj.drawImage(image, 0, 0, width=width, height=height, preserveAspectRatio=True, mask='auto')
+        canvas_obj.endForm()
+    canvas_obj.saveState()
+    canvas_obj.translate(x, y)
+    canvas_obj.doForm(form_name)
+    canvas_obj.restoreState()
@@ -0,0 +1,206 @@
+"""
+Cache de páginas do PDF por seção (capa, sumário, calendário, cada post, métricas e checklist).
+
+Cada seção começa em uma página nova e é renderizada em um PDF próprio, sem cabeçalho e
+rodapé, guardado em disco com a chave SHA-256 do conteúdo da seção, do tema, da versão do
+ReportLab e do código do gerador de PDF. Em uma nova renderização, as seções sem mudança vêm
+do cache e só as alteradas passam pelo layout do ReportLab; as páginas são então unidas no
+documento final e recebem o cabeçalho e o rodapé (logo e número da página), desenhados em um
+PDF à parte e também guardados no cache. Como a numeração fica fora das seções, uma edição
+que muda a quantidade de páginas de um post não invalida as seções seguintes.
+
+Sem o pypdf instalado (ou com PDF_SECTION_CACHE=0), o documento é gerado inteiro de uma vez.
+O diretório padrão é output_files/pdf_sections (variável PDF_SECTION_CACHE_DIR); os arquivos
+menos usados são apagados quando passam de MAX_CACHED_SECTIONS.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+import reportlab
+
+from src.config import BASE_DIR
+
+try:
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.errors import PyPdfError
+except ImportError:
+    PdfReader = PdfWriter = None
+    PyPdfError = Exception
+
+SECTION_CACHE_ENV = "PDF_SECTION_CACHE"
+SECTION_CACHE_DIR_ENV = "PDF_SECTION_CACHE_DIR"
+DEFAULT_SECTION_CACHE_DIR = os.path.join(BASE_DIR, "output_files", "pdf_sections")
+
+# Quantidade máxima de seções guardadas em disco
+MAX_CACHED_SECTIONS = 2000
+
+_overrides = {}
+
+# Uma seção do documento: nome, conteúdo (entra na chave), função que monta os flowables e se
+# as páginas recebem o cabeçalho e o rodapé (a capa não recebe)
+PdfSection = namedtuple("PdfSection", "name content build chrome", defaults=(True,))
+
+
+def configure_section_cache(enabled: bool = None, directory: str = None):
+    """
+    Ajusta o cache de seções no processo atual (prioridade sobre as variáveis de ambiente).
+
+    Args:
+        enabled (bool): Liga ou desliga o cache (None mantém o atual).
+        directory (str): Diretório das seções renderizadas (None mantém o atual).
+    """
+    for key, value in (("enabled", enabled), ("directory", directory)):
+        if value is not None:
+            _overrides[key] = value
+
+
+def reset_section_cache():
+    """Descarta os ajustes de `configure_section_cache` (volta a usar as variáveis de ambiente)."""
+    _overrides.clear()
+
+
+def get_section_cache_dir() -> str:
+    return _overrides.get("directory") or os.getenv(SECTION_CACHE_DIR_ENV) or DEFAULT_SECTION_CACHE_DIR
+
+
+def section_cache_enabled(enabled: bool = None) -> bool:
+    """
+    Indica se o cache de seções será usado.
+
+    Args:
+        enabled (bool): Escolha explícita de quem chama (None = ajuste do processo ou PDF_SECTION_CACHE).
+    """
+    if enabled is None:
+        enabled = _overrides.get("enabled", os.getenv(SECTION_CACHE_ENV, "1") != "0")
+    return bool(enabled) and PdfWriter is not None
+
+
+def clear_section_cache():
+    """Apaga as seções renderizadas guardadas em disco."""
+    directory = get_section_cache_dir()
+    if not os.path.isdir(directory):
+        return
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".pdf"):
+            os.remove(entry.path)
+
+
+@lru_cache(maxsize=1)
+def _generator_fingerprint() -> str:
+    """Hash do código do gerador de PDF: alterar o layout invalida as seções já renderizadas."""
+    digest = hashlib.sha256(reportlab.Version.encode("utf-8"))
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), "rb") as f:
+                    digest.update(name.encode("utf-8") + f.read())
+    return digest.hexdigest()
+
+
+def section_key(name: str, content, context: dict) -> str:
+    """
+    Chave de uma seção renderizada.
+
+    Args:
+        name (str): Nome da seção (ex: "capa", "post").
+        content: Conteúdo da seção (qualquer valor serializável em JSON; datas viram texto).
+        context (dict): Demais parâmetros que mudam a aparência (tema, logo, nome da empresa).
+    """
+    payload = json.dumps([name, content, context, _generator_fingerprint()],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_section(path: str):
+    """Abre uma seção guardada (None se não existe ou está corrompida)."""
+    if not os.path.exists(path):
+        return None
+    try:
+        reader = PdfReader(path)
+        if len(reader.pages):
+            os.utime(path)
+            return reader
+    except (PyPdfError, OSError, ValueError) as e:
+        print(f"Aviso: seção do PDF em cache ilegível ({e}); renderizando de novo.")
+    return None
+
+
+def _prune(directory: str):
+    """Apaga as seções usadas há mais tempo quando o diretório passa do limite."""
+    entries = [entry for entry in os.scandir(directory) if entry.name.endswith(".pdf")]
+    if len(entries) <= MAX_CACHED_SECTIONS:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:len(entries) - MAX_CACHED_SECTIONS]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _cached_pdf(directory: str, key: str, render) -> tuple:
+    """Abre o PDF guardado com a chave ou o gera com `render(arquivo)` e o guarda. Retorna (leitor, gerado)."""
+    path = os.path.join(directory, f"{key}.pdf")
+    reader = _read_section(path)
+    if reader is not None:
+        return reader, False
+    # Arquivo temporário próprio: processos do pool podem renderizar a mesma seção ao mesmo tempo
+    temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    render(temporary_path)
+    os.replace(temporary_path, path)
+    return PdfReader(path), True
+
+
+def render_with_section_cache(sections: list, context: dict, render_section, render_chrome, output_filename: str) -> dict:
+    """
+    Monta o PDF com as páginas de cada seção, renderizando apenas as que não estão no cache.
+
+    Args:
+        sections (list): `PdfSection`s na ordem do documento.
+        context (dict): Parâmetros comuns a todas as seções, incluídos nas chaves.
+        render_section (callable): `render_section(seção, arquivo)` gera o PDF da seção, sem cabeçalho e rodapé.
+        render_chrome (callable): `render_chrome(números_das_páginas, arquivo)` gera um PDF com o cabeçalho
+                                  e o rodapé de cada página informada, uma página para cada número.
+        output_filename (str): Arquivo PDF final.
+
+    Returns:
+        dict: {"sections", "reused", "pages"}.
+    """
+    directory = get_section_cache_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    writer = PdfWriter()
+    chrome_pages = []
+    reused = 0
+    rendered = False
+    for section in sections:
+        key = section_key(section.name, section.content, context)
+        reader, generated = _cached_pdf(directory, key, lambda filename: render_section(section, filename))
+        rendered = rendered or generated
+        reused += not generated
+        if not len(writer.pages) and reader.metadata:
+            writer.add_metadata(reader.metadata)
+        if section.chrome:
+            chrome_pages.extend(range(len(writer.pages) + 1, len(writer.pages) + len(reader.pages) + 1))
+        writer.append(reader)
+
+    if chrome_pages:
+        # Cabeçalho e rodapé desenhados sobre as páginas já unidas (numeração do documento final)
+        key = section_key("cabecalho_rodape", chrome_pages, context)
+        chrome, generated = _cached_pdf(directory, key, lambda filename: render_chrome(chrome_pages, filename))
+        rendered = rendered or generated
+        for chrome_page, number in zip(chrome.pages, chrome_pages):
+            writer.pages[number - 1].merge_page(chrome_page)
+
+    with open(output_filename, "wb") as f:
+        writer.write(f)
+    if rendered:
+        _prune(directory)
+    return {"sections": len(sections), "reused": reused, "pages": len(writer.pages)}
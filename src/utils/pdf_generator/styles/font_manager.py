@@ -0,0 +1,52 @@
+import os
+import threading
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+# Caminhos resolvidos a partir da localização do pacote, independentes do diretório de trabalho.
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+FONT_FILES = {
+    "DejaVuSans": "dejavu-sans.book.ttf",
+    "DejaVuSans-Bold": "dejavu-sans.bold.ttf",
+    "DejaVuSans-Oblique": "dejavu-sans.oblique.ttf",
+    "DejaVuSans-BoldOblique": "dejavu-sans.bold-oblique.ttf",
+}
+
+_fonts_registered = False
+_fonts_lock = threading.Lock()
+
+
+def ensure_fonts_registered() -> bool:
+    """
+    Registra as fontes DejaVu Sans no ReportLab na primeira renderização, uma única vez por processo.
+
+    Isso permite a renderização correta de caracteres Unicode (acentos, símbolos e emojis).
+    O ReportLab já embute as fontes TrueType como subconjunto, com apenas os glifos
+    usados no documento, então o tamanho do PDF não depende do tamanho dos arquivos TTF.
+
+    Returns:
+        bool: True se as fontes estão registradas, False se o registro falhou.
+    """
+    global _fonts_registered
+    if _fonts_registered:
+        return True
+
+    with _fonts_lock:
+        if _fonts_registered:
+            return True
+        try:
+            for font_name, filename in FONT_FILES.items():
+                pdfmetrics.registerFont(TTFont(font_name, os.path.join(FONTS_DIR, filename)))
+
+            pdfmetrics.registerFontFamily('DejaVuSans',
+                                          normal='DejaVuSans',
+                                          bold='DejaVuSans-Bold',
+                                          italic='DejaVuSans-Oblique',
+                                          boldItalic='DejaVuSans-BoldOblique')
+            _fonts_registered = True
+            print("Fontes DejaVu Sans registradas com sucesso.")
+        except Exception as e:
+            print(f"Erro ao registrar fontes: {e}")
+        return _fonts_registered
@@ -1,50 +1,164 @@
+from collections.abc import Mapping
+from functools import lru_cache
+
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
 from reportlab.lib import colors
+from reportlab.platypus import TableStyle
+
+# Paletas por marca. Cada tema sobrescreve apenas as cores que diferem do tema "default".
+THEMES = {
+    "default": {
+        "primary": '#1A237E',        # Azul escuro
+        "secondary": '#3F51B5',      # Azul médio
+        "text": '#212121',           # Quase preto
+        "text_muted": '#424242',
+        "text_subtle": '#616161',
+        "footer": '#757575',         # Cinza médio
+        "post_background": '#F5F5F5',
+        "post_border": '#E0E0E0',
+        "table_background": '#E8EAF6',
+        "cover_gradient": ('#1A237E', '#0D47A1'),  # Fundo da capa (de baixo para cima)
+        # Cores dos títulos de cada post (1 a 10)
+        "post_titles": ('#1A237E', '#B71C1C', '#004D40', '#E65100', '#4A148C',
+                        '#212121', '#880E4F', '#33691E', '#F57F17', '#0D47A1'),
+        # Cores do checklist por post: (forte, média, clara)
+        "checklist": (
+            ('#1A237E', '#5C6BC0', '#9FA8DA'),  # Azul
+            ('#2E7D32', '#66BB6A', '#A5D6A7'),  # Verde
+            ('#EF6C00', '#FFA726', '#FFCC80'),  # Laranja
+            ('#4A148C', '#9575CD', '#B39DDB'),  # Roxo
+            ('#B71C1C', '#E57373', '#EF9A9A'),  # Vermelho
+        ),
+    },
+    "esmeralda": {
+        "primary": '#004D40',
+        "secondary": '#00897B',
+        "table_background": '#E0F2F1',
+        "cover_gradient": ('#004D40', '#00695C'),
+    },
+    "grafite": {
+        "primary": '#263238',
+        "secondary": '#546E7A',
+        "table_background": '#ECEFF1',
+        "cover_gradient": ('#263238', '#37474F'),
+    },
+}
+
+# Quantidade de posts com estilos de título/checklist pré-calculados.
+MAX_STYLED_POSTS = 10
+
+
+class PdfStyleRegistry(Mapping):
+    """
+    Registro imutável de estilos do PDF, compartilhado entre documentos do mesmo processo.
+
+    Funciona como o StyleSheet do ReportLab para leitura (`styles['NormalText']`,
+    `styles.get(...)`, `in`), mas não permite adicionar nem substituir estilos.
+    Os estilos são compartilhados: quem precisar de uma variação deve criar um novo
+    `ParagraphStyle` com `parent=styles[...]` em vez de alterar o existente.
+    """
+
+    __slots__ = ("_styles", "theme", "palette", "table_styles")
+
+    def __init__(self, styles: dict, theme: str, palette: dict, table_styles: dict):
+        self._styles = styles
+        self.theme = theme
+        self.palette = palette
+        self.table_styles = table_styles
+
+    def __getitem__(self, name):
+        return self._styles[name]
+
+    def __iter__(self):
+        return iter(self._styles)
+
+    def __len__(self):
+        return len(self._styles)
+
+    def __repr__(self):
+        return f"PdfStyleRegistry(theme={self.theme!r}, styles={len(self._styles)})"
+
+
+def register_theme(name: str, **colors_overrides):
+    """
+    Registra (ou substitui) o tema de uma marca e descarta o registro de estilos em cache.
+
+    Args:
+        name (str): Nome do tema/marca.
+        **colors_overrides: Cores que diferem do tema "default" (ex: primary='#004D40').
+    """
+    THEMES[name] = dict(colors_overrides)
+    get_pdf_styles.cache_clear()
+
+
+def get_theme_palette(theme: str = "default") -> dict:
+    """Retorna a paleta completa do tema (tema "default" + sobrescritas da marca)."""
+    if theme not in THEMES:
+        print(f"Aviso: tema '{theme}' não encontrado. Usando o tema padrão.")
+        theme = "default"
+    return {**THEMES["default"], **THEMES[theme]}
+
+
+@lru_cache(maxsize=None)
+def get_pdf_styles(theme: str = "default") -> PdfStyleRegistry:
+    """
+    Retorna o registro de estilos do PDF para o tema informado.
+
+    O registro é construído uma única vez por processo e por tema e reutilizado por
+    todos os documentos (inclusive na renderização em lote).
+
+    Args:
+        theme (str): Nome do tema/marca (chave de THEMES).
+
+    Returns:
+        PdfStyleRegistry: Registro imutável com todos os estilos de parágrafo e de tabela.
+    """
+    palette = get_theme_palette(theme)
+    primary = HexColor(palette["primary"])
+    secondary = HexColor(palette["secondary"])
+    text = HexColor(palette["text"])
+    text_muted = HexColor(palette["text_muted"])
+    text_subtle = HexColor(palette["text_subtle"])
 
-def get_pdf_styles():
     styles = getSampleStyleSheet()
 
     # --- Estilos Personalizados ---
-    # Título Principal
-    styles.add(ParagraphStyle(name='FooterStyle', 
-                               fontSize=9, 
-                               leading=10, 
-                               alignment=TA_CENTER, 
+    # Rodapé
+    styles.add(ParagraphStyle(name='FooterStyle',
+                               fontSize=9,
+                               leading=10,
+                               alignment=TA_CENTER,
                                fontName='DejaVuSans',
-                               textColor=HexColor('#757575'))) # Cinza médio
+                               textColor=HexColor(palette["footer"])))
 
     # Título Principal
-    styles.add(ParagraphStyle(name='TitleStyle', 
-                               fontSize=24, 
-                               leading=28, 
-                               alignment=TA_CENTER, 
+    styles.add(ParagraphStyle(name='TitleStyle',
+                               fontSize=24,
+                               leading=28,
+                               alignment=TA_CENTER,
                                spaceAfter=0,
                                fontName='DejaVuSans-Bold',
-                               textColor=HexColor('#1A237E'))) # Azul escuro
+                               textColor=primary))
     # Subtítulo
-    styles.add(ParagraphStyle(name='SubtitleStyle', 
-                               fontSize=18, 
-                               leading=22, 
-                               alignment=TA_CENTER, 
+    styles.add(ParagraphStyle(name='SubtitleStyle',
+                               fontSize=18,
+                               leading=22,
+                               alignment=TA_CENTER,
                                spaceAfter=0,
                                fontName='DejaVuSans',
-                               textColor=HexColor('#3F51B5'))) # Azul médio
+                               textColor=secondary))
 
-    # Estilos para o Checklist de Publicação com cores por post e tipo de tarefa
-    # Cores base para os posts
-    POST_COLORS = {
-        1: {"strong": HexColor('#1A237E'), "medium": HexColor('#5C6BC0'), "light": HexColor('#9FA8DA')}, # Azul
-        2: {"strong": HexColor('#2E7D32'), "medium": HexColor('#66BB6A'), "light": HexColor('#A5D6A7')}, # Verde
-        3: {"strong": HexColor('#EF6C00'), "medium": HexColor('#FFA726'), "light": HexColor('#FFCC80')}, # Laranja
-        4: {"strong": HexColor('#4A148C'), "medium": HexColor('#9575CD'), "light": HexColor('#B39DDB')}, # Roxo
-        5: {"strong": HexColor('#B71C1C'), "medium": HexColor('#E57373'), "light": HexColor('#EF9A9A')}  # Vermelho
-    }
+    # Capa (texto branco sobre o fundo colorido)
+    styles.add(ParagraphStyle(name='CoverTitle', parent=styles['TitleStyle'], textColor=HexColor('#FFFFFF'), alignment=1))
+    styles.add(ParagraphStyle(name='CoverSubtitle', parent=styles['SubtitleStyle'], textColor=HexColor('#FFFFFF'), alignment=1))
 
-    # Adicionar estilos para cada tipo de tarefa e post
-    for i in range(1, 6):
+    # Estilos para o Checklist de Publicação com cores por post e tipo de tarefa
+    checklist_colors = palette["checklist"]
+    for i in range(1, MAX_STYLED_POSTS + 1):
+        strong, medium, light = (HexColor(color) for color in checklist_colors[(i - 1) % len(checklist_colors)])
         # Estilo para Postar (cor forte)
         styles.add(ParagraphStyle(name=f'ChecklistPostar_Post{i}',
                                    fontSize=10,
@@ -52,7 +166,7 @@ def get_pdf_styles():
                                    spaceBefore=0,
                                    spaceAfter=0,
                                    fontName='DejaVuSans-Bold',
-                                   textColor=POST_COLORS[i]["strong"]))
+                                   textColor=strong))
         # Estilo para Preparar (cor média)
         styles.add(ParagraphStyle(name=f'ChecklistPreparar_Post{i}',
                                    fontSize=10,
@@ -60,7 +174,7 @@ def get_pdf_styles():
                                    spaceBefore=1,
                                    spaceAfter=1,
                                    fontName='DejaVuSans',
-                                   textColor=POST_COLORS[i]["medium"]))
+                                   textColor=medium))
         # Estilo para Responder (cor clara)
         styles.add(ParagraphStyle(name=f'ChecklistResponder_Post{i}',
                                    fontSize=10,
@@ -68,18 +182,16 @@ def get_pdf_styles():
                                    spaceBefore=1,
                                    spaceAfter=1,
                                    fontName='DejaVuSans-Oblique',
-                                   textColor=POST_COLORS[i]["light"]))
-
+                                   textColor=light))
 
-
-    styles.add(ParagraphStyle(name='SectionTitle', fontSize=22, leading=22, textColor=HexColor('#1A237E'), spaceAfter=12, alignment=TA_LEFT,))
+    styles.add(ParagraphStyle(name='SectionTitle', fontSize=22, leading=22, textColor=primary, spaceAfter=12, alignment=TA_LEFT,))
     # Texto Normal
-    styles.add(ParagraphStyle(name='NormalText', 
-                           fontSize=12, 
-                           leading=14, 
+    styles.add(ParagraphStyle(name='NormalText',
+                           fontSize=12,
+                           leading=14,
                            spaceAfter=0,
                            fontName='DejaVuSans',
-                           textColor=HexColor('#212121'))) # Quase preto
+                           textColor=text))
 
     # Estilo Normal Ajustado
     styles.add(ParagraphStyle(name='NormalAdjusted',
@@ -94,36 +206,44 @@ def get_pdf_styles():
                                fontName='DejaVuSans-Oblique'))
 
     # Hashtags
-    styles.add(ParagraphStyle(name='HashtagStyle', 
-                           fontSize=12, 
-                           leading=14, 
+    styles.add(ParagraphStyle(name='HashtagStyle',
+                           fontSize=12,
+                           leading=14,
                            spaceAfter=0,
                            fontName='DejaVuSans-Bold',
-                           textColor=HexColor('#3F51B5'))) # Azul médio
-    styles.add(ParagraphStyle(name='SummaryTitle', 
-                           fontSize=22, 
-                           leading=20, 
-                           fontName='DejaVuSans-Bold', 
-                           alignment=TA_LEFT, 
+                           textColor=secondary))
+    styles.add(ParagraphStyle(name='SummaryTitle',
+                           fontSize=22,
+                           leading=20,
+                           fontName='DejaVuSans-Bold',
+                           alignment=TA_LEFT,
                            spaceAfter=4,
-                           textColor=HexColor('#212121'))) # Título do Sumário
-    styles.add(ParagraphStyle(name='SummaryText', 
-                           fontSize=12, 
-                           leading=14, 
-                           fontName='DejaVuSans', 
+                           textColor=text)) # Título do Sumário
+    styles.add(ParagraphStyle(name='SummaryText',
+                           fontSize=12,
+                           leading=14,
+                           fontName='DejaVuSans',
                            spaceAfter=4,
-                           textColor=HexColor('#424242'))) # Texto do Sumário
+                           textColor=text_muted)) # Texto do Sumário
     styles.add(ParagraphStyle(name='PostTitle', fontSize=18, bold=True, alignment=TA_CENTER, leading=22))
+
+    # Título de cada post com a sua cor (Post1 a Post10)
+    post_title_colors = palette["post_titles"]
+    for i in range(1, MAX_STYLED_POSTS + 1):
+        styles.add(ParagraphStyle(name=f'PostTitle_Post{i}', parent=styles['PostTitle'],
+                                  textColor=HexColor(post_title_colors[(i - 1) % len(post_title_colors)])))
+    styles.add(ParagraphStyle(name='PostTitle_Default', parent=styles['PostTitle'], textColor=HexColor('#000')))
+
     # Novo estilo para o bloco de post (para ser usado com Table)
     styles.add(ParagraphStyle(name='PostSection',
                             fontSize=11,
                             leading=14,
                             spaceAfter=0,
                             fontName='DejaVuSans',
-                            backColor=HexColor('#F5F5F5'), # Cinza muito claro
+                            backColor=HexColor(palette["post_background"]),
                             borderPadding=10,
                             borderRadius=6,
-                            borderColor=HexColor('#E0E0E0'),
+                            borderColor=HexColor(palette["post_border"]),
                             borderWidth=1))
 
     # Ajuste no PostSubtitle para usar a cor primária
@@ -133,103 +253,120 @@ def get_pdf_styles():
                             fontName='DejaVuSans-Bold',
                             spaceBefore=0,
                             spaceAfter=0,
-                            textColor=HexColor('#1A237E'))) # Azul escuro primário
-    styles.add(ParagraphStyle(name='ColoredPostSubtitle', # Novo estilo para subtítulos coloridos (azul)
-                           fontSize=12, 
-                           leading=16, 
-                           fontName='DejaVuSans-Bold', 
-                           spaceBefore=0, 
+                            textColor=primary))
+    styles.add(ParagraphStyle(name='ColoredPostSubtitle', # Subtítulos coloridos (cor secundária)
+                           fontSize=12,
+                           leading=16,
+                           fontName='DejaVuSans-Bold',
+                           spaceBefore=0,
                            spaceAfter=0,
-                           textColor=HexColor('#3F51B5'))) # Azul médio para subtítulos
-    styles.add(ParagraphStyle(name='NeutralPostSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.HexColor('#616161')))
+                           textColor=secondary))
+    styles.add(ParagraphStyle(name='NeutralPostSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=text_subtle))
     styles.add(ParagraphStyle(name='BlackSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.black))
     styles.add(ParagraphStyle(name='PurpleSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.HexColor('#800080')))
     styles.add(ParagraphStyle(name='StrongPurpleSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.HexColor('#6A0DAD')))
     styles.add(ParagraphStyle(name='DarkGreenSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.HexColor('#006400')))
     styles.add(ParagraphStyle(name='BrownSubtitle', fontName='DejaVuSans-Bold', fontSize=12, leading=12, textColor=colors.HexColor('#A52A2A')))
-    styles.add(ParagraphStyle(name='PostText', 
-                           fontSize=12, 
-                           leading=14, 
-                           fontName='DejaVuSans', 
+    styles.add(ParagraphStyle(name='PostText',
+                           fontSize=12,
+                           leading=14,
+                           fontName='DejaVuSans',
                            spaceAfter=0,
-                           textColor=HexColor('#424242'))) # Texto do Post
-    styles.add(ParagraphStyle(name='PostContent', # Novo estilo para o conteúdo das subsessões
-                           fontSize=12, 
-                           leading=14, 
-                           fontName='DejaVuSans', 
+                           textColor=text_muted)) # Texto do Post
+    styles.add(ParagraphStyle(name='PostContent', # Conteúdo das subsessões
+                           fontSize=12,
+                           leading=14,
+                           fontName='DejaVuSans',
                            spaceAfter=0,
                            leftIndent=12, # Recuo para o conteúdo
-                           textColor=HexColor('#424242'))) 
-    styles.add(ParagraphStyle(name='PostHashtag', 
-                           fontSize=10, 
-                           leading=14, 
+                           textColor=text_muted))
+    styles.add(ParagraphStyle(name='PostHashtag',
+                           fontSize=10,
+                           leading=14,
                            fontName='DejaVuSans-Bold',
-                           textColor=HexColor('#3F51B5'))) # Hashtag do Post
-    styles.add(ParagraphStyle(name='PostFormat', 
-                           fontSize=12, 
-                           leading=14, 
-                           fontName='DejaVuSans-Oblique', 
+                           textColor=secondary)) # Hashtag do Post
+    styles.add(ParagraphStyle(name='PostFormat',
+                           fontSize=12,
+                           leading=14,
+                           fontName='DejaVuSans-Oblique',
                            spaceAfter=0,
-                           textColor=HexColor('#616161'))) # Formato do Post
-    styles.add(ParagraphStyle(name='PostVisuals', 
-                           fontSize=12, 
-                           leading=14, 
-                           fontName='DejaVuSans', 
+                           textColor=text_subtle)) # Formato do Post
+    styles.add(ParagraphStyle(name='PostVisuals',
+                           fontSize=12,
+                           leading=14,
+                           fontName='DejaVuSans',
                            spaceAfter=0,
-                           textColor=HexColor('#424242'))) # Sugestões Visuais do Post
-    styles.add(ParagraphStyle(name='ChecklistTitle', 
-                               fontSize=16, 
-                               leading=20, 
-                               fontName='DejaVuSans-Bold', 
+                           textColor=text_muted)) # Sugestões Visuais do Post
+    styles.add(ParagraphStyle(name='ChecklistTitle',
+                               fontSize=16,
+                               leading=20,
+                               fontName='DejaVuSans-Bold',
                                spaceAfter=10,
-                               textColor=HexColor('#212121'))) # Título do Checklist
-    styles.add(ParagraphStyle(name='ChecklistItem', 
-                               fontSize=12, 
-                               leading=16, 
+                               textColor=text)) # Título do Checklist
+    styles.add(ParagraphStyle(name='ChecklistItem',
+                               fontSize=12,
+                               leading=16,
                                spaceBefore=4,
                                fontName='DejaVuSans',
-                               textColor=HexColor('#212121'))) # Item do Checklist
+                               textColor=text)) # Item do Checklist
     # Estilo para datas no checklist
-    styles.add(ParagraphStyle(name='ChecklistDate', 
-                               fontSize=12, 
-                               leading=16, 
-                               spaceBefore=10, 
+    styles.add(ParagraphStyle(name='ChecklistDate',
+                               fontSize=12,
+                               leading=16,
+                               spaceBefore=10,
                                fontName='DejaVuSans-Bold',
                                textColor=HexColor('#000000'))) # Preto
-    styles.add(ParagraphStyle(name='CalendarTitle', 
-                               fontSize=16, 
-                               leading=20, 
-                               fontName='DejaVuSans-Bold', 
+    styles.add(ParagraphStyle(name='CalendarTitle',
+                               fontSize=16,
+                               leading=20,
+                               fontName='DejaVuSans-Bold',
                                spaceAfter=10,
-                               textColor=HexColor('#212121'))) # Título do Calendário
-    styles.add(ParagraphStyle(name='CalendarHeader', 
-                               fontSize=12, 
-                               leading=16, 
-                               fontName='DejaVuSans-Bold', 
+                               textColor=text)) # Título do Calendário
+    styles.add(ParagraphStyle(name='CalendarHeader',
+                               fontSize=12,
+                               leading=16,
+                               fontName='DejaVuSans-Bold',
                                spaceAfter=6,
-                               textColor=HexColor('#424242'))) # Cabeçalho do Calendário
-    styles.add(ParagraphStyle(name='CalendarEntry', 
-                               fontSize=12, 
-                               leading=14, 
-                               fontName='DejaVuSans', 
+                               textColor=text_muted)) # Cabeçalho do Calendário
+    styles.add(ParagraphStyle(name='CalendarEntry',
+                               fontSize=12,
+                               leading=14,
+                               fontName='DejaVuSans',
                                spaceAfter=4,
-                               textColor=HexColor('#424242'))) # Entrada do Calendário
-    
+                               textColor=text_muted)) # Entrada do Calendário
+
     # Para tables
-    styles.add(ParagraphStyle(name='TableHeader', fontSize=12, bold=True, alignment=TA_CENTER, textColor=HexColor('#FFFFFF'), backColor=HexColor('#1A237E')))
+    styles.add(ParagraphStyle(name='TableHeader', fontSize=12, bold=True, alignment=TA_CENTER, textColor=HexColor('#FFFFFF'), backColor=primary))
     styles.add(ParagraphStyle(name='TableCell', fontSize=12, alignment=TA_CENTER, textColor=HexColor('#000000')))
-    
+
     # Para charts (titles)
-    styles.add(ParagraphStyle(name='ChartTitle', fontSize=14, bold=True, alignment=TA_CENTER, spaceAfter=10, textColor=HexColor('#3F51B5')))
+    styles.add(ParagraphStyle(name='ChartTitle', fontSize=14, bold=True, alignment=TA_CENTER, spaceAfter=10, textColor=secondary))
 
+    gradient_row_style = get_table_style_for_gradient_row(palette["table_background"])
     styles.add(ParagraphStyle(name='TableGradientStyle', parent=styles['Normal']))
-    styles['TableGradientStyle']._table_style = get_table_style_for_gradient_row()
-    
-    return styles
+    styles['TableGradientStyle']._table_style = gradient_row_style
+
+    table_styles = {
+        "gradient_row": gradient_row_style,
+        # Bloco de cada post: fundo da tabela + cantos arredondados e espaçamento interno
+        "post_section": TableStyle(list(gradient_row_style.getCommands()) + [
+            ('ROUNDEDCORNERS', (0, 0), (-1, -1), [10, 10, 10, 10]),  # Cantos arredondados
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+    }
+
+    # Inclui os apelidos do ReportLab (ex: 'h1', 'h2') junto com os nomes dos estilos
+    return PdfStyleRegistry({**styles.byAlias, **styles.byName}, theme, palette, table_styles)
+
 
-def get_table_style_for_gradient_row():
-    from reportlab.platypus import TableStyle
-    from reportlab.lib.colors import HexColor
+@lru_cache(maxsize=None)
+def get_table_style_for_gradient_row(background: str = '#E8EAF6') -> TableStyle:
+    """Estilo de tabela com uma única cor de fundo (compartilhado; não modificar)."""
     return TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#E8EAF6')),  # Single color for entire table
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(background)),  # Single color for entire table
     ])
@@ -3,7 +3,7 @@ import json
 from datetime import datetime
 from src.config import BASE_DIR
 
-def log_prompt(client_name: str, prompt: str, log_type: str = "content_generation"):
+def log_prompt(client_name: str, prompt: str, log_type: str = "content_generation", log_dir: str = None):
     """
     Salva o prompt utilizado em um arquivo de log para depuração.
 
@@ -11,8 +11,9 @@ def log_prompt(client_name: str, prompt: str, log_type: str = "content_generatio
         client_name (str): Nome do cliente para identificar o log.
         prompt (str): O prompt completo enviado para a IA.
         log_type (str): Tipo de log (ex: "content_generation", "image_prompt").
+        log_dir (str, optional): Diretório dos logs. Padrão: output_files/logs_para_IA.
     """
-    log_dir = os.path.join(BASE_DIR, "output_files", "logs_para_IA")
+    log_dir = log_dir or os.path.join(BASE_DIR, "output_files", "logs_para_IA")
     os.makedirs(log_dir, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2,7 +2,7 @@ import json
 from .campaign_narrative_generator import generate_campaign_narrative
 from ...metric_suggester import suggest_metrics
 
-def build_prompt(client_profile: dict, niche_guidelines: dict, content_type: str, weekly_themes: list[str], weekly_goal: str, campaign_type: str, strategic_analysis: dict = None) -> str:
+def build_prompt(client_profile: dict, niche_guidelines: dict, content_type: str, weekly_themes: list[str], weekly_goal: str, campaign_type: str, strategic_analysis: dict = None, reused_sections: dict = None) -> str:
     """
     Constrói o prompt completo para a API do Gemini, combinando o perfil do cliente, diretrizes de nicho, contexto semanal e instruções de formato.
 
@@ -14,6 +14,8 @@ def build_prompt(client_profile: dict, niche_guidelines: dict, content_type: str
         weekly_goal (str): O objetivo principal do conteúdo para a semana.
             campaign_type (str): O tipo de campanha (ex: 'autoridade').
             strategic_analysis (dict): O resultado da análise estratégica do briefing.
+            reused_sections (dict): Seções reaproveitadas de uma execução anterior com o mesmo briefing
+                                    (ex: future_strategy, market_references); não são pedidas à IA.
 
     Returns:
         str: O prompt completo formatado para a API do Gemini.
@@ -145,11 +147,16 @@ def build_prompt(client_profile: dict, niche_guidelines: dict, content_type: str
     user_message_parts.append("- `ab_test_suggestions`: Uma string para cada post, sugirindo 1-2 testes A/B com formato: 'Elemento a testar (ex: título) → Variação A vs Variação B → Métrica de sucesso'.")
     user_message_parts.append("- `indicador_principal`: A métrica mais importante para este post.")
     user_message_parts.append("- `optimization_triggers`: Retorne uma string com base no `indicador_principal`, defina: 1) Threshold de alerta , 2) Ação corretiva, 3) Threshold de sucesso.")
+    reused_sections = reused_sections or {}
+    if reused_sections:
+        user_message_parts.append(f"- As seções {', '.join(reused_sections)} já foram definidas para este cliente e não devem ser incluídas no JSON.")
     user_message_parts.append("\n Gere **APENAS UM JSON VÁLIDO**, sem texto adicional, comentários ou explicações. Não inclua marcações de code block (como ```json). Retorne o conteúdo em formato JSON, com a estrutura abaixo:")
     user_message_parts.append("{{")
     user_message_parts.append("    \"weekly_strategy_summary\": \"Resumo da estratégia semanal para a campanha.\",")
-    user_message_parts.append("    \"future_strategy\": {\"proximos_passos\": \"Sugestões gerais para depois da campanha.\", \"posts_nutricao\": [{\"tema\": \"Tema do post de nutrição\", \"formato\": \"Formato do post (ex: Carrossel, Vídeo)\", \"objetivo\": \"Objetivo do post de nutrição\"}], \"remarketing\": [{\"estrategia\": \"Estratégia de remarketing\", \"canal\": \"Canal de remarketing (ex: Email, Anúncios)\"}], \"long_term\": {\"comunidade\": \"Estratégias para comunidade\", \"parcerias\": \"Estratégias de parcerias\"}}, ")
-    user_message_parts.append("    \"market_references\": \"Uma lista de 3 objetos JSON, cada um contendo: 'Nome/Handle' (string), 'Diferenciais' (string), 'Oportunidades' (string), 'Posicionamento do Cliente' (string). Exemplo: [{'Nome/Handle': 'PerfilExemplo', 'Diferenciais': 'Conteúdo visual de alta qualidade', 'Oportunidades': 'Maior engajamento em postagens diárias', 'Posicionamento do Cliente': 'Enfatizar expertise técnica'}].\",")
+    if "future_strategy" not in reused_sections:
+        user_message_parts.append("    \"future_strategy\": {\"proximos_passos\": \"Sugestões gerais para depois da campanha.\", \"posts_nutricao\": [{\"tema\": \"Tema do post de nutrição\", \"formato\": \"Formato do post (ex: Carrossel, Vídeo)\", \"objetivo\": \"Objetivo do post de nutrição\"}], \"remarketing\": [{\"estrategia\": \"Estratégia de remarketing\", \"canal\": \"Canal de remarketing (ex: Email, Anúncios)\"}], \"long_term\": {\"comunidade\": \"Estratégias para comunidade\", \"parcerias\": \"Estratégias de parcerias\"}}, ")
+    if "market_references" not in reused_sections:
+        user_message_parts.append("    \"market_references\": \"Uma lista de 3 objetos JSON, cada um contendo: 'Nome/Handle' (string), 'Diferenciais' (string), 'Oportunidades' (string), 'Posicionamento do Cliente' (string). Exemplo: [{'Nome/Handle': 'PerfilExemplo', 'Diferenciais': 'Conteúdo visual de alta qualidade', 'Oportunidades': 'Maior engajamento em postagens diárias', 'Posicionamento do Cliente': 'Enfatizar expertise técnica'}].\",")
     user_message_parts.append("    \"posts\": [")
     user_message_parts.append("        {{")
     user_message_parts.append("            \"titulo\": \"Título do Post 1\",")
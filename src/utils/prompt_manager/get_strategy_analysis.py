@@ -0,0 +1,54 @@
+import hashlib
+import json
+
+from src.data_storage import get_client_profile, save_client_strategy
+from .analyze_briefing_for_strategy import analyze_briefing_for_strategy
+
+# Versão do formato do bloco de estratégia; incremente ao mudar `analyze_briefing_for_strategy`
+STRATEGY_ANALYSIS_VERSION = 1
+
+# Campos do briefing lidos pela análise estratégica (os demais não invalidam o bloco salvo)
+STRATEGY_CLIENT_FIELDS = (
+    "subnicho", "informacoes_adicionais", "analise_swot", "publico_alvo_detalhado",
+    "objetivos_de_marketing", "topicos_principais", "palavras_chave", "chamada_para_acao",
+    "restricoes_e_diretrizes", "referencias_de_estilo_e_formato",
+)
+STRATEGY_NICHE_FIELDS = ("analise_de_concorrentes_referencias",)
+
+
+def strategy_fingerprint(client_profile: dict, niche_guidelines: dict) -> str:
+    """Hash dos campos do briefing que alimentam a análise estratégica."""
+    inputs = {
+        "client": {field: client_profile.get(field) for field in STRATEGY_CLIENT_FIELDS},
+        "niche": {field: (niche_guidelines or {}).get(field) for field in STRATEGY_NICHE_FIELDS},
+    }
+    canonical = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_strategy_analysis(client_name: str, client_profile: dict, niche_guidelines: dict) -> dict:
+    """
+    Retorna a análise estratégica do cliente, usando o bloco pré-calculado salvo em `client_profiles`.
+
+    O bloco só é recalculado (e regravado) quando a versão da análise ou algum dos campos
+    relevantes do briefing mudou; caso contrário, nenhuma escrita é feita no banco.
+
+    Args:
+        client_name (str): Nome do cliente (chave em `client_profiles`).
+        client_profile (dict): Dados do cliente vindos do briefing.
+        niche_guidelines (dict): Diretrizes do nicho vindas do briefing.
+
+    Returns:
+        dict: As informações estratégicas (mesmo formato de `analyze_briefing_for_strategy`).
+    """
+    fingerprint = strategy_fingerprint(client_profile, niche_guidelines)
+    stored = get_client_profile(client_name) if client_name else None
+    if (stored and stored.get("strategy_block") is not None
+            and stored.get("strategy_version") == STRATEGY_ANALYSIS_VERSION
+            and stored.get("strategy_fingerprint") == fingerprint):
+        return stored["strategy_block"]
+
+    strategy_block = analyze_briefing_for_strategy(client_profile, niche_guidelines)
+    if stored:
+        save_client_strategy(client_name, strategy_block, STRATEGY_ANALYSIS_VERSION, fingerprint)
+    return strategy_block
@@ -0,0 +1,3 @@
+from .tracer import Span, trace_span, traced, get_current_span, current_traceparent, inject_trace_context, record_first_token, parse_traceparent, TRACEPARENT_ENV
+from .span_exporters import TRACE_EXPORTER_ENV, TRACE_FILE_ENV, tracing_enabled, span_to_otlp, export_span
+from .trace_report import load_spans, summarize_traces
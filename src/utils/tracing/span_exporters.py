@@ -0,0 +1,125 @@
+"""
+Exportação dos spans no formato OTLP/JSON do OpenTelemetry.
+
+O exportador é escolhido pela variável TRACE_EXPORTER (herdada pelas etapas do pipeline e
+pelos processos de renderização):
+
+    (vazia)        tracing desligado (padrão); os spans não são nem criados
+    file           cada span é acrescentado ao arquivo TRACE_FILE (padrão:
+                   output_files/traces/spans.jsonl), uma requisição OTLP/JSON por linha,
+                   no formato lido pelo receptor de arquivos do OpenTelemetry Collector
+    console        uma linha por span e, ao fim do processo, o resumo por etapa
+    console,file   os dois
+"""
+
+import atexit
+import json
+import os
+import threading
+
+from src.config import BASE_DIR
+
+TRACE_EXPORTER_ENV = "TRACE_EXPORTER"
+TRACE_FILE_ENV = "TRACE_FILE"
+DEFAULT_TRACE_FILE = os.path.join(BASE_DIR, "output_files", "traces", "spans.jsonl")
+SERVICE_NAME = "1flux"
+
+# Códigos de status do OTLP
+STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+_file_lock = threading.Lock()
+_console_spans = []
+_console_summary_registered = False
+
+
+def get_trace_exporters() -> set:
+    """Exportadores ativos ("file" e/ou "console") segundo a variável TRACE_EXPORTER."""
+    value = os.getenv(TRACE_EXPORTER_ENV, "")
+    return {item.strip().lower() for item in value.split(",") if item.strip().lower() in ("file", "console")}
+
+
+def tracing_enabled() -> bool:
+    return bool(get_trace_exporters())
+
+
+def get_trace_file() -> str:
+    return os.getenv(TRACE_FILE_ENV) or DEFAULT_TRACE_FILE
+
+
+def _attribute(key: str, value) -> dict:
+    """Atributo no formato OTLP/JSON (inteiros são strings, como no protobuf JSON)."""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def span_to_otlp(span) -> dict:
+    """Converte um span em uma requisição OTLP/JSON (resourceSpans -> scopeSpans -> spans)."""
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items() if value is not None],
+        "events": [
+            {"name": name, "timeUnixNano": str(time_ns), "attributes": [_attribute(key, value) for key, value in attributes.items()]}
+            for name, time_ns, attributes in span.events
+        ],
+        "status": {"code": STATUS_CODES[span.status], **({"message": span.status_message} if span.status_message else {})},
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", SERVICE_NAME), _attribute("process.pid", os.getpid())]},
+            "scopeSpans": [{"scope": {"name": "src.utils.tracing"}, "spans": [otlp_span]}],
+        }]
+    }
+
+
+def _print_console_summary():
+    """Resumo por etapa dos spans encerrados neste processo (tempo total, quantidade e máximo)."""
+    if not _console_spans:
+        return
+    totals = {}
+    for name, duration in _console_spans:
+        count, total, longest = totals.get(name, (0, 0.0, 0.0))
+        totals[name] = (count + 1, total + duration, max(longest, duration))
+
+    print(f"\n--- Tempo por etapa (processo {os.getpid()}) ---")
+    for name, (count, total, longest) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True):
+        print(f"{name:<24} {total:9.3f}s total | {count:>4}x | máx {longest:8.3f}s")
+
+
+def export_span(span):
+    """Envia um span encerrado aos exportadores ativos (erros de exportação nunca interrompem o pipeline)."""
+    global _console_summary_registered
+    exporters = get_trace_exporters()
+
+    if "file" in exporters:
+        try:
+            line = json.dumps(span_to_otlp(span), ensure_ascii=False, separators=(",", ":"))
+            trace_file = get_trace_file()
+            with _file_lock:
+                os.makedirs(os.path.dirname(trace_file), exist_ok=True)
+                with open(trace_file, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Aviso: não foi possível exportar o span '{span.name}': {e}")
+
+    if "console" in exporters:
+        status = " ERRO" if span.status == "error" else ""
+        # Uma única escrita por linha: processos de renderização dividem o mesmo terminal.
+        print(f"[trace] {span.name:<24} {span.duration_seconds:9.3f}s{status}\n", end="", flush=True)
+        with _file_lock:
+            _console_spans.append((span.name, span.duration_seconds))
+            if not _console_summary_registered:
+                atexit.register(_print_console_summary)
+                _console_summary_registered = True
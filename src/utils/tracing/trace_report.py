@@ -0,0 +1,110 @@
+import json
+import os
+import statistics
+
+from src.utils.tracing.span_exporters import get_trace_file
+
+# Spans que agrupam outros (não entram na soma "por etapa" para não contar o mesmo tempo duas vezes)
+ROOT_SPAN_NAMES = ("pipeline", "pipeline.script", "pipeline.stage")
+
+
+def _attribute_value(value: dict):
+    for kind in ("stringValue", "boolValue", "doubleValue"):
+        if kind in value:
+            return value[kind]
+    if "intValue" in value:
+        return int(value["intValue"])
+    return None
+
+
+def load_spans(trace_file: str = None) -> list:
+    """
+    Lê os spans exportados em OTLP/JSON (uma requisição por linha).
+
+    Returns:
+        list: Spans simplificados: {"trace_id", "span_id", "parent_span_id", "name", "start_ns",
+              "end_ns", "duration_seconds", "status", "attributes"}.
+    """
+    trace_file = trace_file or get_trace_file()
+    if not os.path.exists(trace_file):
+        return []
+
+    spans = []
+    with open(trace_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Aviso: linha inválida ignorada em {trace_file}.")
+                continue
+            for resource_spans in request.get("resourceSpans", []):
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    for span in scope_spans.get("spans", []):
+                        start_ns, end_ns = int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"])
+                        spans.append({
+                            "trace_id": span["traceId"],
+                            "span_id": span["spanId"],
+                            "parent_span_id": span.get("parentSpanId"),
+                            "name": span["name"],
+                            "start_ns": start_ns,
+                            "end_ns": end_ns,
+                            "duration_seconds": (end_ns - start_ns) / 1e9,
+                            "status": span.get("status", {}).get("code", 0),
+                            "attributes": {item["key"]: _attribute_value(item["value"]) for item in span.get("attributes", [])},
+                        })
+    return spans
+
+
+def summarize_traces(spans: list) -> dict:
+    """
+    Resume onde o tempo de cada execução (trace) foi gasto.
+
+    Args:
+        spans (list): Retorno de `load_spans`.
+
+    Returns:
+        dict: {"traces": [{"trace_id", "client_name", "started_at_ns", "elapsed_seconds", "errors",
+                           "stages": {etapa: segundos}, "slowest_stage"}] (do mais antigo ao mais recente),
+               "stages": {etapa: {"count", "total_seconds", "median_seconds", "p95_seconds"}}}.
+    """
+    by_trace = {}
+    for span in spans:
+        by_trace.setdefault(span["trace_id"], []).append(span)
+
+    traces = []
+    for trace_id, trace_spans in by_trace.items():
+        stages = {}
+        for span in trace_spans:
+            if span["name"] not in ROOT_SPAN_NAMES:
+                stages[span["name"]] = stages.get(span["name"], 0.0) + span["duration_seconds"]
+        client_name = next((span["attributes"]["client.name"] for span in trace_spans if span["attributes"].get("client.name")), None)
+        started_at = min(span["start_ns"] for span in trace_spans)
+        traces.append({
+            "trace_id": trace_id,
+            "client_name": client_name,
+            "started_at_ns": started_at,
+            "elapsed_seconds": round((max(span["end_ns"] for span in trace_spans) - started_at) / 1e9, 3),
+            "errors": sum(1 for span in trace_spans if span["status"] == 2),
+            "stages": {name: round(seconds, 3) for name, seconds in sorted(stages.items(), key=lambda item: item[1], reverse=True)},
+            "slowest_stage": max(stages, key=stages.get) if stages else None,
+        })
+    traces.sort(key=lambda trace: trace["started_at_ns"])
+
+    durations = {}
+    for span in spans:
+        if span["name"] not in ROOT_SPAN_NAMES:
+            durations.setdefault(span["name"], []).append(span["duration_seconds"])
+    stage_summary = {}
+    for name, values in sorted(durations.items(), key=lambda item: sum(item[1]), reverse=True):
+        ordered = sorted(values)
+        stage_summary[name] = {
+            "count": len(values),
+            "total_seconds": round(sum(values), 3),
+            "median_seconds": round(statistics.median(values), 4),
+            "p95_seconds": round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 4),
+        }
+
+    return {"traces": traces, "stages": stage_summary}
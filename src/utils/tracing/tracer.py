@@ -0,0 +1,192 @@
+"""
+Spans compatíveis com o OpenTelemetry para medir o tempo de cada etapa do pipeline.
+
+O contexto do trace segue o padrão W3C `traceparent`: o span atual é guardado em uma
+`ContextVar` (threads e o event loop compartilhado herdam o contexto de quem chamou) e é
+repassado às etapas em subprocessos pela variável de ambiente TRACEPARENT, de modo que todas
+as etapas de uma execução ficam no mesmo trace. Com o tracing desligado (TRACE_EXPORTER
+vazia), `trace_span` não cria spans.
+"""
+
+import contextvars
+import inspect
+import os
+import re
+import secrets
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from src.utils.tracing.span_exporters import export_span, tracing_enabled
+
+TRACEPARENT_ENV = "TRACEPARENT"
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """Um intervalo medido: nome, identificadores do trace, atributos, eventos e status."""
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: str = None, attributes: dict = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes or {})
+        self.events = []
+        self.status = "unset"
+        self.status_message = None
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self._started_at = time.perf_counter_ns()
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_seconds(self) -> float:
+        end = self.end_time_ns if self.end_time_ns is not None else self.start_time_ns + time.perf_counter_ns() - self._started_at
+        return (end - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes):
+        self.events.append((name, self.start_time_ns + time.perf_counter_ns() - self._started_at, attributes))
+
+    def has_event(self, name: str) -> bool:
+        return any(event[0] == name for event in self.events)
+
+    def set_error(self, message: str):
+        self.status = "error"
+        self.status_message = message
+
+    def end(self):
+        # A duração vem do relógio monotônico; o horário de início, do relógio de parede.
+        self.end_time_ns = self.start_time_ns + time.perf_counter_ns() - self._started_at
+
+
+class _NoopSpan:
+    """Span usado com o tracing desligado: aceita as mesmas chamadas e não registra nada."""
+    traceparent = None
+    duration_seconds = 0.0
+
+    def set_attribute(self, key, value):
+        pass
+
+    def add_event(self, name, **attributes):
+        pass
+
+    def has_event(self, name):
+        return False
+
+    def set_error(self, message):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def parse_traceparent(value: str):
+    """Retorna (trace_id, span_id) de um cabeçalho `traceparent` válido, ou None."""
+    match = _TRACEPARENT_PATTERN.match((value or "").strip().lower())
+    return (match.group(1), match.group(2)) if match else None
+
+
+def _parent_context(parent) -> tuple:
+    """(trace_id, span_id do pai): do pai informado, do span atual ou da variável TRACEPARENT."""
+    if isinstance(parent, Span):
+        return parent.trace_id, parent.span_id
+    if isinstance(parent, str):
+        return parse_traceparent(parent) or (None, None)
+    current = _current_span.get()
+    if current is not None:
+        return current.trace_id, current.span_id
+    return parse_traceparent(os.getenv(TRACEPARENT_ENV)) or (None, None)
+
+
+@contextmanager
+def trace_span(name: str, parent=None, **attributes):
+    """
+    Mede um trecho do pipeline como um span (filho do span atual).
+
+    Exceções marcam o span com erro e são propagadas.
+
+    Args:
+        name (str): Nome da etapa (ex: "llm.call", "render.pdf").
+        parent (Span | str): Pai explícito (span ou `traceparent`), ex: em outro processo.
+        **attributes: Atributos do span (ex: provider="gemini").
+
+    Yields:
+        Span: O span aberto (ou um span vazio se o tracing estiver desligado).
+    """
+    if not tracing_enabled():
+        yield NOOP_SPAN
+        return
+
+    trace_id, parent_span_id = _parent_context(parent)
+    span = Span(name, trace_id or secrets.token_hex(16), parent_span_id, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_error(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+        export_span(span)
+
+
+def traced(name: str, **attributes):
+    """Decorador que mede cada chamada da função (síncrona ou assíncrona) como um span."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_current_span():
+    """O span aberto no contexto atual (ou um span vazio)."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def current_traceparent() -> str:
+    """`traceparent` do span atual (ou o herdado pela variável TRACEPARENT), para repassar a outro processo."""
+    current = _current_span.get()
+    return current.traceparent if current is not None else os.getenv(TRACEPARENT_ENV)
+
+
+def inject_trace_context(env: dict) -> dict:
+    """Acrescenta o TRACEPARENT do span atual ao ambiente de um subprocesso."""
+    traceparent = current_traceparent()
+    if traceparent:
+        env = dict(env, **{TRACEPARENT_ENV: traceparent})
+    return env
+
+
+def record_first_token():
+    """
+    Marca a chegada do primeiro token no span atual (evento "first_token" e atributo
+    `llm.time_to_first_token_seconds`). Só a primeira marcação de cada span vale.
+
+    Para clientes com streaming, chamada ao receber o primeiro trecho da resposta; sem
+    streaming não há primeiro token distinto da resposta completa, e o atributo não é criado.
+    """
+    span = _current_span.get()
+    if span is None or span.has_event("first_token"):
+        return
+    span.add_event("first_token")
+    span.set_attribute("llm.time_to_first_token_seconds", round(span.duration_seconds, 4))
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+import src.utils.data_storage as data_storage
+from src.llm_client.circuit_breaker import HALF_OPEN, OPEN, OPEN_SECONDS, circuit_breaker, get_circuit_state
+from src.utils.data_storage import claim_provider_circuit_probe, init_db, save_provider_circuit
+
+PROVIDER = "teste_cancelamento"
+
+
+def _use_temporary_database(path: str):
+    """Aponta todos os módulos de data_storage para um banco temporário (o db.sqlite real não é tocado)."""
+    for name, module in list(sys.modules.items()):
+        if name.startswith(data_storage.__name__) and hasattr(module, "DATABASE_PATH"):
+            module.DATABASE_PATH = path
+
+
+def test_cancelled_probe_reopens_circuit():
+    """Uma chamada de teste (half-open) cancelada devolve o circuito ao estado aberto."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _use_temporary_database(os.path.join(tmp_dir, "db.sqlite"))
+        init_db()
+
+        opened_at = time.time() - OPEN_SECONDS - 1
+        save_provider_circuit(PROVIDER, OPEN, 3, opened_at)
+
+        started = asyncio.Event()
+
+        @circuit_breaker(PROVIDER)
+        async def slow_call():
+            started.set()
+            await asyncio.sleep(60)
+            return {"status": "success"}
+
+        async def cancel_probe():
+            task = asyncio.create_task(slow_call())
+            await started.wait()
+            assert get_circuit_state(PROVIDER)["state"] == HALF_OPEN
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        asyncio.run(cancel_probe())
+
+        circuit = get_circuit_state(PROVIDER)
+        assert circuit["state"] == OPEN, circuit
+        assert circuit["consecutive_failures"] == 3, circuit
+        assert circuit["opened_at"] == opened_at, circuit
+        # O próximo teste pode ser reservado imediatamente, sem esperar a reserva expirar
+        assert claim_provider_circuit_probe(PROVIDER, OPEN_SECONDS)
+
+
+if __name__ == "__main__":
+    test_cancelled_probe_reopens_circuit()
+    print("OK: chamada de teste cancelada não deixa o circuito em half_open.")
@@ -0,0 +1,44 @@
+import argparse
+from datetime import datetime
+
+from src.utils.tracing import load_spans, summarize_traces
+from src.utils.tracing.span_exporters import get_trace_file
+
+
+def main():
+    """
+    Mostra onde o tempo de cada execução do pipeline foi gasto, a partir dos spans exportados.
+
+    Rode o pipeline com TRACE_EXPORTER=file (ou console,file) para gerar os spans em
+    output_files/traces/spans.jsonl (formato OTLP/JSON, também aceito pelo OpenTelemetry Collector).
+    """
+    parser = argparse.ArgumentParser(description="Resumo do tempo por etapa do pipeline (tracing).")
+    parser.add_argument("--file", default=None, help="Arquivo de spans (padrão: output_files/traces/spans.jsonl).")
+    parser.add_argument("--last", type=int, default=10, help="Quantidade de execuções mais recentes listadas (padrão: 10).")
+    args = parser.parse_args()
+
+    trace_file = args.file or get_trace_file()
+    spans = load_spans(trace_file)
+    if not spans:
+        print(f"Nenhum span em {trace_file}. Rode o pipeline com TRACE_EXPORTER=file.")
+        return
+
+    summary = summarize_traces(spans)
+
+    print(f"--- Execuções mais recentes ({min(args.last, len(summary['traces']))} de {len(summary['traces'])}) ---")
+    for trace in summary["traces"][-args.last:]:
+        started_at = datetime.fromtimestamp(trace["started_at_ns"] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+        errors = f" | {trace['errors']} erro(s)" if trace["errors"] else ""
+        print(f"\n{started_at} | {trace['client_name'] or 'cliente desconhecido'} | {trace['elapsed_seconds']:.1f}s{errors}")
+        for name, seconds in trace["stages"].items():
+            share = seconds / trace["elapsed_seconds"] if trace["elapsed_seconds"] else 0
+            print(f"    {name:<24} {seconds:9.3f}s ({share:.0%})")
+
+    print("\n--- Todas as execuções, por etapa ---")
+    for name, stage in summary["stages"].items():
+        print(f"{name:<24} {stage['count']:>5}x | total {stage['total_seconds']:9.3f}s | mediana {stage['median_seconds']:8.4f}s | "
+              f"p95 {stage['p95_seconds']:8.4f}s")
+
+
+if __name__ == "__main__":
+    main()